@@ -109,7 +109,8 @@ def delete_session_by_session_id(session_id: str = Depends(get_current_user)):
     return response
 
 @account_router.post("/departure")
-async def departure(request: Request, session_id: str | None = Cookie(None)):
+def departure(request: Request, session_id: str | None = Cookie(None)):
+    # 동기 Redis/DB 조회와 Google token revoke 요청이 있어 일반 함수로 두고 스레드풀에서 실행
     logger.debug("Departure called")
     logger.debug("Request headers: %s", request.headers)
 
@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 from dotenv import load_dotenv
@@ -11,7 +12,9 @@ load_dotenv()
 from product.adapter.input.web.product_data_router.product_data_router import product_data_router
 from account.adapter.input.web.account_router import account_router
 from config.database.session import Base, engine
+from config.redis_config import get_async_redis
 from documents_multi_agents.adapter.input.web.document_multi_agent_router import documents_multi_agents_router
+from documents_multi_agents.domain.service.ie_rule_index import IERuleIndex
 from ecos.adapter.input.web.ecos_data_router.ecos_data_router import ecos_data_router
 from ieinfo.adapter.input.web.ie_info_router import ie_info_router
 from kftc.adapter.input.web.kftc_router import kftc_router
@@ -24,6 +27,10 @@ from today_briefing.adapter.output.web.briefing_router import today_briefing_rou
 from news_info.adapter.input.web.news_info_router import news_info_router
 from community.adapter.input.web.community_router import community_router
 from jobs import scheduler as jobs_scheduler
+from jobs.ie_save_scheduler import IESaveScheduler
+from jobs.job_queue import JobQueue
+from util.llm.llm_gateway import LLMGateway
+from util.pdf.pdf_extractor import PdfExtractor
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -35,10 +42,17 @@ app = FastAPI()
 async def on_startup():
     # .env가 이미 로드되어 있다고 가정
     jobs_scheduler.start_scheduler()
+    JobQueue.get_instance().start()
+    await asyncio.to_thread(IERuleIndex.get_instance().load)  # IE_RULE 키워드 색인
 
 @app.on_event("shutdown")
 async def on_shutdown():
     jobs_scheduler.stop_scheduler()
+    await JobQueue.get_instance().stop()
+    await IESaveScheduler.get_instance().flush()  # 대기 중인 DB 저장 실행
+    await LLMGateway.get_instance().aclose()
+    await get_async_redis().aclose()
+    PdfExtractor.get_instance().shutdown()
 
 origins = [
     CORS_ALLOWED_FRONTEND_URL,  # Next.js 프론트 엔드 URL
@@ -78,6 +92,7 @@ if __name__ == "__main__":
     from ieinfo.infrastructure.orm.ie_info import IEType
     from asset_allocation.infrastructure.orm.analyze_history import AnalyzeHistory  # 🔥 추가
     from sqlalchemy import select
+    from init_ie_rules import INITIAL_KEYWORD_CATEGORIES
     
     host = os.getenv("APP_HOST")
     port = int(os.getenv("APP_PORT"))
@@ -86,10 +101,28 @@ if __name__ == "__main__":
     backup_rules = []
     try:
         with engine.connect() as conn:
-            # IE_RULE 테이블이 존재하면 데이터 백업
-            result = conn.execute(select(IERule))
+            # IE_RULE 테이블이 존재하면 데이터 백업 (이전 스키마는 있는 컬럼만)
+            backup_columns = [
+                (IERule.keyword, IERule.ie_type, IERule.category, IERule.sub_category, IERule.priority),
+                (IERule.keyword, IERule.ie_type, IERule.category),
+                (IERule.keyword, IERule.ie_type),
+            ]
+            for columns in backup_columns:
+                try:
+                    result = conn.execute(select(*columns)).all()
+                    break
+                except Exception:
+                    if columns is backup_columns[-1]:
+                        raise
+                    conn.rollback()
             backup_rules = [
-                {'keyword': row.keyword, 'ie_type': row.ie_type}
+                {
+                    'keyword': row.keyword,
+                    'ie_type': row.ie_type,
+                    'category': getattr(row, 'category', None),
+                    'sub_category': getattr(row, 'sub_category', None),
+                    'priority': getattr(row, 'priority', None) or 0
+                }
                 for row in result
             ]
             print(f"📦 IE_RULE 백업: {len(backup_rules)}개 규칙")
@@ -108,9 +141,13 @@ if __name__ == "__main__":
         # 백업 데이터가 있으면 복구
         try:
             for rule_data in backup_rules:
+                initial_category, initial_sub_category = INITIAL_KEYWORD_CATEGORIES.get(rule_data['keyword'], (None, None))
                 new_rule = IERule(
                     keyword=rule_data['keyword'],
-                    ie_type=rule_data['ie_type']
+                    ie_type=rule_data['ie_type'],
+                    category=rule_data['category'] or initial_category,
+                    sub_category=rule_data['sub_category'] or initial_sub_category,
+                    priority=rule_data['priority']
                 )
                 session.add(new_rule)
             
@@ -142,12 +179,14 @@ if __name__ == "__main__":
         try:
             # 소득 키워드 삽입
             for keyword in INITIAL_INCOME_KEYWORDS:
-                rule = IERule(keyword=keyword, ie_type=IEType.INCOME)
+                category, sub_category = INITIAL_KEYWORD_CATEGORIES.get(keyword, (None, None))
+                rule = IERule(keyword=keyword, ie_type=IEType.INCOME, category=category, sub_category=sub_category)
                 session.add(rule)
             
             # 지출 키워드 삽입
             for keyword in INITIAL_EXPENSE_KEYWORDS:
-                rule = IERule(keyword=keyword, ie_type=IEType.EXPENSE)
+                category, sub_category = INITIAL_KEYWORD_CATEGORIES.get(keyword, (None, None))
+                rule = IERule(keyword=keyword, ie_type=IEType.EXPENSE, category=category, sub_category=sub_category)
                 session.add(rule)
             
             session.commit()
@@ -0,0 +1,86 @@
+"""
+세션 필드 암호화 마이크로 벤치마크
+필드 단위(enc_data/dec_data)와 일괄 처리(enc_many/dec_many) 처리량 비교
+
+실행: python -m benchmarks.crypto_benchmark [--sessions 2000] [--fields 40]
+"""
+
+import argparse
+import random
+import time
+
+from config.crypto import Crypto
+
+# 급여명세서 한 장 분량의 항목 (세션 해시 필드 = "문서타입:항목명" → 금액)
+PAYSLIP_INCOME_FIELDS = [
+    "기본급", "연장근로수당", "야간근로수당", "휴일근로수당", "직책수당", "식대",
+    "차량유지비", "가족수당", "상여금", "성과급", "연차수당", "자격수당",
+]
+PAYSLIP_EXPENSE_FIELDS = [
+    "국민연금", "건강보험", "장기요양보험", "고용보험", "소득세", "지방소득세",
+    "노조회비", "사우회비", "식대공제", "기숙사비", "대출상환", "연말정산추가납부",
+]
+
+
+def build_session(field_count: int) -> dict:
+    """평문 세션 {"문서타입:항목명": 금액}"""
+    fields = {}
+    names = [("소득", name) for name in PAYSLIP_INCOME_FIELDS] + [("지출", name) for name in PAYSLIP_EXPENSE_FIELDS]
+    for i in range(field_count):
+        doc_type, name = names[i % len(names)]
+        suffix = f"_{i // len(names)}" if i >= len(names) else ""
+        fields[f"{doc_type}:{name}{suffix}"] = f"{random.randint(10, 5_000) * 1000:,}원"
+    return fields
+
+
+def _flatten(session: dict) -> list:
+    flat = []
+    for field_name, value in session.items():
+        flat.append(field_name)
+        flat.append(value)
+    return flat
+
+
+def _measure(label: str, fn, sessions: list, field_total: int) -> float:
+    start = time.perf_counter()
+    for session in sessions:
+        fn(session)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:9.1f} ms  {field_total / elapsed:12,.0f} fields/s")
+    return elapsed
+
+
+def run(session_count: int, field_count: int):
+    crypto = Crypto.get_instance()
+    plain_sessions = [_flatten(build_session(field_count)) for _ in range(session_count)]
+    encrypted_sessions = [crypto.enc_many(session) for session in plain_sessions]
+    field_total = session_count * field_count * 2  # 키 + 값
+
+    # 결과 동일성 확인
+    assert encrypted_sessions[0] == [crypto.enc_data(text) for text in plain_sessions[0]]
+    assert crypto.dec_many(encrypted_sessions[0]) == plain_sessions[0]
+
+    print("=" * 80)
+    print(f"🔐 세션 {session_count}개 × 필드 {field_count}개 (키+값 {field_count * 2}개 암복호화)")
+    print("=" * 80)
+
+    print("암호화")
+    per_field = _measure("enc_data (필드 단위)", lambda s: [crypto.enc_data(t) for t in s], plain_sessions, field_total)
+    batched = _measure("enc_many (일괄)", crypto.enc_many, plain_sessions, field_total)
+    print(f"  → {per_field / batched:.2f}x")
+
+    print("복호화")
+    per_field = _measure("dec_data (필드 단위)", lambda s: [crypto.dec_data(t) for t in s], encrypted_sessions, field_total)
+    batched = _measure("dec_many (일괄)", crypto.dec_many, encrypted_sessions, field_total)
+    print(f"  → {per_field / batched:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="세션 필드 암호화 벤치마크")
+    parser.add_argument("--sessions", type=int, default=2000, help="세션 수")
+    parser.add_argument("--fields", type=int, default=40, help="세션당 항목 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    run(args.sessions, args.fields)
@@ -0,0 +1,89 @@
+"""
+IE_RULE 키워드 매칭 마이크로 벤치마크
+기존 방식(항목마다 소득 → 지출 키워드를 순서대로 lower() + in 검사)과 KeywordAutomaton 비교
+
+실행: python -m benchmarks.keyword_automaton_benchmark [--keywords 2000] [--fields 20000]
+"""
+
+import argparse
+import random
+import time
+
+from documents_multi_agents.domain.service.keyword_automaton import KeywordAutomaton
+
+SYLLABLES = list("가나다라마바사아자차카타파하급여수당보험료세금카드연금이자배당월세통신")
+
+
+def legacy_classify(field_name: str, income_keywords: list, expense_keywords: list):
+    """기존 DBRuleBasedParser._classify_with_db 매칭 (비교 기준)"""
+    field_lower = field_name.lower()
+    for keyword in income_keywords:
+        if keyword.lower() in field_lower:
+            return 'income', keyword
+    for keyword in expense_keywords:
+        if keyword.lower() in field_lower:
+            return 'expense', keyword
+    return None
+
+
+def brute_force_longest(field_name: str, income_keywords: list, expense_keywords: list):
+    """가장 긴 키워드 우선 (같은 길이면 소득 → 지출, 목록 순) - 정답 확인용"""
+    field_lower = field_name.lower()
+    best = None
+    for trans_type, keywords in (('income', income_keywords), ('expense', expense_keywords)):
+        for keyword in keywords:
+            if keyword and keyword.lower() in field_lower and (best is None or len(keyword) > len(best[1])):
+                best = (trans_type, keyword)
+    return best
+
+
+def random_word(min_length: int, max_length: int) -> str:
+    return "".join(random.choices(SYLLABLES, k=random.randint(min_length, max_length)))
+
+
+def run(keyword_count: int, field_count: int):
+    keywords = list(dict.fromkeys(random_word(2, 5) for _ in range(keyword_count)))
+    income_keywords = keywords[: len(keywords) // 2]
+    expense_keywords = keywords[len(keywords) // 2:]
+    fields = [random_word(3, 12) for _ in range(field_count)]
+
+    build_start = time.perf_counter()
+    automaton = KeywordAutomaton(
+        [(keyword, 'income') for keyword in income_keywords]
+        + [(keyword, 'expense') for keyword in expense_keywords]
+    )
+    build_elapsed = time.perf_counter() - build_start
+
+    # 결과 확인 (가장 긴 키워드 우선)
+    for field in fields[:500]:
+        match = automaton.longest_match(field)
+        expected = brute_force_longest(field, income_keywords, expense_keywords)
+        assert (match and (match[1], match[0])) == expected, (field, match, expected)
+
+    print("=" * 80)
+    print(f"🔎 키워드 {len(keywords)}개 × 항목명 {field_count}개 (빌드 {build_elapsed * 1000:.1f} ms)")
+    print("=" * 80)
+
+    start = time.perf_counter()
+    for field in fields:
+        legacy_classify(field, income_keywords, expense_keywords)
+    legacy = time.perf_counter() - start
+    print(f"  {'기존 (키워드별 in 검사)':<28} {legacy * 1000:9.1f} ms  {field_count / legacy:10,.0f} fields/s")
+
+    start = time.perf_counter()
+    for field in fields:
+        automaton.longest_match(field)
+    compiled = time.perf_counter() - start
+    print(f"  {'KeywordAutomaton':<28} {compiled * 1000:9.1f} ms  {field_count / compiled:10,.0f} fields/s")
+    print(f"  → {legacy / compiled:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IE_RULE 키워드 매칭 벤치마크")
+    parser.add_argument("--keywords", type=int, default=2000, help="키워드 수")
+    parser.add_argument("--fields", type=int, default=20000, help="분류할 항목명 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    run(args.keywords, args.fields)
@@ -0,0 +1,105 @@
+"""
+LLM 추출 응답 후처리 마이크로 벤치마크
+기존 방식(replace/re.sub 연쇄 + 요청마다 컴파일 + 항목 간 O(n²) 중복 확인)과 output_normalizer 비교
+
+실행: python -m benchmarks.output_normalizer_benchmark [--answers 200] [--items 500]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from documents_multi_agents.domain.service.output_normalizer import clean_llm_output, parse_amount_items
+
+LABELS = [
+    "기본급", "연장근로수당", "야간근로수당", "식대", "상여금", "성과급", "국민연금보험료",
+    "건강보험료", "고용보험료", "신용카드", "체크카드", "통신비", "월세", "대출이자",
+]
+TOTAL_LABELS = ["총급여", "총소득", "지급합계", "공제합계", "총액"]
+
+
+def legacy_parse(answer: str) -> dict:
+    """기존 라우터 구현 (비교 기준)"""
+    answer = answer.replace("**", "")
+    answer = answer.replace("*", "")
+    answer = re.sub(r'※.*', '', answer)
+    answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)
+
+    pattern = re.compile(r'([가-힣\w\s]+)\s*:\s*([\d,]+)')
+    extracted_items = {}
+    duplicate_keywords = ["총급여", "총소득", "합계", "총합", "총액"]
+
+    for match in pattern.finditer(answer):
+        field, value = match.groups()
+        field_clean = field.strip()
+        value_clean = value.replace(",", "").strip()
+
+        is_duplicate = False
+        for existing_field, existing_value in extracted_items.items():
+            if value_clean == existing_value:
+                if any(keyword in field_clean for keyword in duplicate_keywords) or \
+                        any(keyword in existing_field for keyword in duplicate_keywords):
+                    is_duplicate = True
+                    break
+
+        if is_duplicate:
+            continue
+        extracted_items[field_clean] = value_clean
+    return extracted_items
+
+
+def build_answer(item_count: int) -> str:
+    """GPT 추출 응답 형태 (마크다운, ※ 주석, 합계 중복, 구분선 이후 설명 포함)"""
+    lines = []
+    for i in range(item_count):
+        if i % 10 == 9:
+            # 앞 항목과 같은 금액의 합계 항목 (중복 제거 대상)
+            label = f"{random.choice(TOTAL_LABELS)}{i}"
+            amount = lines[-1].rsplit(": ", 1)[1]
+        else:
+            label = f"{random.choice(LABELS)}{i}"
+            amount = f"{random.randint(1, 5_000) * 1000:,}"
+        prefix = "**" if i % 7 == 0 else ""
+        lines.append(f"{prefix}{label}{prefix}: {amount}")
+        if i % 25 == 0:
+            lines.append("※ 월별 구분은 합계로 계산함")
+    lines.append("---")
+    lines.append("참고: 위 금액은 문서 기준이며 실제와 다를 수 있습니다. 기타항목: 1,000")
+    return "\n".join(lines)
+
+
+def _measure(label: str, fn, answers: list) -> float:
+    start = time.perf_counter()
+    for answer in answers:
+        fn(answer)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:9.1f} ms  {len(answers) / elapsed:10,.0f} answers/s")
+    return elapsed
+
+
+def run(answer_count: int, item_count: int):
+    answers = [build_answer(item_count) for _ in range(answer_count)]
+
+    # 결과 동일성 확인
+    for answer in answers[:10]:
+        assert parse_amount_items(answer)[0] == legacy_parse(answer)
+    assert clean_llm_output("**굵게** *기울임*\n※ 주석\n본문\n---\n꼬리") == "굵게 기울임\n\n본문\n"
+
+    print("=" * 80)
+    print(f"🧹 추출 응답 {answer_count}개 × 항목 {item_count}개")
+    print("=" * 80)
+    legacy = _measure("기존 (O(n²) 중복 확인)", legacy_parse, answers)
+    normalized = _measure("output_normalizer", parse_amount_items, answers)
+    print(f"  → {legacy / normalized:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LLM 추출 응답 후처리 벤치마크")
+    parser.add_argument("--answers", type=int, default=200, help="응답 수")
+    parser.add_argument("--items", type=int, default=500, help="응답당 항목 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    run(args.answers, args.items)
@@ -0,0 +1,117 @@
+"""
+세션 저장 포맷 벤치마크
+필드 단위 암호화 해시("fields")와 FIN_DOC 단일 문서("blob")의 세션당 메모리/읽기 지연 비교
+
+실행:
+    python -m benchmarks.session_store_benchmark              # 오프라인 (페이로드 크기, 복호화 시간)
+    python -m benchmarks.session_store_benchmark --redis      # Redis MEMORY USAGE, HGETALL+복호화 지연
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from benchmarks.crypto_benchmark import build_session
+from config.crypto import Crypto
+from util.session.session_document import (
+    FIN_DOC_FIELD,
+    USER_TOKEN_FIELD,
+    decode_document,
+    decode_legacy_fields,
+    encode_document,
+    split_hash
+)
+
+BENCH_KEY_PREFIX = "bench:session_store:"
+
+
+def build_hashes(field_count: int) -> dict:
+    """같은 세션을 두 포맷의 해시로 생성"""
+    session = build_session(field_count)
+    token = "ya29." + "x" * 160  # OAuth 액세스 토큰 길이
+
+    encrypted = Crypto.enc_many([text for pair in session.items() for text in pair])
+    fields_hash = {USER_TOKEN_FIELD: token, **dict(zip(encrypted[0::2], encrypted[1::2]))}
+
+    items = [tuple(key.split(":", 1)) + (value,) for key, value in session.items()]
+    blob_hash = {USER_TOKEN_FIELD: token, FIN_DOC_FIELD: encode_document(items)}
+
+    return {"fields": fields_hash, "blob": blob_hash}
+
+
+def decode_hash(raw: dict) -> list:
+    """스냅샷 로더와 같은 경로로 해시 복호화"""
+    document, legacy = split_hash(raw)
+    items, _ = decode_legacy_fields(legacy)
+    if document is not None:
+        items += decode_document(document)
+    return items
+
+
+def _payload_bytes(raw: dict) -> int:
+    return sum(len(key.encode("utf-8")) + len(value.encode("utf-8")) for key, value in raw.items())
+
+
+def _report(label: str, memory: list, latency_ms: list):
+    print(
+        f"  {label:<8} 세션당 {statistics.mean(memory):9,.0f} bytes"
+        f"   읽기 p50 {statistics.median(latency_ms):7.3f} ms"
+        f"   p95 {sorted(latency_ms)[int(len(latency_ms) * 0.95)]:7.3f} ms"
+    )
+
+
+def run_offline(sessions: list):
+    print("오프라인 (해시 페이로드 크기, 복호화 시간)")
+    for fmt in ("fields", "blob"):
+        memory = [_payload_bytes(session[fmt]) for session in sessions]
+        latency_ms = []
+        for session in sessions:
+            start = time.perf_counter()
+            decode_hash(session[fmt])
+            latency_ms.append((time.perf_counter() - start) * 1000)
+        _report(fmt, memory, latency_ms)
+
+
+def run_redis(sessions: list):
+    from config.redis_config import get_redis
+
+    redis_client = get_redis()
+    print("Redis (MEMORY USAGE, HGETALL + 복호화)")
+    for fmt in ("fields", "blob"):
+        keys = [f"{BENCH_KEY_PREFIX}{fmt}:{i}" for i in range(len(sessions))]
+        try:
+            with redis_client.pipeline(transaction=False) as pipe:
+                for key, session in zip(keys, sessions):
+                    pipe.hset(key, mapping=session[fmt])
+                    pipe.expire(key, 600)
+                pipe.execute()
+
+            memory = [redis_client.memory_usage(key) or 0 for key in keys]
+            latency_ms = []
+            for key in keys:
+                start = time.perf_counter()
+                decode_hash(redis_client.hgetall(key))
+                latency_ms.append((time.perf_counter() - start) * 1000)
+            _report(fmt, memory, latency_ms)
+        finally:
+            redis_client.unlink(*keys)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="세션 저장 포맷 벤치마크")
+    parser.add_argument("--sessions", type=int, default=500, help="세션 수")
+    parser.add_argument("--fields", type=int, default=40, help="세션당 항목 수")
+    parser.add_argument("--redis", action="store_true", help="실제 Redis에 써서 측정")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    bench_sessions = [build_hashes(args.fields) for _ in range(args.sessions)]
+
+    print("=" * 80)
+    print(f"🗄️  세션 {args.sessions}개 × 항목 {args.fields}개: fields vs blob")
+    print("=" * 80)
+    run_offline(bench_sessions)
+    if args.redis:
+        run_redis(bench_sessions)
@@ -1,13 +1,20 @@
 import base64
+from typing import Iterable, List, Optional
 
 from Crypto.Cipher import AES
 from Crypto.Random import get_random_bytes
 from Crypto.Util.Padding import pad, unpad
+from Crypto.Util.strxor import strxor
 
 # 1. 키와 IV 생성 (안전을 위해 임의로 생성)
 key = get_random_bytes(16) # 128비트 키
 iv = get_random_bytes(16)  # 128비트 IV
 
+# 일괄 처리용 ECB 객체 (체이닝 상태가 없어 재사용 가능)
+# CBC = 블록마다 (이전 암호문 블록 XOR) + ECB 이므로 여러 필드를 한 번에 처리할 수 있다
+_ecb = AES.new(key, AES.MODE_ECB)
+_BLOCK = AES.block_size
+
 class Crypto:
     __instance = None
 
@@ -51,4 +58,92 @@ class Crypto:
 
         # 8. 바이트를 문자열로 변환
         decrypted_data = decrypted_bytes.decode('utf-8')
-        return decrypted_data
\ No newline at end of file
+        return decrypted_data
+
+    @staticmethod
+    def enc_many(target_texts: Iterable[str]) -> List[str]:
+        """
+        여러 필드 일괄 암호화 (enc_data와 동일한 결과)
+
+        필드마다 AES 객체를 만들지 않고, 모든 필드의 i번째 블록을
+        한 번의 ECB 호출로 암호화한다. (라운드 수 = 가장 긴 필드의 블록 수)
+
+        Args:
+            target_texts: 평문 목록
+
+        Returns:
+            base64 암호문 목록 (입력 순서 유지)
+        """
+        padded = [pad(text.encode('utf-8'), _BLOCK) for text in target_texts]
+        chains = [iv] * len(padded)
+        encrypted = [bytearray() for _ in padded]
+
+        offset = 0
+        active = list(range(len(padded)))
+        while active:
+            plain_blocks = b"".join(padded[i][offset:offset + _BLOCK] for i in active)
+            prev_blocks = b"".join(chains[i] for i in active)
+            cipher_blocks = _ecb.encrypt(strxor(plain_blocks, prev_blocks))
+
+            for n, i in enumerate(active):
+                block = cipher_blocks[n * _BLOCK:(n + 1) * _BLOCK]
+                chains[i] = block
+                encrypted[i] += block
+
+            offset += _BLOCK
+            active = [i for i in active if len(padded[i]) > offset]
+
+        return [base64.b64encode(data).decode('utf-8') for data in encrypted]
+
+    @staticmethod
+    def dec_many(target_texts: Iterable[str], ignore_errors: bool = False) -> List[Optional[str]]:
+        """
+        여러 필드 일괄 복호화 (dec_data와 동일한 결과)
+
+        CBC 복호화는 블록 간 의존성이 없으므로 세션 전체 암호문을
+        한 번의 ECB 복호화 + 한 번의 XOR로 처리한다.
+
+        Args:
+            target_texts: base64 암호문 목록
+            ignore_errors: True면 복호화에 실패한 필드를 None으로 반환 (기본: ValueError)
+
+        Returns:
+            평문 목록 (입력 순서 유지)
+        """
+        results: List[Optional[str]] = []
+        cipher_parts = []
+        prev_parts = []
+        valid = []  # (결과 인덱스, 암호문 길이)
+
+        for target_text in target_texts:
+            try:
+                encrypted_bytes = base64.b64decode(target_text)
+                if not encrypted_bytes or len(encrypted_bytes) % _BLOCK:
+                    raise ValueError("Ciphertext length is not a multiple of the block size")
+            except (ValueError, TypeError):
+                if not ignore_errors:
+                    raise
+                results.append(None)
+                continue
+
+            valid.append((len(results), len(encrypted_bytes)))
+            results.append(None)
+            cipher_parts.append(encrypted_bytes)
+            # 블록 i의 XOR 대상 = 블록 i-1 (첫 블록은 IV)
+            prev_parts.append(iv + encrypted_bytes[:-_BLOCK])
+
+        if not valid:
+            return results
+
+        decrypted = strxor(_ecb.decrypt(b"".join(cipher_parts)), b"".join(prev_parts))
+
+        offset = 0
+        for index, length in valid:
+            try:
+                results[index] = unpad(decrypted[offset:offset + length], _BLOCK).decode('utf-8')
+            except (ValueError, UnicodeDecodeError):
+                if not ignore_errors:
+                    raise
+            offset += length
+
+        return results
@@ -1,6 +1,7 @@
 import os
 
 import redis
+import redis.asyncio as redis_asyncio
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,17 +11,48 @@ REDIS_PORT = int(os.getenv("REDIS_PORT"))
 REDIS_DB = int(os.getenv("REDIS_DB"))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
 
+# 커넥션 풀 설정
+REDIS_POOL_MAX_CONNECTIONS = int(os.getenv("REDIS_POOL_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))  # 풀 고갈 시 대기 시간
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
+REDIS_SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "5"))
+
 # Redis 인스턴스 생성 (Singleton)
 _redis_instance = None
+_async_redis_instance = None
+
+
+def _pool_options() -> dict:
+    return dict(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=REDIS_DB,
+        password=REDIS_PASSWORD,
+        decode_responses=True,
+        max_connections=REDIS_POOL_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT
+    )
+
 
 def get_redis() -> redis.Redis:
+    """동기 Redis 클라이언트 (스레드/동기 코드 경로용)"""
     global _redis_instance
     if _redis_instance is None:
         _redis_instance = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            db=REDIS_DB,
-            password=REDIS_PASSWORD,
-            decode_responses=True
+            connection_pool=redis.BlockingConnectionPool(**_pool_options())
         )
     return _redis_instance
+
+
+def get_async_redis() -> redis_asyncio.Redis:
+    """이벤트 루프를 막지 않는 비동기 Redis 클라이언트 (async 핸들러용)"""
+    global _async_redis_instance
+    if _async_redis_instance is None:
+        _async_redis_instance = redis_asyncio.Redis(
+            connection_pool=redis_asyncio.BlockingConnectionPool(**_pool_options())
+        )
+    return _async_redis_instance
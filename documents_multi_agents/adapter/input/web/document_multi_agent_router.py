@@ -1,68 +1,83 @@
 import asyncio
-import io
-import re
+import json
+import os
+import time
 import uuid
 
-from fastapi import APIRouter, Depends, UploadFile, HTTPException, Form, Response, Header, Request
-from openai import OpenAI
-from pypdf import PdfReader
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form, Response, Header, Request
+from fastapi.responses import StreamingResponse
 
 from account.adapter.input.web.session_helper import get_current_user
 from config.crypto import Crypto
-from config.redis_config import get_redis
+from config.redis_config import get_async_redis
 from documents_multi_agents.adapter.input.web.request.insert_income_request import InsertDocumentRequest
+from documents_multi_agents.domain.service.output_normalizer import clean_llm_output, parse_amount_items
+from documents_multi_agents.domain.service.prompt_compactor import compact_document, merge_answers
 from documents_multi_agents.domain.service.prompt_templates import PromptTemplates
+from documents_multi_agents.domain.service.template_extractor import TemplateExtractor
+from jobs.ie_save_scheduler import IESaveScheduler
+from jobs.job_queue import JobQueue, JobQueueFull, ProgressCallback
 from util.cache.ai_cache import AICache
+from util.cache.extraction_cache import ExtractionCache
+from util.llm.llm_gateway import LLMGateway
+from util.llm.token_counter import count_tokens
 from util.log.log import Log
+from util.pdf.pdf_extractor import PdfExtractor, PdfExtractionError, PdfExtractionTimeout, key_sections_for
+from util.session.session_document import FIN_DOC_FIELD, decode_document
+from util.session.session_snapshot import SessionSnapshotService
+from util.session.session_writer import SessionWriter
 from util.security.crsf import generate_csrf_token, verify_csrf_token, CSRF_COOKIE_NAME
 
 log_util = Log()
 logger = Log.get_logger()
 documents_multi_agents_router = APIRouter(tags=["documents_multi_agents_router"])
-redis_client = get_redis()
-client = OpenAI()
+async_redis_client = get_async_redis()
+llm_gateway = LLMGateway.get_instance()
 crypto = Crypto.get_instance()
+session_snapshot_service = SessionSnapshotService.get_instance()
+session_writer = SessionWriter.get_instance()
+pdf_extractor = PdfExtractor.get_instance()
+template_extractor = TemplateExtractor.get_instance()
+job_queue = JobQueue.get_instance()
+ie_save_scheduler = IESaveScheduler.get_instance()
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 
+# /analyze-batch: 요청당 최대 문서 수, 전체 요청이 공유하는 동시 추출 수
+ANALYZE_BATCH_MAX_FILES = int(os.getenv("ANALYZE_BATCH_MAX_FILES", "10"))
+ANALYZE_BATCH_CONCURRENCY = int(os.getenv("ANALYZE_BATCH_CONCURRENCY", "4"))
+analyze_batch_semaphore = asyncio.Semaphore(ANALYZE_BATCH_CONCURRENCY)
+
+# /analyze: 기본으로 백그라운드 작업 사용 여부 (false면 "Prefer: respond-async" 요청만), 대기열 초과 시 재시도 안내(초)
+ANALYZE_ASYNC_DEFAULT = os.getenv("ANALYZE_ASYNC_DEFAULT", "false").lower() == "true"
+ANALYZE_RETRY_AFTER_SECONDS = int(os.getenv("ANALYZE_RETRY_AFTER_SECONDS", "5"))
+
 # -----------------------
 # PDF 텍스트 추출
 # -----------------------
-def extract_text_from_pdf_clean(file_bytes: bytes) -> str:
+async def extract_text_from_pdf_clean(file_bytes: bytes, type_of_doc: str = "") -> str:
+    # 페이지 추출/정리는 프로세스 풀에서 실행 (이벤트 루프 비차단)
     try:
-        reader = PdfReader(io.BytesIO(file_bytes))
-        texts = []
-        for page in reader.pages:
-            t = page.extract_text() or ""
-            t = re.sub(r'\s+', ' ', t)  # 공백 정리
-            t = re.sub(r'\d+\s*$', '', t)  # 페이지 번호 제거 (행 끝 숫자)
-            if t.strip():
-                texts.append(t.strip())
-        return "\n".join(texts)
-    except Exception as e:
+        return await pdf_extractor.extract_text(file_bytes, key_sections_for(type_of_doc))
+    except PdfExtractionTimeout as e:
+        raise HTTPException(status_code=408, detail=f"PDF parsing timeout: {str(e)}")
+    except PdfExtractionError as e:
         raise HTTPException(status_code=400, detail=f"PDF parsing error: {str(e)}")
 
 
 # -----------------------
-# GPT 호출 래퍼 (기존)
+# GPT 호출 래퍼 (LLM 게이트웨이 경유)
 # -----------------------
 async def ask_gpt(prompt: str, max_tokens=500):
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda:
-    client.chat.completions.create(
-        model="gpt-4.1",
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=max_tokens,
-        temperature=0
-    ).choices[0].message.content
-                                      )
+    return await llm_gateway.chat(prompt, model="gpt-4.1", max_tokens=max_tokens, temperature=0)
 
 
 # -----------------------
 # QA 에이전트 (문서 기반)
 # -----------------------
-@log_util.logging_decorator
-async def qa_on_document(document: str, question: str, role: str) -> str:
-    prompt = f"""
+def _build_qa_prompt(document: str, question: str, role: str) -> str:
+    return f"""
 다음은 문서 자료이다. 이 문서 내의 정보만 사용하여 질문에 답해라.
 답변 시 존댓말 사용을 유지해라.
 
@@ -75,12 +90,305 @@ async def qa_on_document(document: str, question: str, role: str) -> str:
 규칙:
 {role}
 """
-    return (await ask_gpt(prompt, max_tokens=2500)).strip()
+
+
+async def _ask_qa(prompt: str, label: str) -> str:
+    started = time.perf_counter()
+    answer = (await ask_gpt(prompt, max_tokens=2500)).strip()
+    logger.info(
+        f"[QA] {label} prompt_tokens={count_tokens(prompt)} chars={len(prompt)} "
+        f"latency={time.perf_counter() - started:.2f}s"
+    )
+    return answer
+
+
+@log_util.logging_decorator
+async def qa_on_document(document: str, question: str, role: str, compact: bool = False) -> str:
+    """
+    compact=True: 금액이 있는 구간만 남기고 토큰 예산을 넘으면 조각별로 동시에 질의 후 병합
+    ("항목명: 금액" 추출처럼 답이 줄 단위로 합쳐지는 질문에만 사용)
+    """
+    if not compact:
+        return await _ask_qa(_build_qa_prompt(document, question, role), "single")
+
+    compacted = compact_document(document)
+    logger.info(
+        f"[QA] compacted {compacted.original_tokens} → {compacted.compacted_tokens} tokens "
+        f"({compacted.segment_count} segments, {len(compacted.chunks)} chunks)"
+    )
+    if len(compacted.chunks) == 1:
+        return await _ask_qa(_build_qa_prompt(compacted.chunks[0], question, role), "compact")
+
+    answers = await asyncio.gather(*(
+        _ask_qa(_build_qa_prompt(chunk, question, role), f"chunk {index + 1}/{len(compacted.chunks)}")
+        for index, chunk in enumerate(compacted.chunks)
+    ))
+    return merge_answers(answers)
+
+
+async def _stream_qa(document: str, question: str, role: str) -> AsyncIterator[str]:
+    """qa_on_document(compact=False)의 스트리밍 버전"""
+    prompt = _build_qa_prompt(document, question, role)
+    started = time.perf_counter()
+    first_token_at = None
+    async for chunk in llm_gateway.stream_chat(prompt, model="gpt-4.1", max_tokens=2500, temperature=0):
+        if first_token_at is None:
+            first_token_at = time.perf_counter()
+        yield chunk
+
+    ttft = f"{first_token_at - started:.2f}s" if first_token_at is not None else "-"
+    logger.info(
+        f"[QA] stream prompt_tokens={count_tokens(prompt)} chars={len(prompt)} "
+        f"ttft={ttft} latency={time.perf_counter() - started:.2f}s"
+    )
+
+
+# -----------------------
+# SSE 응답
+# -----------------------
+def _sse_event(event: str, data: Dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _sse_response(
+        chunks: AsyncIterator[str],
+        done_payload: Callable[[str], Dict],
+        prelude: Optional[Dict[str, Dict]] = None
+) -> StreamingResponse:
+    """
+    응답 조각 → text/event-stream
+
+    이벤트 순서: (prelude 이벤트들) → token* → done | error
+    - token: {"text": 조각} (전처리 전 원문)
+    - done: done_payload(전체 응답) (전처리된 최종 결과, 기존 엔드포인트 응답과 같은 내용)
+    - error: {"detail": 오류} (스트림 시작 후에는 상태 코드를 바꿀 수 없으므로 이벤트로 전달)
+    """
+    async def events():
+        for event, data in (prelude or {}).items():
+            yield _sse_event(event, data)
+
+        parts = []
+        try:
+            async for chunk in chunks:
+                parts.append(chunk)
+                yield _sse_event("token", {"text": chunk})
+            yield _sse_event("done", done_payload("".join(parts)))
+        except Exception as e:
+            logger.error(f"[SSE] Stream failed: {type(e).__name__}: {str(e)}")
+            yield _sse_event("error", {"detail": f"{type(e).__name__}: {str(e)}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}  # 프록시 버퍼링 방지
+    )
+
+
+# -----------------------
+# 문서 추출/저장 공용 단계 (/analyze, /analyze-batch, /analyze_form)
+# -----------------------
+def _extraction_prompts(type_of_doc: str) -> Tuple[str, str]:
+    """type_of_doc에 따른 추출 질문/규칙"""
+    if "소득" in type_of_doc or "income" in type_of_doc.lower():
+        extraction_question = (
+            "PDF에서 소득 관련 항목과 금액만 추출해줘. "
+            "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
+            "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
+            "예시: "
+            "급여: 3000000 "
+            "식대: 200000 "
+            "상여: 500000"
+        )
+        extraction_role = (
+            "소득 항목만 포함: 급여, 상여, 식대, 수당, 총급여, 이자소득, 배당소득 "
+            "절대 제외: 보험료, 세금, 공제액 등 차감/지출 항목 "
+            "추론 금지, 문서 내 데이터만 사용 "
+            "월별 구분 있으면 합계만 사용 "
+            "설명문, 주석 절대 금지 - 순수 데이터만 반환"
+        )
+    elif "지출" in type_of_doc or "expense" in type_of_doc.lower():
+        extraction_question = (
+            "PDF에서 지출 관련 항목과 금액만 추출해줘. "
+            "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
+            "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
+            "예시: "
+            "국민연금보험료: 500000 "
+            "신용카드: 1000000 "
+            "건강보험료: 300000"
+        )
+        extraction_role = (
+            "지출 항목만 포함: 보험료, 카드사용액, 세금, 공과금, 대출, 월세, 통신비 "
+            "절대 제외: 급여, 소득, 수당 등 수입 항목 "
+            "추론 금지, 문서 내 데이터만 사용 "
+            "월별 구분 있으면 합계만 사용 "
+            "설명문, 주석 절대 금지 - 순수 데이터만 반환"
+        )
+    else:
+        # 타입을 모를 경우 기본 프롬프트
+        extraction_question = (
+            "PDF의 항목과 금액을 추출해줘. "
+            "형식: 항목명: 금액 (한 줄에 하나씩)"
+        )
+        extraction_role = (
+            "문서 내 모든 금액 찾기 "
+            "월별 구분 있으면 합계만 사용 "
+            "설명문 금지 - 순수 데이터만"
+        )
+    return extraction_question, extraction_role
+
+
+def _parse_extracted_items(answer: str) -> Dict[str, str]:
+    """추출 응답 → {항목명: 금액} (합계성 중복 항목 제거)"""
+    extracted_items, duplicates = parse_amount_items(answer)
+    logger.info(f"[DEBUG] Parsed items: {len(extracted_items)} (duplicates skipped: {duplicates})")
+    return extracted_items
+
+
+async def _extract_document_items(content: bytes, type_of_doc: str) -> Dict[str, str]:
+    """업로드 파일 → {항목명: 금액} (추출 캐시 → PDF 파싱 → 템플릿 → GPT)"""
+    if not content:
+        raise HTTPException(400, "Empty file upload")
+
+    if len(content) > MAX_FILE_SIZE:
+        raise HTTPException(413, "File too large")
+
+    extraction_question, extraction_role = _extraction_prompts(type_of_doc)
+
+    async def extract_answer() -> str:
+        text = await extract_text_from_pdf_clean(content, type_of_doc)
+        if not text:
+            raise HTTPException(400, "No text extracted")
+
+        logger.info(f"Extracted text length: {len(text)}")
+
+        # 알려진 양식(원천징수영수증, 급여명세서)은 GPT 없이 추출
+        templated = template_extractor.extract(text, type_of_doc)
+        if templated is not None:
+            return templated
+        return await qa_on_document(text, extraction_question, extraction_role, compact=True)
+
+    # 같은 파일(내용 해시)이면 PDF 파싱과 GPT 추출 생략
+    answer = await ExtractionCache.get_or_extract(content, type_of_doc, extract_answer)
+    return _parse_extracted_items(answer)
+
+
+async def _categorize_by_doc_type(analyzer, items: Dict[str, str], type_of_doc: str, session_id: str) -> Dict:
+    """type_of_doc에 따라 소득/지출 분류 (알 수 없으면 원본 반환)"""
+    if "소득" in type_of_doc or "income" in type_of_doc.lower():
+        return await analyzer._categorize_income_async(items, session_id=session_id)
+    if "지출" in type_of_doc or "expense" in type_of_doc.lower():
+        return await analyzer._categorize_expense_async(items, session_id=session_id)
+    return {"raw_items": items}
+
+
+async def _schedule_ie_save_if_member(session_id: str) -> Optional[Dict]:
+    """
+    로그인한 사용자인 경우 세션 데이터 DB 저장 예약 (실패해도 예외를 올리지 않음)
+
+    저장은 IESaveScheduler가 백그라운드에서 수행 (짧은 시간 안의 연속 업로드는 한 번의 저장으로 병합)
+    """
+    try:
+        user_token = await async_redis_client.hget(session_id, "USER_TOKEN")
+        if user_token:
+            if isinstance(user_token, bytes):
+                user_token = user_token.decode('utf-8')
+
+            # GUEST가 아닌 로그인 사용자만 DB 저장
+            if user_token != "GUEST":
+                return ie_save_scheduler.schedule(session_id)
+    except Exception as db_error:
+        logger.error(f"Failed to schedule DB save (non-critical): {str(db_error)}")
+        # DB 저장 예약 실패해도 API 응답은 정상 반환 (Redis 저장은 성공했으므로)
+        import traceback
+        traceback.print_exc()
+    return None
+
+
+def _attach_db_save_schedule(response_data: Dict, db_save_schedule: Optional[Dict]):
+    """
+    DB 저장 예약 정보 추가 (있는 경우, 결과는 GET /ie_info/save-status)
+
+    저장이 끝나기 전이므로 기존 db_saved/db_save_info(저장 결과)는 넣지 않고 db_save_schedule 키로 구분
+    """
+    if db_save_schedule:
+        response_data["db_save_schedule"] = {
+            "scheduled": True,
+            "merged": db_save_schedule["merged"],
+            "due_in_seconds": db_save_schedule["due_in_seconds"]
+        }
 
 
 # -----------------------
 # API 엔드포인트
 # -----------------------
+async def _no_progress(stage: str, percent: int):
+    pass
+
+
+async def _run_analyze(
+        session_id: str,
+        content: bytes,
+        type_of_doc: str,
+        progress: ProgressCallback = _no_progress
+) -> Dict:
+    """/analyze 본문: 추출 → 세션 저장/캐시 무효화 → 분류 → DB 저장 (요청 처리/백그라운드 작업 공용)"""
+    await progress("extracting", 10)
+    extracted_items = await _extract_document_items(content, type_of_doc)
+
+    await progress("saving", 40)
+    try:
+        # Redis에 일괄 저장 (HSET mapping + EXPIRE 한 번의 파이프라인)
+        await session_writer.write_fields_async(session_id, type_of_doc, extracted_items)
+
+    except Exception as e:
+        logger.error(f"[ERROR] Failed to save to Redis: {str(e)}")
+        import traceback
+        traceback.print_exc()
+
+    # 🔥 새 문서 업로드 시 기존 캐시 무효화
+    # 사용자 데이터가 변경되었으므로 모든 AI 분석 캐시를 제거
+    logger.info(f"Invalidating cache for session: {session_id}")
+    invalidated_count = await AICache.invalidate_user_cache_async(session_id)
+    logger.info(f"Invalidated {invalidated_count} cache entries")
+
+    logger.info(f"[DEBUG] Extracted items: {len(extracted_items)}")
+
+    if not extracted_items:
+        logger.warning("No items were extracted from PDF!")
+        return {
+            "success": False,
+            "message": "PDF에서 데이터를 추출하지 못했습니다. PDF 형식을 확인해주세요.",
+            "session_id": session_id,
+            "document_type": type_of_doc,
+            "extracted_count": 0,
+            "categorized_data": {}
+        }
+
+    # AI로 카테고리 분류
+    await progress("categorizing", 60)
+    from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
+
+    analyzer = FinancialAnalyzerService()
+    categorized_data = await _categorize_by_doc_type(analyzer, extracted_items, type_of_doc, session_id)
+
+    # 🔥 로그인한 사용자인 경우 DB 자동 저장 예약 (백그라운드, 연속 업로드는 병합)
+    await progress("saving_db", 90)
+    db_save_schedule = await _schedule_ie_save_if_member(session_id)
+
+    # 성공 응답 반환 (session_id 포함)
+    response_data = {
+        "success": True,
+        "message": "분석 완료",
+        "session_id": session_id,  # 프론트엔드에서 사용할 수 있도록 명시적으로 반환
+        "document_type": type_of_doc,
+        "extracted_count": len(extracted_items),
+        "categorized_data": categorized_data
+    }
+    _attach_db_save_schedule(response_data, db_save_schedule)
+
+    return response_data
+
+
 @documents_multi_agents_router.post("/analyze")
 @log_util.logging_decorator
 async def analyze_document(
@@ -89,225 +397,196 @@ async def analyze_document(
         file: UploadFile,
         type_of_doc: str = Form(...),
         session_id: str = Depends(get_current_user),
-        x_csrf_token:  str | None = Header(None)
+        x_csrf_token:  str | None = Header(None),
+        prefer: str | None = Header(None)
 ):
+    """
+    문서 분석
+
+    "Prefer: respond-async" 헤더를 보내거나 ANALYZE_ASYNC_DEFAULT=true 이면
+    백그라운드 작업으로 등록하고 바로 202 + job_id 반환 (GET /analyze/{job_id}로 진행 상황 조회)
+    """
     # CSRF 검증
     verify_csrf_token(request, x_csrf_token)
 
-    try:
-        # 쿠키에 session_id 명시적으로 설정
-        response.set_cookie(
-            key="session_id",
-            value=session_id,
-            max_age=24 * 60 * 60,
-            httponly=True,
-            samesite="lax"
-        )
+    # 쿠키에 session_id 명시적으로 설정
+    response.set_cookie(
+        key="session_id",
+        value=session_id,
+        max_age=24 * 60 * 60,
+        httponly=True,
+        samesite="lax"
+    )
+
+    content = await file.read()
 
-        content = await file.read()
+    if ANALYZE_ASYNC_DEFAULT or "respond-async" in (prefer or ""):
+        # 파일 검증은 등록 전에 (잘못된 요청은 작업을 만들지 않음)
         if not content:
             raise HTTPException(400, "Empty file upload")
-
         if len(content) > MAX_FILE_SIZE:
             raise HTTPException(413, "File too large")
 
-        text = extract_text_from_pdf_clean(content)
-        if not text:
-            raise HTTPException(400, "No text extracted")
-
-        logger.info(f"Extracted text length: {len(text)}")
-
-        # 2. QA (요약 기반)
-        # type_of_doc에 따라 프롬프트 분기
-        if "소득" in type_of_doc or "income" in type_of_doc.lower():
-            extraction_question = (
-                "PDF에서 소득 관련 항목과 금액만 추출해줘. "
-                "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
-                "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
-                "예시: "
-                "급여: 3000000 "
-                "식대: 200000 "
-                "상여: 500000"
-            )
-            extraction_role = (
-                "소득 항목만 포함: 급여, 상여, 식대, 수당, 총급여, 이자소득, 배당소득 "
-                "절대 제외: 보험료, 세금, 공제액 등 차감/지출 항목 "
-                "추론 금지, 문서 내 데이터만 사용 "
-                "월별 구분 있으면 합계만 사용 "
-                "설명문, 주석 절대 금지 - 순수 데이터만 반환"
-            )
-        elif "지출" in type_of_doc or "expense" in type_of_doc.lower():
-            extraction_question = (
-                "PDF에서 지출 관련 항목과 금액만 추출해줘. "
-                "반드시 다음 형식으로만 답변: 항목명: 금액 (한 줄에 하나씩) "
-                "설명, 주석, 별표, 마크다운 등 절대 사용 금지 "
-                "예시: "
-                "국민연금보험료: 500000 "
-                "신용카드: 1000000 "
-                "건강보험료: 300000"
-            )
-            extraction_role = (
-                "지출 항목만 포함: 보험료, 카드사용액, 세금, 공과금, 대출, 월세, 통신비 "
-                "절대 제외: 급여, 소득, 수당 등 수입 항목 "
-                "추론 금지, 문서 내 데이터만 사용 "
-                "월별 구분 있으면 합계만 사용 "
-                "설명문, 주석 절대 금지 - 순수 데이터만 반환"
-            )
-        else:
-            # 타입을 모를 경우 기본 프롬프트
-            extraction_question = (
-                "PDF의 항목과 금액을 추출해줘. "
-                "형식: 항목명: 금액 (한 줄에 하나씩)"
+        try:
+            job_id = await job_queue.submit(
+                "analyze", session_id,
+                lambda progress: _run_analyze(session_id, content, type_of_doc, progress)
             )
-            extraction_role = (
-                "문서 내 모든 금액 찾기 "
-                "월별 구분 있으면 합계만 사용 "
-                "설명문 금지 - 순수 데이터만"
+        except JobQueueFull:
+            raise HTTPException(
+                status_code=429,
+                detail="분석 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(ANALYZE_RETRY_AFTER_SECONDS)}
             )
 
-        answer = await qa_on_document(text, extraction_question, extraction_role)
+        response.status_code = 202
+        return {
+            "success": True,
+            "job_id": job_id,
+            "status": "queued",
+            "status_url": f"{request.url.path.rstrip('/')}/{job_id}",
+            "session_id": session_id,
+            "document_type": type_of_doc
+        }
 
-        # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")  # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
+    try:
+        return await _run_analyze(session_id, content, type_of_doc)
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
-        pattern = re.compile(r'([가-힣\w\s]+)\s*:\s*([\d,]+)')
-        matches = list(pattern.finditer(answer))
 
-        logger.info(f"[DEBUG] Pattern matches found: {len(matches)}")
+@documents_multi_agents_router.get("/analyze/{job_id}")
+async def get_analyze_job(job_id: str, session_id: str = Depends(get_current_user)):
+    """
+    백그라운드 분석 작업 상태 조회
 
-        # 추출된 항목들을 저장하고 동시에 수집
-        extracted_items = {}
-        duplicate_keywords = ["총급여", "총소득", "합계", "총합", "총액"]  # 중복 가능성 있는 키워드
+    status: queued | running | succeeded | failed
+    succeeded이면 result에 /analyze와 같은 응답이 들어 있다.
+    결과는 작업을 실행한 서버 프로세스에서만 읽을 수 있다. (다른 프로세스/재시작 후에는 410)
+    """
+    job = await job_queue.get(job_id)
+    # 다른 세션의 작업은 존재 여부도 알려주지 않음
+    if job is None or job.get("session_id") != session_id:
+        raise HTTPException(404, "작업을 찾을 수 없습니다. (만료되었거나 존재하지 않음)")
+    if job["result_unavailable"]:
+        raise HTTPException(410, job["error"])
+
+    return {
+        "job_id": job_id,
+        "status": job.get("status"),
+        "stage": job.get("stage"),
+        "progress": job["progress"],
+        "result": job.get("result"),
+        "error": job.get("error"),
+        "queue": job_queue.get_stats()
+    }
 
-        try:
-            for match in matches:
-                field, value = match.groups()
-                field_clean = field.strip()
-                value_clean = value.replace(",", "").strip()
-
-                # 중복 체크: 같은 금액의 유사 항목이 이미 있으면 스킵
-                is_duplicate = False
-                for existing_field, existing_value in extracted_items.items():
-                    if value_clean == existing_value:  # 금액이 같고
-                        # 하나가 다른 하나의 "합계" 버전이면 중복으로 간주
-                        if any(keyword in field_clean for keyword in duplicate_keywords) or \
-                                any(keyword in existing_field for keyword in duplicate_keywords):
-                            is_duplicate = True
-                            logger.info(f"[DEBUG] Duplicate found: {field_clean} ")
-                            break
-
-                if is_duplicate:
-                    continue
-
-                # 암호화된 키/값 생성
-                encrypted_key = crypto.enc_data(f"{type_of_doc}:{field_clean}")
-                encrypted_value = crypto.enc_data(value_clean)
-
-                # Redis에 저장
-                redis_client.hset(
-                    session_id,
-                    encrypted_key,
-                    encrypted_value
-                )
-
-                # 저장 확인
-                saved_value = redis_client.hget(session_id, encrypted_key)
-                logger.info(f"Saved successfully: {saved_value is not None}")
-
-                # 응답용 데이터 수집
-                extracted_items[field_clean] = value_clean
 
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to save to Redis: {str(e)}")
-            import traceback
-            traceback.print_exc()
+# -----------------------
+# API 엔드포인트 - 여러 문서 일괄 분석
+# -----------------------
+@documents_multi_agents_router.post("/analyze-batch")
+@log_util.logging_decorator
+async def analyze_documents_batch(
+        request: Request,
+        response: Response,
+        files: List[UploadFile] = File(...),
+        type_of_docs: List[str] = Form(...),
+        session_id: str = Depends(get_current_user),
+        x_csrf_token:  str | None = Header(None)
+):
+    """
+    여러 문서를 동시에 추출하고 세션 저장/캐시 무효화/DB 저장은 한 번씩만 수행
 
-        redis_client.expire(session_id, 24 * 60 * 60)
+    files[i]의 문서 종류는 type_of_docs[i] (같은 순서로 전송)
+    """
+    # CSRF 검증
+    verify_csrf_token(request, x_csrf_token)
 
-        # 🔥 새 문서 업로드 시 기존 캐시 무효화
-        # 사용자 데이터가 변경되었으므로 모든 AI 분석 캐시를 제거
-        logger.info(f"Invalidating cache for session: {session_id}")
-        invalidated_count = AICache.invalidate_user_cache(session_id)
-        logger.info(f"Invalidated {invalidated_count} cache entries")
+    if len(files) != len(type_of_docs):
+        raise HTTPException(400, "files와 type_of_docs 개수가 일치해야 합니다.")
+    if len(files) > ANALYZE_BATCH_MAX_FILES:
+        raise HTTPException(413, f"한 번에 최대 {ANALYZE_BATCH_MAX_FILES}개 문서까지 업로드할 수 있습니다.")
 
-        logger.info(f"[DEBUG] Extracted items: {len(extracted_items)}")
+    try:
+        # 쿠키에 session_id 명시적으로 설정
+        response.set_cookie(
+            key="session_id",
+            value=session_id,
+            max_age=24 * 60 * 60,
+            httponly=True,
+            samesite="lax"
+        )
 
-        if not extracted_items:
-            logger.warning("No items were extracted from PDF!")
-            return {
-                "success": False,
-                "message": "PDF에서 데이터를 추출하지 못했습니다. PDF 형식을 확인해주세요.",
-                "session_id": session_id,
-                "document_type": type_of_doc,
-                "extracted_count": 0,
-                "categorized_data": {}
-            }
+        async def extract_one(upload: UploadFile, type_of_doc: str) -> Dict[str, str]:
+            # 모든 요청이 공유하는 상한 안에서 동시 추출
+            async with analyze_batch_semaphore:
+                return await _extract_document_items(await upload.read(), type_of_doc)
 
-        # AI로 카테고리 분류
-        from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
+        extracted = await asyncio.gather(
+            *(extract_one(upload, type_of_doc) for upload, type_of_doc in zip(files, type_of_docs)),
+            return_exceptions=True
+        )
 
-        analyzer = FinancialAnalyzerService()
+        documents = []
+        for upload, type_of_doc, result in zip(files, type_of_docs, extracted):
+            if isinstance(result, HTTPException):
+                documents.append({"filename": upload.filename, "document_type": type_of_doc, "error": result.detail})
+            elif isinstance(result, Exception):
+                documents.append({"filename": upload.filename, "document_type": type_of_doc, "error": f"{type(result).__name__}: {str(result)}"})
+            else:
+                documents.append({"filename": upload.filename, "document_type": type_of_doc, "items": result})
 
-        # type_of_doc에 따라 소득/지출 분류
-        categorized_data = {}
-        if "소득" in type_of_doc or "income" in type_of_doc.lower():
-            categorized_data = analyzer._categorize_income(extracted_items)
-        elif "지출" in type_of_doc or "expense" in type_of_doc.lower():
-            categorized_data = analyzer._categorize_expense(extracted_items)
-        else:
-            # 타입을 모를 경우 원본 데이터만 반환
-            categorized_data = {"raw_items": extracted_items}
+        succeeded = [document for document in documents if document.get("items")]
 
-        # 🔥 로그인한 사용자인 경우 DB에 자동 저장
-        db_save_result = None
+        # 모든 문서 항목을 한 번의 파이프라인으로 저장
         try:
-            user_token = redis_client.hget(session_id, "USER_TOKEN")
-            if user_token:
-                if isinstance(user_token, bytes):
-                    user_token = user_token.decode('utf-8')
-                
-                # GUEST가 아닌 로그인 사용자만 DB 저장
-                if user_token != "GUEST":
-                    from datetime import datetime
-                    from ieinfo.application.usecase.ie_info_usecase import IEInfoUseCase
-                    
-                    ie_usecase = IEInfoUseCase.get_instance()
-                    now = datetime.now()
-                    db_save_result = ie_usecase.save_ie_data_from_redis(
-                        session_id=session_id,
-                        year=now.year,
-                        month=now.month
-                    )
-                    logger.info(f"DB save result: {db_save_result}")
-        except Exception as db_error:
-            logger.error(f"Failed to save to DB (non-critical): {str(db_error)}")
-            # DB 저장 실패해도 API 응답은 정상 반환 (Redis 저장은 성공했으므로)
+            await session_writer.write_documents_async(
+                session_id, [(document["document_type"], document["items"]) for document in succeeded]
+            )
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to save to Redis: {str(e)}")
             import traceback
             traceback.print_exc()
 
-        # 성공 응답 반환 (session_id 포함)
+        # 캐시 무효화는 배치당 한 번
+        if succeeded:
+            invalidated_count = await AICache.invalidate_user_cache_async(session_id)
+            logger.info(f"Invalidated {invalidated_count} cache entries")
+
+        from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
+
+        analyzer = FinancialAnalyzerService()
+        categorized = await asyncio.gather(*(
+            _categorize_by_doc_type(analyzer, document["items"], document["document_type"], session_id)
+            for document in succeeded
+        ))
+
+        for document, categorized_data in zip(succeeded, categorized):
+            document["categorized_data"] = categorized_data
+
+        results = []
+        for document in documents:
+            items = document.pop("items", None)
+            if items:
+                document.update({"success": True, "extracted_count": len(items)})
+            else:
+                document.setdefault("error", "PDF에서 데이터를 추출하지 못했습니다. PDF 형식을 확인해주세요.")
+                document.update({"success": False, "extracted_count": 0, "categorized_data": {}})
+            results.append(document)
+
+        # 🔥 로그인한 사용자인 경우 DB 저장은 배치당 한 번만 예약
+        db_save_schedule = await _schedule_ie_save_if_member(session_id) if succeeded else None
+
         response_data = {
-            "success": True,
-            "message": "분석 완료",
-            "session_id": session_id,  # 프론트엔드에서 사용할 수 있도록 명시적으로 반환
-            "document_type": type_of_doc,
-            "extracted_count": len(extracted_items),
-            "categorized_data": categorized_data
+            "success": bool(succeeded),
+            "message": f"{len(succeeded)}/{len(documents)}개 문서 분석 완료",
+            "session_id": session_id,
+            "extracted_count": sum(document["extracted_count"] for document in results),
+            "documents": results
         }
-        
-        # DB 저장 결과 추가 (있는 경우)
-        if db_save_result:
-            response_data["db_saved"] = db_save_result["success"]
-            if db_save_result["success"]:
-                response_data["db_save_info"] = {
-                    "saved_count": db_save_result.get("saved_count", 0),
-                    "year": db_save_result.get("year"),
-                    "month": db_save_result.get("month")
-                }
-        
+        _attach_db_save_schedule(response_data, db_save_schedule)
+
         return response_data
 
     except Exception as e:
@@ -322,51 +601,21 @@ async def analyze_document(
 @log_util.logging_decorator
 async def future_assets_analysis(session_id: str = Depends(get_current_user)):
     try:
-        # Redis에서 소득/지출 데이터 가져오기
-        encrypted_data = redis_client.hgetall(session_id)
+        # Redis에서 소득/지출 데이터 가져오기 (요청당 1회 복호화)
+        snapshot = await session_snapshot_service.load_async(session_id)
         
         # 🔥 데이터가 없어도 진행 (소득/지출 0원으로 처리)
-        # if not encrypted_data or len(encrypted_data) <= 1:
-        #     return {"success": False, "message": "저장된 재무 데이터가 없습니다. 문서를 먼저 업로드해주세요."}
-        
-        # 복호화 및 소득/지출 분리
-        income_items = {}
-        expense_items = {}
-        
-        for key_bytes, value_bytes in encrypted_data.items():
-            try:
-                if isinstance(key_bytes, bytes):
-                    key_str = key_bytes.decode('utf-8')
-                else:
-                    key_str = str(key_bytes)
-                
-                if isinstance(value_bytes, bytes):
-                    value_str = value_bytes.decode('utf-8')
-                else:
-                    value_str = str(value_bytes)
-                
-                if key_str == "USER_TOKEN":
-                    continue
-                
-                key_plain = crypto.dec_data(key_str)
-                value_plain = crypto.dec_data(value_str)
-                
-                if ":" in key_plain:
-                    doc_type, field_name = key_plain.split(":", 1)
-                    
-                    if "소득" in doc_type or "income" in doc_type.lower():
-                        income_items[field_name] = value_plain
-                    elif "지출" in doc_type or "expense" in doc_type.lower():
-                        expense_items[field_name] = value_plain
-            except Exception:
-                continue
+        income_items = snapshot.income_items()
+        expense_items = snapshot.expense_items()
         
         # AI로 카테고리 분류
         from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
         analyzer = FinancialAnalyzerService()
         
-        income_categorized = analyzer._categorize_income(income_items) if income_items else {}
-        expense_categorized = analyzer._categorize_expense(expense_items) if expense_items else {}
+        # 소득/지출 분류를 한 번의 GPT 호출로 실행
+        income_categorized, expense_categorized = await analyzer.categorize_both_async(
+            income_items, expense_items, session_id=session_id
+        )
         
         # 🔥 데이터가 없으면 기본값 설정 (0원)
         if not income_categorized:
@@ -398,22 +647,7 @@ async def future_assets_analysis(session_id: str = Depends(get_current_user)):
             }
         else:
             # 유사 패턴 없음 → GPT 호출
-            content = redis_client.hgetall(session_id)
-            pairs = []
-            for k_bytes, v_bytes in content.items():
-                try:
-                    if k_bytes == "USER_TOKEN":
-                        continue
-                    
-                    key_plain = crypto.dec_data(k_bytes)
-                    val_plain = crypto.dec_data(v_bytes)
-                    
-                    _, field_name = key_plain.split(':', 1)
-                    pairs.append(f"{field_name}: {val_plain}")
-                except ValueError:
-                    continue
-            
-            data_str = ", ".join(pairs)
+            data_str = snapshot.data_str()
             
             # 🔥 데이터가 없으면 기본값 설정 (소득/지출 0원)
             if not data_str or data_str.strip() == "":
@@ -424,10 +658,7 @@ async def future_assets_analysis(session_id: str = Depends(get_current_user)):
             gpt_advice = await qa_on_document(data_str, question, role)
             
             # AI 응답 전처리
-            gpt_advice = gpt_advice.replace("**", "")
-            gpt_advice = gpt_advice.replace("*", "")
-            gpt_advice = re.sub(r'※.*', '', gpt_advice)
-            gpt_advice = re.sub(r'---.*', '', gpt_advice, flags=re.DOTALL)
+            gpt_advice = clean_llm_output(gpt_advice)
             
             # 3. GPT 조언 저장
             FutureAssetsLearningService.save_gpt_advice(pattern, gpt_advice)
@@ -455,39 +686,15 @@ async def future_assets_ai_detailed(session_id: str = Depends(get_current_user))
     학습된 조언 대신 GPT로 새롭게 분석
     """
     try:
-        # Redis에서 데이터 가져오기
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-                
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-                
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-            except ValueError:
-                continue
-        
-        data_str = ", ".join(pairs)
-        
-        # 🔥 데이터가 없으면 기본값 설정 (소득/지출 0원)
-        if not data_str or data_str.strip() == "":
-            data_str = "월 소득: 0원, 월 지출: 0원, 저축액: 0원"
-        
+        data_str = await _future_assets_data_str(session_id)
+
         # GPT 호출
         question, role = PromptTemplates.get_future_assets_prompt()
         gpt_advice = await qa_on_document(data_str, question, role)
-        
+
         # AI 응답 전처리
-        gpt_advice = gpt_advice.replace("**", "")
-        gpt_advice = gpt_advice.replace("*", "")
-        gpt_advice = re.sub(r'※.*', '', gpt_advice)
-        gpt_advice = re.sub(r'---.*', '', gpt_advice, flags=re.DOTALL)
-        
+        gpt_advice = clean_llm_output(gpt_advice)
+
         return {
             "success": True,
             "method": "gpt_detailed",
@@ -498,6 +705,37 @@ async def future_assets_ai_detailed(session_id: str = Depends(get_current_user))
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
 
+@documents_multi_agents_router.post("/future-assets-ai-detailed/stream")
+@log_util.logging_decorator
+async def future_assets_ai_detailed_stream(session_id: str = Depends(get_current_user)):
+    """
+    /future-assets-ai-detailed의 SSE 버전
+
+    비스트리밍 버전과 같이 매번 새로 분석한다. (캐시 사용 안 함)
+    """
+    try:
+        data_str = await _future_assets_data_str(session_id)
+        question, role = PromptTemplates.get_future_assets_prompt()
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
+
+    return _sse_response(
+        _stream_qa(data_str, question, role),
+        lambda text: {"success": True, "method": "gpt_detailed", "advice": clean_llm_output(text)}
+    )
+
+
+async def _future_assets_data_str(session_id: str) -> str:
+    # Redis에서 데이터 가져오기
+    snapshot = await session_snapshot_service.load_async(session_id)
+    data_str = snapshot.data_str()
+
+    # 🔥 데이터가 없으면 기본값 설정 (소득/지출 0원)
+    if not data_str or data_str.strip() == "":
+        data_str = "월 소득: 0원, 월 지출: 0원, 저축액: 0원"
+    return data_str
+
+
 # -----------------------
 # API 엔드포인트
 # 세액 공제 확인
@@ -506,50 +744,42 @@ async def future_assets_ai_detailed(session_id: str = Depends(get_current_user))
 @log_util.logging_decorator
 async def analyze_document(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
+        snapshot = await session_snapshot_service.load_async(session_id)
+        data_str = snapshot.data_str()
 
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
+        async def generate() -> str:
+            # 캐시 미스 - GPT 호출
+            question, role = PromptTemplates.get_tax_credit_prompt()
+            answer = await qa_on_document(data_str, question, role)
 
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
+            # AI 응답 전처리: 마크다운, 설명문 제거
+            return clean_llm_output(answer)
 
-        data_str = ", ".join(pairs)
-
-        # 🔥 캐시 확인
-        cache_key = AICache.generate_cache_key(data_str, "tax-credit")
-        cached_response = AICache.get_cached_response(cache_key)
+        # 🔥 캐시 확인 → 미스 시 생성 후 저장 (24시간, 동시 요청은 한 번만 호출)
+        return await AICache.get_or_generate(
+            data_str, "tax-credit", generate, ttl=86400, session_id=session_id
+        )
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
-        if cached_response:
-            return cached_response
 
-        # 캐시 미스 - GPT 호출
+@documents_multi_agents_router.get("/tax-credit/stream")
+@log_util.logging_decorator
+async def tax_credit_stream(session_id: str = Depends(get_current_user)):
+    """/tax-credit의 SSE 버전 (같은 캐시 키 사용)"""
+    try:
+        snapshot = await session_snapshot_service.load_async(session_id)
+        data_str = snapshot.data_str()
         question, role = PromptTemplates.get_tax_credit_prompt()
-        answer = await qa_on_document(data_str, question, role)
-
-        # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")   # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
-
-        # 🔥 캐시 저장 (24시간)
-        AICache.set_cached_response(cache_key, answer, ttl=86400)
-
-        return answer
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
+    chunks = AICache.stream_or_generate(
+        data_str, "tax-credit", lambda: _stream_qa(data_str, question, role),
+        finalize=clean_llm_output, ttl=86400, session_id=session_id
+    )
+    return _sse_response(chunks, lambda text: {"answer": clean_llm_output(text)})
+
 
 # -----------------------
 # API 엔드포인트
@@ -559,50 +789,42 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
 @log_util.logging_decorator
 async def analyze_document(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
+        snapshot = await session_snapshot_service.load_async(session_id)
+        data_str = snapshot.data_str()
 
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
+        async def generate() -> str:
+            # 캐시 미스 - GPT 호출
+            question, role = PromptTemplates.get_deduction_expectation_prompt()
+            answer = await qa_on_document(data_str, question, role)
 
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
+            # AI 응답 전처리: 마크다운, 설명문 제거
+            return clean_llm_output(answer)
 
-        data_str = ", ".join(pairs)
-
-        # 🔥 캐시 확인
-        cache_key = AICache.generate_cache_key(data_str, "deduction-expectation")
-        cached_response = AICache.get_cached_response(cache_key)
+        # 🔥 캐시 확인 → 미스 시 생성 후 저장 (24시간, 동시 요청은 한 번만 호출)
+        return await AICache.get_or_generate(
+            data_str, "deduction-expectation", generate, ttl=86400, session_id=session_id
+        )
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
-        if cached_response:
-            return cached_response
 
-        # 캐시 미스 - GPT 호출
+@documents_multi_agents_router.get("/deduction-expectation/stream")
+@log_util.logging_decorator
+async def deduction_expectation_stream(session_id: str = Depends(get_current_user)):
+    """/deduction-expectation의 SSE 버전 (같은 캐시 키 사용)"""
+    try:
+        snapshot = await session_snapshot_service.load_async(session_id)
+        data_str = snapshot.data_str()
         question, role = PromptTemplates.get_deduction_expectation_prompt()
-        answer = await qa_on_document(data_str, question, role)
-
-        # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")   # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
-
-        # 🔥 캐시 저장 (24시간)
-        AICache.set_cached_response(cache_key, answer, ttl=86400)
-
-        return answer
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
+    chunks = AICache.stream_or_generate(
+        data_str, "deduction-expectation", lambda: _stream_qa(data_str, question, role),
+        finalize=clean_llm_output, ttl=86400, session_id=session_id
+    )
+    return _sse_response(chunks, lambda text: {"answer": clean_llm_output(text)})
+
 
 # -----------------------
 # API 엔드포인트
@@ -612,25 +834,8 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
 @log_util.logging_decorator
 async def analyze_document(session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
-
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
-
-        data_str = ", ".join(pairs)
+        snapshot = await session_snapshot_service.load_async(session_id)
+        data_str = snapshot.data_str()
 
         answer = await qa_on_document(data_str,
                                       "주어진 문서 본문을 활용하여 연말정산에서 받을 수 있는 총 공제 예상 금액을 산출해줘. "
@@ -644,60 +849,62 @@ async def analyze_document(session_id: str = Depends(get_current_user)):
                                       )
 
         # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")  # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
+        answer = clean_llm_output(answer)
 
         return answer
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
+def _financial_guide_prompt(now_mon: int, tar_mon: int) -> Tuple[str, str]:
+    question = (
+        f"주어진 문서 본문을 활용하여 현재 내 자산이 {now_mon}이고, "
+        f"내가 목표로 하는 금액이 {tar_mon}일 때"
+        "현재 자산이 목표 금액을 달성하기 위해 할 수 있는 방법을 분석 해줘. "
+        "이 때 목표를 단기, 중기, 장기 목표로 나누고 "
+        "각 목표를 달성하기 위한 방법으로 리스크가 없는 방법, 리스크가 있는 방법, 리스크가 큰 방법으로 나눠서 설명해줘. "
+    )
+    role = (
+        "주어진 문서 본문의 자료를 토대로 질문에 답변하라."
+        "추가적인 질문을 요구하는 문장은 제외하라."
+        "-- 등으로 불필요한 줄나눔은 없게 하라."
+    )
+    return question, role
+
+
 @documents_multi_agents_router.get("/financial-guide")
 @log_util.logging_decorator
 async def analyze_document(now_mon: int, tar_mon: int, session_id: str = Depends(get_current_user)):
     try:
-        content = redis_client.hgetall(session_id)
-        pairs = []
-        for k_bytes, v_bytes in content.items():
-            try:
-                if k_bytes == "USER_TOKEN":
-                    continue
-
-                key_plain = crypto.dec_data(k_bytes)
-                val_plain = crypto.dec_data(v_bytes)
-
-                # key_plain은 "type:field" 형태 — 원하는 대로 처리
-                _, field_name = key_plain.split(':', 1)
-                pairs.append(f"{field_name}: {val_plain}")
+        snapshot = await session_snapshot_service.load_async(session_id)
+        data_str = snapshot.data_str()
 
-            except ValueError as e:
-                # 복호화 실패 시 로깅/무시
-                continue
-
-        data_str = ", ".join(pairs)
-
-        answer = await qa_on_document(data_str,
-                                      f"주어진 문서 본문을 활용하여 현재 내 자산이 {now_mon}이고, "
-                                      f"내가 목표로 하는 금액이 {tar_mon}일 때"
-                                      "현재 자산이 목표 금액을 달성하기 위해 할 수 있는 방법을 분석 해줘. "
-                                      "이 때 목표를 단기, 중기, 장기 목표로 나누고 "
-                                      "각 목표를 달성하기 위한 방법으로 리스크가 없는 방법, 리스크가 있는 방법, 리스크가 큰 방법으로 나눠서 설명해줘. ",
-                                      "주어진 문서 본문의 자료를 토대로 질문에 답변하라."
-                                      "추가적인 질문을 요구하는 문장은 제외하라."
-                                      "-- 등으로 불필요한 줄나눔은 없게 하라."
-                                      )
+        question, role = _financial_guide_prompt(now_mon, tar_mon)
+        answer = await qa_on_document(data_str, question, role)
 
         # AI 응답 전처리: 마크다운, 설명문 제거
-        answer = answer.replace("**", "")  # 볼드 제거
-        answer = answer.replace("*", "")  # 이탤릭 제거
-        answer = re.sub(r'※.*', '', answer)  # 주석 제거
-        answer = re.sub(r'---.*', '', answer, flags=re.DOTALL)  # 구분선 이후 제거
+        return clean_llm_output(answer)
+    except Exception as e:
+        raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
-        return answer
+
+@documents_multi_agents_router.get("/financial-guide/stream")
+@log_util.logging_decorator
+async def financial_guide_stream(now_mon: int, tar_mon: int, session_id: str = Depends(get_current_user)):
+    """/financial-guide의 SSE 버전 (현재/목표 금액까지 캐시 키에 포함)"""
+    try:
+        snapshot = await session_snapshot_service.load_async(session_id)
+        data_str = snapshot.data_str()
+        question, role = _financial_guide_prompt(now_mon, tar_mon)
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
+    chunks = AICache.stream_or_generate(
+        f"{data_str}, 현재 자산: {now_mon}, 목표 금액: {tar_mon}", "financial-guide",
+        lambda: _stream_qa(data_str, question, role),
+        finalize=clean_llm_output, ttl=86400, session_id=session_id
+    )
+    return _sse_response(chunks, lambda text: {"answer": clean_llm_output(text)})
+
 # -----------------------
 # 세션 로그인시 csrf_token 발급
 # -----------------------
@@ -742,73 +949,32 @@ async def insert_document(
         # 세션 처리
         if not session_id:
             session_id = str(uuid.uuid4())
-            redis_client.hset(session_id, "USER_TOKEN", "GUEST")
-            redis_client.expire(session_id, 24 * 60 * 60)
+            await async_redis_client.hset(session_id, "USER_TOKEN", "GUEST")
+            await async_redis_client.expire(session_id, 24 * 60 * 60)
 
-        # 암호화해서 저장 및 데이터 수집
+        # 데이터 수집 후 암호화하여 일괄 저장
         extracted_items = {}
         for field_key, field_value in request.data.items():
             value_clean = field_value.replace(",", "").strip()
 
-            # 암호화된 키/값 생성
-            encrypted_key = crypto.enc_data(f"{request.document_type}:{field_key}")
-            encrypted_value = crypto.enc_data(value_clean)
-
-            redis_client.hset(
-                session_id,
-                encrypted_key,
-                encrypted_value
-            )
-
-            # 저장 확인
-            saved_value = redis_client.hget(session_id, encrypted_key)
-            logger.debug(f"[DEBUG] Saved successfully: {saved_value is not None}")
-
             # 응답용 데이터 수집
             extracted_items[field_key] = value_clean
 
-        redis_client.expire(session_id, session_expire_seconds)
+        await session_writer.write_fields_async(
+            session_id, request.document_type, extracted_items, ttl=session_expire_seconds
+        )
 
         # AI로 카테고리 분류
         from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
 
         analyzer = FinancialAnalyzerService()
 
-        # type에 따라 소득/지출 분류
-        categorized_data = {}
-        if "소득" in request.document_type or "income" in request.document_type.lower():
-            categorized_data = analyzer._categorize_income(extracted_items)
-        elif "지출" in request.document_type or "expense" in request.document_type.lower():
-            categorized_data = analyzer._categorize_expense(extracted_items)
-        else:
-            categorized_data = {"raw_items": extracted_items}
+        categorized_data = await _categorize_by_doc_type(
+            analyzer, extracted_items, request.document_type, session_id
+        )
 
-        # 🔥 로그인한 사용자인 경우 DB에 자동 저장
-        db_save_result = None
-        try:
-            user_token = redis_client.hget(session_id, "USER_TOKEN")
-            if user_token:
-                if isinstance(user_token, bytes):
-                    user_token = user_token.decode('utf-8')
-                
-                # GUEST가 아닌 로그인 사용자만 DB 저장
-                if user_token != "GUEST":
-                    from datetime import datetime
-                    from ieinfo.application.usecase.ie_info_usecase import IEInfoUseCase
-                    
-                    ie_usecase = IEInfoUseCase.get_instance()
-                    now = datetime.now()
-                    db_save_result = ie_usecase.save_ie_data_from_redis(
-                        session_id=session_id,
-                        year=now.year,
-                        month=now.month
-                    )
-                    logger.info(f"DB save result: {db_save_result}")
-        except Exception as db_error:
-            logger.error(f"Failed to save to DB (non-critical): {str(db_error)}")
-            # DB 저장 실패해도 API 응답은 정상 반환 (Redis 저장은 성공했으므로)
-            import traceback
-            traceback.print_exc()
+        # 🔥 로그인한 사용자인 경우 DB 자동 저장 예약 (백그라운드, 연속 업로드는 병합)
+        db_save_schedule = await _schedule_ie_save_if_member(session_id)
 
         response_data = {
             "success": True,
@@ -819,17 +985,8 @@ async def insert_document(
             "categorized_data": categorized_data,
             "expire_in_seconds": session_expire_seconds
         }
-        
-        # DB 저장 결과 추가 (있는 경우)
-        if db_save_result:
-            response_data["db_saved"] = db_save_result["success"]
-            if db_save_result["success"]:
-                response_data["db_save_info"] = {
-                    "saved_count": db_save_result.get("saved_count", 0),
-                    "year": db_save_result.get("year"),
-                    "month": db_save_result.get("month")
-                }
-        
+        _attach_db_save_schedule(response_data, db_save_schedule)
+
         return response_data
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -843,7 +1000,7 @@ async def insert_document(
 async def debug_redis_data(session_id: str = Depends(get_current_user)):
     """Redis에 저장된 원본 데이터 확인 (디버깅용)"""
     try:
-        raw_data = redis_client.hgetall(session_id)
+        raw_data = await async_redis_client.hgetall(session_id)
 
         result = {
             "session_id": session_id,
@@ -871,6 +1028,23 @@ async def debug_redis_data(session_id: str = Depends(get_current_user)):
                         "value": "[REDACTED]",  # 보안을 위해 숨김
                         "encrypted": False
                     })
+                elif key_str == FIN_DOC_FIELD:
+                    # 단일 문서 포맷 (SESSION_STORE_FORMAT=blob)
+                    try:
+                        result["keys"].append({
+                            "key": key_str,
+                            "items_decrypted": [
+                                f"{doc_type}:{field_name}={value}"
+                                for doc_type, field_name, value in decode_document(value_str)
+                            ],
+                            "encrypted": True
+                        })
+                    except Exception as decrypt_err:
+                        result["keys"].append({
+                            "key": key_str,
+                            "error": f"복호화 실패: {str(decrypt_err)}",
+                            "encrypted": True
+                        })
                 else:
                     # 복호화 시도
                     try:
@@ -912,56 +1086,19 @@ async def get_combined_result(session_id: str = Depends(get_current_user)):
     try:
         logger.debug("[DEBUG] /result called with session_id")
 
-        # Redis에서 모든 데이터 가져오기
-        encrypted_data = redis_client.hgetall(session_id)
+        # Redis에서 모든 데이터 가져오기 (요청당 1회 복호화)
+        snapshot = await session_snapshot_service.load_async(session_id)
 
         # 🔥 버그 수정: USER_TOKEN만 있는 경우도 빈 데이터로 간주
-        if not encrypted_data or len(encrypted_data) <= 1:
+        if snapshot.is_empty:
             raise HTTPException(
                 status_code=404,
                 detail="저장된 재무 데이터가 없습니다. 문서를 먼저 업로드해주세요."
             )
 
-        # 복호화 및 소득/지출 분리
-        income_items = {}
-        expense_items = {}
-
-        for key_bytes, value_bytes in encrypted_data.items():
-            try:
-                # bytes를 문자열로 변환
-                if isinstance(key_bytes, bytes):
-                    key_str = key_bytes.decode('utf-8')
-                else:
-                    key_str = str(key_bytes)
-
-                if isinstance(value_bytes, bytes):
-                    value_str = value_bytes.decode('utf-8')
-                else:
-                    value_str = str(value_bytes)
-
-                # USER_TOKEN 제외
-                if key_str == "USER_TOKEN":
-                    logger.debug("[DEBUG] Skipping USER_TOKEN")
-                    continue
-
-                key_plain = crypto.dec_data(key_str)
-                value_plain = crypto.dec_data(value_str)
-
-                # "타입:필드명" 형태 파싱
-                if ":" in key_plain:
-                    doc_type, field_name = key_plain.split(":", 1)
-
-                    if "소득" in doc_type or "income" in doc_type.lower():
-                        income_items[field_name] = value_plain
-                    elif "지출" in doc_type or "expense" in doc_type.lower():
-                        expense_items[field_name] = value_plain
-            except Exception as decrypt_error:
-                logger.error(
-                    f"[ERROR] Decryption failed for key: {key_str[:50] if 'key_str' in locals() else 'unknown'}")
-                logger.error(f"[ERROR] Error: {str(decrypt_error)}")
-                import traceback
-                traceback.print_exc()
-                continue
+        # 소득/지출 분리 (사본이므로 아래 재분류에서 수정해도 됨)
+        income_items = snapshot.income_items()
+        expense_items = snapshot.expense_items()
 
         logger.debug(f"[DEBUG] Total income_items: {len(income_items)}")
         logger.debug(f"[DEBUG] Total expense_items: {len(expense_items)}")
@@ -1002,8 +1139,10 @@ async def get_combined_result(session_id: str = Depends(get_current_user)):
 
         analyzer = FinancialAnalyzerService()
 
-        income_categorized = analyzer._categorize_income(income_items) if income_items else {}
-        expense_categorized = analyzer._categorize_expense(expense_items) if expense_items else {}
+        # 소득/지출 분류를 한 번의 GPT 호출로 실행
+        income_categorized, expense_categorized = await analyzer.categorize_both_async(
+            income_items, expense_items, session_id=session_id
+        )
 
         # 요약 정보 계산 (안전한 타입 변환) - 한글 키 우선, 없으면 영문 키
         try:
@@ -1057,120 +1196,106 @@ async def get_combined_result(session_id: str = Depends(get_current_user)):
 # -----------------------
 # AI 기반 자세한 자산 분배 추천 (선택적)
 # -----------------------
-@documents_multi_agents_router.post("/analyze-ai-detailed")
-@log_util.logging_decorator
-async def analyze_with_ai_detailed(session_id: str = Depends(get_current_user)):
-    """
-    AI Agent를 사용하여 자세한 자산 분배 추천 제공
-    사용자가 명시적으로 요청할 때만 호출됨
+async def _categorize_for_ai_detailed(session_id: str):
     """
-    try:
-        logger.debug("[DEBUG] /analyze-ai-detailed called")
-
-        # Redis에서 데이터 가져오기 (동일한 로직)
-        encrypted_data = redis_client.hgetall(session_id)
+    /analyze-ai-detailed 공통 단계: 세션 데이터 → 소득/지출 분류 + 요약
 
-        if not encrypted_data or len(encrypted_data) <= 1:
-            raise HTTPException(
-                status_code=404,
-                detail="저장된 재무 데이터가 없습니다. 문서를 먼저 업로드해주세요."
-            )
-
-        # 복호화 및 소득/지출 분리
-        income_items = {}
-        expense_items = {}
+    Returns:
+        (analyzer, 소득 분류 결과, 지출 분류 결과, 요약)
+    """
+    # Redis에서 데이터 가져오기 (요청당 1회 복호화)
+    snapshot = await session_snapshot_service.load_async(session_id)
 
-        for key_bytes, value_bytes in encrypted_data.items():
-            try:
-                if isinstance(key_bytes, bytes):
-                    key_str = key_bytes.decode('utf-8')
-                else:
-                    key_str = str(key_bytes)
+    if snapshot.is_empty:
+        raise HTTPException(
+            status_code=404,
+            detail="저장된 재무 데이터가 없습니다. 문서를 먼저 업로드해주세요."
+        )
 
-                if isinstance(value_bytes, bytes):
-                    value_str = value_bytes.decode('utf-8')
-                else:
-                    value_str = str(value_bytes)
+    # 소득/지출 분리 (사본이므로 아래 재분류에서 수정해도 됨)
+    income_items = snapshot.income_items()
+    expense_items = snapshot.expense_items()
 
-                if key_str == "USER_TOKEN":
-                    continue
+    # 소득 항목 중 지출성 항목 재분류 (동일한 로직)
+    insurance_keywords = ["보험료", "보험", "연금"]
+    tax_keywords = ["소득세", "지방소득세", "세액"]
 
-                key_plain = crypto.dec_data(key_str)
-                value_plain = crypto.dec_data(value_str)
+    items_to_move = []
+    for field_name, value in list(income_items.items()):
+        should_move = False
 
-                if ":" in key_plain:
-                    doc_type, field_name = key_plain.split(":", 1)
+        if any(keyword in field_name for keyword in insurance_keywords):
+            if "공제" not in field_name and "대상" not in field_name:
+                should_move = True
 
-                    if "소득" in doc_type or "income" in doc_type.lower():
-                        income_items[field_name] = value_plain
-                    elif "지출" in doc_type or "expense" in doc_type.lower():
-                        expense_items[field_name] = value_plain
-            except Exception as decrypt_error:
-                logger.error(f"[ERROR] Decryption failed: {str(decrypt_error)}")
-                continue
+        if any(keyword in field_name for keyword in tax_keywords):
+            if "공제" not in field_name and "과세표준" not in field_name and "산출" not in field_name:
+                should_move = True
 
-        # 소득 항목 중 지출성 항목 재분류 (동일한 로직)
-        insurance_keywords = ["보험료", "보험", "연금"]
-        tax_keywords = ["소득세", "지방소득세", "세액"]
+        if should_move:
+            items_to_move.append(field_name)
 
-        items_to_move = []
-        for field_name, value in list(income_items.items()):
-            should_move = False
+    for field_name in items_to_move:
+        expense_items[field_name] = income_items.pop(field_name)
 
-            if any(keyword in field_name for keyword in insurance_keywords):
-                if "공제" not in field_name and "대상" not in field_name:
-                    should_move = True
+    # AI로 카테고리 분류
+    from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
 
-            if any(keyword in field_name for keyword in tax_keywords):
-                if "공제" not in field_name and "과세표준" not in field_name and "산출" not in field_name:
-                    should_move = True
+    analyzer = FinancialAnalyzerService()
 
-            if should_move:
-                items_to_move.append(field_name)
+    # 소득/지출 분류를 한 번의 GPT 호출로 실행
+    income_categorized, expense_categorized = await analyzer.categorize_both_async(
+        income_items, expense_items, session_id=session_id
+    )
 
-        for field_name in items_to_move:
-            expense_items[field_name] = income_items.pop(field_name)
+    # 요약 정보 계산
+    try:
+        total_income = int(income_categorized.get("총소득") or income_categorized.get("total_income", 0)) if (
+                    income_categorized.get("총소득") or income_categorized.get("total_income")) else 0
+    except (ValueError, TypeError) as e:
+        logger.error(f"[ERROR] Failed to calculate total_income: {e}")
+        total_income = 0
 
-        # AI로 카테고리 분류
-        from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
+    try:
+        total_expense = int(expense_categorized.get("총지출") or expense_categorized.get("total_expense", 0)) if (
+                    expense_categorized.get("총지출") or expense_categorized.get("total_expense")) else 0
+    except (ValueError, TypeError) as e:
+        logger.error(f"[ERROR] Failed to calculate total_expense: {e}")
+        total_expense = 0
 
-        analyzer = FinancialAnalyzerService()
+    surplus = total_income - total_expense
+    surplus_ratio = (surplus / total_income * 100) if total_income > 0 else 0
 
-        income_categorized = analyzer._categorize_income(income_items) if income_items else {}
-        expense_categorized = analyzer._categorize_expense(expense_items) if expense_items else {}
+    summary = {
+        "total_income": total_income,
+        "total_expense": total_expense,
+        "surplus": surplus,
+        "surplus_ratio": round(surplus_ratio, 2),
+        "status": "흑자" if surplus > 0 else "적자" if surplus < 0 else "수지균형"
+    }
+    return analyzer, income_categorized, expense_categorized, summary
 
-        # 요약 정보 계산
-        try:
-            total_income = int(income_categorized.get("총소득") or income_categorized.get("total_income", 0)) if (
-                        income_categorized.get("총소득") or income_categorized.get("total_income")) else 0
-        except (ValueError, TypeError) as e:
-            logger.error(f"[ERROR] Failed to calculate total_income: {e}")
-            total_income = 0
 
-        try:
-            total_expense = int(expense_categorized.get("총지출") or expense_categorized.get("total_expense", 0)) if (
-                        expense_categorized.get("총지출") or expense_categorized.get("total_expense")) else 0
-        except (ValueError, TypeError) as e:
-            logger.error(f"[ERROR] Failed to calculate total_expense: {e}")
-            total_expense = 0
+@documents_multi_agents_router.post("/analyze-ai-detailed")
+@log_util.logging_decorator
+async def analyze_with_ai_detailed(session_id: str = Depends(get_current_user)):
+    """
+    AI Agent를 사용하여 자세한 자산 분배 추천 제공
+    사용자가 명시적으로 요청할 때만 호출됨
+    """
+    try:
+        logger.debug("[DEBUG] /analyze-ai-detailed called")
 
-        surplus = total_income - total_expense
-        surplus_ratio = (surplus / total_income * 100) if total_income > 0 else 0
+        analyzer, income_categorized, expense_categorized, summary = await _categorize_for_ai_detailed(session_id)
 
         # 🔥 AI 기반 자세한 추천 (use_ai=True)
-        recommendations = analyzer._generate_recommendations(income_categorized, expense_categorized, use_ai=True)
+        recommendations = await analyzer._generate_recommendations_async(income_categorized, expense_categorized, use_ai=True)
 
         # 응답 구조
         return {
             "success": True,
             "method": "ai_detailed",
-            "summary": {
-                "total_income": total_income,
-                "total_expense": total_expense,
-                "surplus": surplus,
-                "surplus_ratio": round(surplus_ratio, 2),
-                "status": "흑자" if surplus > 0 else "적자" if surplus < 0 else "수지균형"
-            },
+            "summary": summary,
             "recommendations": recommendations  # AI 기반 자세한 추천
         }
 
@@ -1180,47 +1305,59 @@ async def analyze_with_ai_detailed(session_id: str = Depends(get_current_user)):
         raise HTTPException(status_code=500, detail=f"{type(e).__name__}: {str(e)}")
 
 
-# -----------------------
-# API 엔드포인트 - 세액공제 가능 항목 체크리스트
-# -----------------------
-@documents_multi_agents_router.get("/tax-credit/checklist")
-async def tax_credit_checklist_markdown(session_id: str = Depends(get_current_user)):
+@documents_multi_agents_router.post("/analyze-ai-detailed/stream")
+@log_util.logging_decorator
+async def analyze_with_ai_detailed_stream(session_id: str = Depends(get_current_user)):
+    """
+    /analyze-ai-detailed의 SSE 버전
+
+    분류가 끝나면 summary 이벤트를 먼저 보내고, 추천(JSON) 생성 조각을 token 이벤트로 보낸다.
+    비스트리밍 버전과 같이 추천은 매번 새로 생성한다. (캐시 사용 안 함)
+    """
     try:
-        content = redis_client.hgetall(session_id)
+        analyzer, income_categorized, expense_categorized, summary = await _categorize_for_ai_detailed(session_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{type(e).__name__}: {str(e)}")
 
-        if not content:
-            return "저장된 재무 데이터가 없습니다."
+    if not income_categorized or not expense_categorized:
+        chunks = _empty_stream()
+    else:
+        chunks = analyzer.stream_recommendations_async(income_categorized, expense_categorized)
 
-        pairs = []
-        for k_bytes, v_bytes in content.items():
+    def done_payload(text: str) -> Dict:
+        if not text:
+            recommendations = {"message": "소득 또는 지출 데이터가 부족합니다"}
+        else:
             try:
-                if k_bytes == "USER_TOKEN":
-                    continue
+                recommendations = analyzer._parse_recommendation(text)
+            except Exception as e:
+                logger.error(f"[ERROR] Recommendation generation failed: {str(e)}")
+                recommendations = {"error": str(e)}
+        return {"success": True, "method": "ai_detailed", "summary": summary, "recommendations": recommendations}
 
-                key_plain = crypto.dec_data(
-                    k_bytes.decode("utf-8") if isinstance(k_bytes, bytes) else k_bytes
-                )
-                val_plain = crypto.dec_data(
-                    v_bytes.decode("utf-8") if isinstance(v_bytes, bytes) else v_bytes
-                )
+    return _sse_response(chunks, done_payload, prelude={"summary": summary})
 
-                # "지출:월세" → 월세
-                _, field_name = key_plain.split(":", 1)
-                pairs.append(f"{field_name}: {val_plain}")
 
-            except Exception:
-                continue
+async def _empty_stream() -> AsyncIterator[str]:
+    return
+    yield
 
-        data_str = ", ".join(pairs)
 
-        # 🔥 캐시 확인
-        cache_key = AICache.generate_cache_key(data_str, "tax-credit-checklist")
-        cached_response = AICache.get_cached_response(cache_key)
+# -----------------------
+# API 엔드포인트 - 세액공제 가능 항목 체크리스트
+# -----------------------
+@documents_multi_agents_router.get("/tax-credit/checklist")
+async def tax_credit_checklist_markdown(session_id: str = Depends(get_current_user)):
+    try:
+        snapshot = await session_snapshot_service.load_async(session_id)
+
+        if snapshot.field_count == 0:
+            return "저장된 재무 데이터가 없습니다."
 
-        if cached_response:
-            return cached_response
+        data_str = snapshot.data_str()
 
-        # 캐시 미스 - GPT 호출
         tax_items_text = """
 1. 자녀 세액공제
 2. 연금계좌 세액공제
@@ -1296,17 +1433,19 @@ async def tax_credit_checklist_markdown(session_id: str = Depends(get_current_us
 
 """
 
-        answer = await qa_on_document(
+        # 🔥 캐시 확인 → 미스 시 GPT 호출 후 저장 (24시간, 동시 요청은 한 번만 호출)
+        return await AICache.get_or_generate(
             data_str,
-            question,
-            "출력은 반드시 “설명 섹션 + 마크다운 표” 형태로만 작성하라."
+            "tax-credit-checklist",
+            lambda: qa_on_document(
+                data_str,
+                question,
+                "출력은 반드시 “설명 섹션 + 마크다운 표” 형태로만 작성하라."
+            ),
+            ttl=86400,
+            session_id=session_id
         )
 
-        # 🔥 캐시 저장 (24시간)
-        AICache.set_cached_response(cache_key, answer, ttl=86400)
-
-        return answer
-
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
 
@@ -1319,10 +1458,11 @@ async def tax_credit_checklist_markdown(session_id: str = Depends(get_current_us
 async def get_cache_stats(session_id: str = Depends(get_current_user)):
     """캐시 통계 조회"""
     try:
-        stats = AICache.get_cache_stats()
+        stats = await AICache.get_cache_stats_async()
         return {
             "success": True,
-            "stats": stats
+            "stats": stats,
+            "template_extraction": template_extractor.get_stats()
         }
     except Exception as e:
         raise HTTPException(500, f"{type(e).__name__}: {str(e)}")
@@ -1333,7 +1473,7 @@ async def get_cache_stats(session_id: str = Depends(get_current_user)):
 async def clear_user_cache(session_id: str = Depends(get_current_user)):
     """사용자의 모든 캐시 삭제"""
     try:
-        deleted_count = AICache.invalidate_user_cache(session_id)
+        deleted_count = await AICache.invalidate_user_cache_async(session_id)
         return {
             "success": True,
             "message": f"{deleted_count}개의 캐시 항목이 삭제되었습니다.",
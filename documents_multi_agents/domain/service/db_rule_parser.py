@@ -1,15 +1,14 @@
 """
 DB 기반 규칙 파서
-IE_RULE 테이블에서 키워드를 동적으로 로드하여 분류
+IE_RULE 키워드로 분류 (키워드는 프로세스 공용 IERuleIndex에서 조회)
 """
 
 import re
 from typing import Optional, Tuple, List
 from dataclasses import dataclass
 
-from ieinfo.infrastructure.repository.ie_rule_repository_impl import IERuleRepositoryImpl
+from documents_multi_agents.domain.service.ie_rule_index import IERuleIndex
 from ieinfo.infrastructure.orm.ie_info import IEType
-from config.database.session import get_db_session
 from util.log.log import Log
 
 logger = Log.get_logger()
@@ -23,17 +22,16 @@ class ParsedTransaction:
     transaction_type: str  # 'income' or 'expense'
     confidence: float  # 신뢰도 (0.0 ~ 1.0)
     matched_keyword: str  # 매칭된 키워드
+    category: Optional[str] = None  # 규칙의 세부 카테고리 (없으면 GPT 분류 필요)
+    sub_category: Optional[str] = None  # 규칙의 하위 카테고리 (예: "급여", "보험")
 
 
 class DBRuleBasedParser:
     """DB 기반 소득/지출 분류 파서"""
     
     def __init__(self):
-        self.db_session = get_db_session()
-        self.rule_repo = IERuleRepositoryImpl(self.db_session)
-        
-        # DB에서 키워드 로드
-        self._load_keywords_from_db()
+        # 규칙은 요청마다 DB에서 읽지 않고 공용 색인 사용
+        self.rule_index = IERuleIndex.get_instance()
         
         # 금액 패턴
         self.amount_patterns = [
@@ -43,30 +41,26 @@ class DBRuleBasedParser:
             r'KRW\s*(\d{1,3}(?:,\d{3})+)', # KRW 1,000,000
         ]
     
-    def _load_keywords_from_db(self):
-        """DB에서 키워드 로드"""
-        try:
-            self.income_keywords = self.rule_repo.find_all_keywords_by_type(IEType.INCOME)
-            self.expense_keywords = self.rule_repo.find_all_keywords_by_type(IEType.EXPENSE)
-            
-            logger.info(f"📚 [DB] 규칙 로드 완료: 소득 {len(self.income_keywords)}개, 지출 {len(self.expense_keywords)}개")
-            
-        except Exception as e:
-            logger.error(f"[DB] 규칙 로드 실패: {str(e)}")
-            self.income_keywords = []
-            self.expense_keywords = []
+    @property
+    def income_keywords(self) -> Tuple[str, ...]:
+        return self.rule_index.snapshot().income_keywords
+    
+    @property
+    def expense_keywords(self) -> Tuple[str, ...]:
+        return self.rule_index.snapshot().expense_keywords
     
     def reload_keywords(self):
-        """키워드 재로드 (GPT가 새 키워드 추가 후 호출)"""
+        """키워드 전체 재로드 - 다른 워커에도 버전 증가로 알림"""
         logger.info("🔄 [DB] 규칙 재로드 중...")
-        self._load_keywords_from_db()
+        self.rule_index.publish()
+        self.rule_index.load()
     
     def parse_line(self, line: str, doc_type: str = None) -> Optional[ParsedTransaction]:
         """
         한 줄의 텍스트에서 거래 정보 파싱
         
         Args:
-            line: "급여: 3000000" 같은 형식의 텍스트
+            line: "급여: 3,000,000원" 같은 형식의 텍스트
             doc_type: 문서 타입 힌트 ('소득', '지출', None)
         
         Returns:
@@ -83,7 +77,32 @@ class DBRuleBasedParser:
             return None
         
         # 3. DB 기반 분류
-        trans_type, confidence, matched_keyword = self._classify_with_db(
+        return self._classify_parsed(field_name, amount, doc_type)
+    
+    def parse_item(self, field_name: str, amount: str, doc_type: str = None) -> Optional[ParsedTransaction]:
+        """
+        이미 항목명/금액으로 나뉜 추출 결과 분류 ("3000000"처럼 단위 없는 금액)
+        
+        Args:
+            field_name: 항목명 (예: "기본급")
+            amount: 금액 문자열 (예: "3000000", "3,000,000")
+            doc_type: 문서 타입 힌트 ('소득', '지출', None)
+        
+        Returns:
+            ParsedTransaction 또는 None
+        """
+        amount = str(amount).replace(',', '').strip()
+        if not amount.isdigit():
+            return None
+        
+        field_name = field_name.strip().replace('_', ' ')
+        if not field_name:
+            return None
+        
+        return self._classify_parsed(field_name, amount, doc_type)
+    
+    def _classify_parsed(self, field_name: str, amount: str, doc_type: Optional[str]) -> Optional[ParsedTransaction]:
+        trans_type, confidence, matched_keyword, rule = self._classify_with_db(
             field_name, 
             doc_type
         )
@@ -96,7 +115,9 @@ class DBRuleBasedParser:
             amount=amount,
             transaction_type=trans_type,
             confidence=confidence,
-            matched_keyword=matched_keyword
+            matched_keyword=matched_keyword,
+            category=rule["category"],
+            sub_category=rule["sub_category"]
         )
     
     def _extract_amount(self, text: str) -> Optional[str]:
@@ -128,42 +149,33 @@ class DBRuleBasedParser:
         self, 
         field_name: str, 
         doc_type_hint: Optional[str] = None
-    ) -> Tuple[Optional[str], float, str]:
+    ) -> Tuple[Optional[str], float, str, Optional[dict]]:
         """
         DB 키워드 기반 분류
         
         Returns:
-            (transaction_type, confidence, matched_keyword)
+            (transaction_type, confidence, matched_keyword, 매칭된 규칙)
         """
-        field_lower = field_name.lower()
-        
-        # === 소득 키워드 매칭 ===
-        for keyword in self.income_keywords:
-            if keyword.lower() in field_lower:
-                confidence = 1.0  # DB에 있는 키워드는 100% 신뢰
-                logger.debug(f"✅ [DB-RULE] 소득 매칭: '{keyword}' in '{field_name}' (신뢰도: 1.0)")
-                return 'income', confidence, keyword
+        # 모든 키워드를 한 번에 매칭 (우선순위 → 가장 긴 키워드, 같으면 소득 → 지출 순)
+        match = self.rule_index.snapshot().automaton.longest_match(field_name)
         
-        # === 지출 키워드 매칭 ===
-        for keyword in self.expense_keywords:
-            if keyword.lower() in field_lower:
-                confidence = 1.0
-                logger.debug(f"✅ [DB-RULE] 지출 매칭: '{keyword}' in '{field_name}' (신뢰도: 1.0)")
-                return 'expense', confidence, keyword
+        if match:
+            keyword, rule = match
+            trans_type = 'income' if rule["ie_type"] == IEType.INCOME else 'expense'
+            confidence = 1.0  # DB에 있는 키워드는 100% 신뢰
+            label = '소득' if trans_type == 'income' else '지출'
+            logger.debug(f"✅ [DB-RULE] {label} 매칭: '{keyword}' in '{field_name}' (신뢰도: 1.0)")
+            return trans_type, confidence, keyword, rule
         
         # === 매칭 실패 ===
         logger.debug(f"❌ [DB-RULE] 키워드 없음: '{field_name}' → GPT 필요")
-        return None, 0.0, ""
+        return None, 0.0, "", None
     
     def get_statistics(self) -> dict:
         """현재 규칙 통계"""
+        snapshot = self.rule_index.snapshot()
         return {
-            'income_keywords': len(self.income_keywords),
-            'expense_keywords': len(self.expense_keywords),
-            'total_keywords': len(self.income_keywords) + len(self.expense_keywords)
+            'income_keywords': len(snapshot.income_keywords),
+            'expense_keywords': len(snapshot.expense_keywords),
+            'total_keywords': len(snapshot.income_keywords) + len(snapshot.expense_keywords)
         }
-    
-    def __del__(self):
-        """소멸자: DB 세션 종료"""
-        if hasattr(self, 'db_session'):
-            self.db_session.close()
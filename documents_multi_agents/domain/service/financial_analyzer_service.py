@@ -1,13 +1,13 @@
+import asyncio
 import json
-import os
 import re
 import traceback
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
 
 from dotenv import load_dotenv
-from openai import OpenAI
 
 from util.cache.ai_cache import AICache
+from util.llm.llm_gateway import LLMGateway
 from util.log.log import Log
 from documents_multi_agents.domain.service.hybrid_parser import HybridParser
 
@@ -16,13 +16,102 @@ logger = Log.get_logger()
 log_util = Log()
 
 
+# 분류 기준/응답 예시 (단일 분류 프롬프트와 통합 분류 프롬프트 공용)
+INCOME_CATEGORY_CRITERIA = """1. 고정소득: 매월 일정하게 들어오는 소득
+   - 급여, 월급, 연봉
+   - 식대 (고정)
+   - 정기 수당
+
+2. 변동소득: 불규칙적으로 들어오는 소득
+   - 상여금, 보너스, 성과급
+   - 수당 (변동)
+   - 야근수당, 연장근로수당
+
+3. 기타소득: 부가 수입
+   - 이자소득, 배당소득
+   - 임대소득
+   - 프리랜서 수입"""
+
+INCOME_CATEGORY_EXAMPLE = """{
+  "고정소득": {
+    "급여": 3000000,
+    "식대": 200000
+  },
+  "변동소득": {
+    "상여": 1000000
+  },
+  "기타소득": {
+    "이자": 50000
+  },
+  "카테고리별 합계": {
+    "고정소득": 3200000,
+    "변동소득": 1000000,
+    "기타소득": 50000
+  },
+  "총소득": 4250000
+}"""
+
+EXPENSE_CATEGORY_CRITERIA = """1. 고정지출 (매달 일정하게 나가는 고정 금액):
+   - 월세, 관리비, 주택담보대출
+   - 통신비 (휴대폰, 인터넷, TV)
+   - 보험료 (건강보험, 자동차보험, 생명보험, 실손보험 등 모든 보험)
+   - 구독료 (넷플릭스, 멜론 등)
+   - 교통비 정기권
+   - 학원비, 등록금 (정기 납부)
+   
+2. 변동지출 (매달 금액이 달라지는 지출):
+   - 식비, 외식비, 배달음식
+   - 쇼핑 (의류, 잡화, 화장품)
+   - 문화생활 (영화, 공연, 취미)
+   - 교통비 (택시, 주유비, 대중교통)
+   - 의료비
+   - 카드 사용액 (전통시장, 일반 카드 사용)
+   
+3. 저축 및 투자:
+   - 적금, 예금, 청약저축
+   - 주식, 펀드, 채권
+   - 연금저축
+   - 대출 원금 상환
+   
+4. 기타 및 예비비 (일회성 또는 분류 애매한 지출):
+   - 병원비 (큰 치료비)
+   - 경조사비
+   - 선물비
+   - 수리비
+   - 일회성 지출"""
+
+EXPENSE_CATEGORY_EXAMPLE = """{
+  "고정지출": {
+    "월세": 1000000,
+    "국민연금보험료 총합계": 675000
+  },
+  "변동지출": {
+    "식비": 300000,
+    "카드 전통시장 합계": 120000
+  },
+  "저축 및 투자": {
+    "적금": 500000
+  },
+  "기타 및 예비비": {
+    "경조사비": 100000
+  },
+  "카테고리별 합계": {
+    "고정지출": 1675000,
+    "변동지출": 420000,
+    "저축 및 투자": 500000,
+    "기타 및 예비비": 100000
+  },
+  "총지출": 2695000
+}"""
+
+
 class FinancialAnalyzerService:
     """
     Redis에서 복호화된 재무 데이터를 AI로 분석하고 카테고리별로 분류하는 서비스
     """
 
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.llm_gateway = LLMGateway.get_instance()
 
     @staticmethod
     def _fix_json_string(json_str: str) -> str:
@@ -90,9 +179,8 @@ class FinancialAnalyzerService:
                 elif "지출" in doc_type or "expense" in doc_type.lower():
                     expense_items[field] = value
 
-        # AI로 각각 분석
-        categorized_income = self._categorize_income(income_items) if income_items else {}
-        categorized_expense = self._categorize_expense(expense_items) if expense_items else {}
+        # AI로 분석 (소득/지출 한 번에)
+        categorized_income, categorized_expense = self.categorize_both(income_items, expense_items)
 
         # 종합 분석 및 추천
         recommendations = self._generate_recommendations(categorized_income, categorized_expense)
@@ -104,32 +192,399 @@ class FinancialAnalyzerService:
             "summary": self._generate_summary(categorized_income, categorized_expense)
         }
 
+    # 소득/지출 분류별 설정 (캐시 키, 토큰 한도, 카테고리 구성)
+    CATEGORY_SPECS = {
+        "income": {
+            "label": "소득",
+            "transaction_type": "income",
+            "cache_endpoint": "categorize-income",
+            "max_tokens": 1500,
+            "categories": ["고정소득", "변동소득", "기타소득"],
+            "total_key": "총소득",
+        },
+        "expense": {
+            "label": "지출",
+            "transaction_type": "expense",
+            "cache_endpoint": "categorize-expense",
+            "max_tokens": 2000,
+            "categories": ["고정지출", "변동지출", "저축 및 투자", "기타 및 예비비"],
+            "total_key": "총지출",
+        },
+    }
+
     @log_util.logging_decorator
     def _categorize_income(self, income_items: Dict[str, str]) -> Dict[str, Any]:
         """소득을 카테고리별로 분류"""
-        if not income_items:
+        return self._categorize(income_items, "income")
+
+    @log_util.logging_decorator
+    def _categorize_expense(self, expense_items: Dict[str, str]) -> Dict[str, Any]:
+        """지출을 카테고리별로 분류"""
+        return self._categorize(expense_items, "expense")
+
+    @log_util.logging_decorator
+    async def _categorize_income_async(
+        self, income_items: Dict[str, str], session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """소득을 카테고리별로 분류 (비동기, 이벤트 루프 비차단)"""
+        return await self._categorize_async(income_items, "income", session_id)
+
+    @log_util.logging_decorator
+    async def _categorize_expense_async(
+        self, expense_items: Dict[str, str], session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """지출을 카테고리별로 분류 (비동기, 이벤트 루프 비차단)"""
+        return await self._categorize_async(expense_items, "expense", session_id)
+
+    def _categorize(self, items: Dict[str, str], kind: str) -> Dict[str, Any]:
+        """소득/지출 분류 공통 흐름 (동기)"""
+        if not items:
             return {}
 
-        # 🔥 캐시 키 생성 (데이터 기반)
-        data_str = json.dumps(income_items, ensure_ascii=False, sort_keys=True)
-        cache_key = AICache.generate_cache_key(data_str, "categorize-income")
-        
-        # 🔥 캐시 확인
-        cached_response = AICache.get_cached_response(cache_key)
+        spec = self.CATEGORY_SPECS[kind]
+        cache_key, cached = self._get_cached_category(items, spec)
+        if cached is not None:
+            return cached
+
+        rule_result, uncertain_items = self._split_with_hybrid_parser(items, spec)
+        return self._categorize_split(items, kind, rule_result, uncertain_items, cache_key)
+
+    def _categorize_split(
+        self,
+        items: Dict[str, str],
+        kind: str,
+        rule_result: Optional[Dict[str, Any]],
+        uncertain_items: Dict[str, str],
+        cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """규칙으로 분류하지 못한 항목만 GPT로 분류하고 규칙 분류와 합침 (동기)"""
+        spec = self.CATEGORY_SPECS[kind]
+        if not uncertain_items:
+            # ✅ 전부 규칙으로 분류 → GPT 호출 없음
+            return rule_result or {}
+
+        try:
+            result_text = self.llm_gateway.chat_sync(
+                self._build_category_prompt(uncertain_items, kind),
+                model="gpt-4o-mini",
+                max_tokens=spec["max_tokens"],
+                temperature=0,
+                seed=12345
+            )
+        except Exception as e:
+            logger.error(f"[ERROR] {kind.capitalize()} categorization failed: {str(e)}")
+            return self._rule_fallback(uncertain_items, rule_result, spec, str(e))
+
+        return self._finish_category(
+            result_text, items, uncertain_items, kind,
+            cache_key or self._category_cache_key(items, spec), rule_result=rule_result
+        )
+
+    async def _categorize_async(
+        self, items: Dict[str, str], kind: str, session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        소득/지출 분류 공통 흐름 (비동기)
+
+        DB 규칙 조회/학습은 스레드로, GPT 호출은 비동기 게이트웨이로 처리하여
+        요청 처리 중 이벤트 루프를 막지 않는다.
+        """
+        if not items:
+            return {}
+
+        spec = self.CATEGORY_SPECS[kind]
+        cache_key, cached = await self._get_cached_category_async(items, spec, session_id)
+        if cached is not None:
+            return cached
+
+        # 🔥 같은 데이터로 동시에 들어온 분류 요청은 GPT 호출 1회로 병합
+        return await AICache.single_flight(
+            cache_key, lambda: self._categorize_uncached_async(items, kind, spec, cache_key, session_id)
+        )
+
+    async def _categorize_uncached_async(
+        self,
+        items: Dict[str, str],
+        kind: str,
+        spec: Dict[str, Any],
+        cache_key: str,
+        session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """캐시 미스 시 규칙 분류 + GPT 분류 수행 (비동기)"""
+        rule_result, uncertain_items = await asyncio.to_thread(self._split_with_hybrid_parser, items, spec)
+        return await self._categorize_split_async(items, kind, rule_result, uncertain_items, cache_key, session_id)
+
+    async def _categorize_split_async(
+        self,
+        items: Dict[str, str],
+        kind: str,
+        rule_result: Optional[Dict[str, Any]],
+        uncertain_items: Dict[str, str],
+        cache_key: Optional[str] = None,
+        session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """규칙으로 분류하지 못한 항목만 GPT로 분류하고 규칙 분류와 합침 (비동기)"""
+        spec = self.CATEGORY_SPECS[kind]
+        if not uncertain_items:
+            # ✅ 전부 규칙으로 분류 → GPT 호출 없음
+            return rule_result or {}
+
+        try:
+            result_text = await self.llm_gateway.chat(
+                self._build_category_prompt(uncertain_items, kind),
+                model="gpt-4o-mini",
+                max_tokens=spec["max_tokens"],
+                temperature=0,
+                seed=12345
+            )
+        except Exception as e:
+            logger.error(f"[ERROR] {kind.capitalize()} categorization failed: {str(e)}")
+            return self._rule_fallback(uncertain_items, rule_result, spec, str(e))
+
+        return await asyncio.to_thread(
+            self._finish_category, result_text, items, uncertain_items, kind,
+            cache_key or self._category_cache_key(items, spec), session_id, rule_result
+        )
+
+    # 소득+지출 통합 분류 (한 번의 GPT 호출, 실패 시에만 분리 호출)
+    COMBINED_CACHE_ENDPOINT = "categorize-combined"
+    COMBINED_MAX_TOKENS = 3500
+
+    @log_util.logging_decorator
+    def categorize_both(
+        self, income_items: Dict[str, str], expense_items: Dict[str, str]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        소득/지출을 한 번의 GPT 호출로 분류 (동기)
+
+        한쪽만 있으면 기존 단일 분류를 사용하고, 통합 호출/파싱이 실패하면 분리 호출로 폴백한다.
+
+        Returns:
+            (소득 분류 결과, 지출 분류 결과)
+        """
+        if not income_items or not expense_items:
+            return self._categorize(income_items, "income"), self._categorize(expense_items, "expense")
+
+        cache_key = self._combined_cache_key(income_items, expense_items)
+        cached = self._parse_cached_combined(AICache.get_cached_response(cache_key))
+        if cached is not None:
+            return cached
+
+        income_rules, uncertain_income = self._split_with_hybrid_parser(income_items, self.CATEGORY_SPECS["income"])
+        expense_rules, uncertain_expense = self._split_with_hybrid_parser(expense_items, self.CATEGORY_SPECS["expense"])
+        if not uncertain_income or not uncertain_expense:
+            # 한쪽이라도 전부 규칙으로 분류되면 남은 쪽만 GPT로 (양쪽 다면 GPT 호출 없음)
+            return (
+                self._categorize_split(income_items, "income", income_rules, uncertain_income),
+                self._categorize_split(expense_items, "expense", expense_rules, uncertain_expense)
+            )
+
+        try:
+            result_text = self.llm_gateway.chat_sync(
+                self._build_combined_category_prompt(uncertain_income, uncertain_expense),
+                model="gpt-4o-mini",
+                max_tokens=self.COMBINED_MAX_TOKENS,
+                temperature=0,
+                seed=12345,
+                response_format={"type": "json_object"}
+            )
+            result = self._finish_combined(result_text, {
+                "income": (income_items, income_rules, uncertain_income),
+                "expense": (expense_items, expense_rules, uncertain_expense),
+            })
+        except Exception as e:
+            logger.error(f"[ERROR] Combined categorization failed: {str(e)}")
+            result = None
+
+        if result is None:
+            logger.warning("[CATEGORIZE] 통합 분류 실패 → 소득/지출 분리 호출로 폴백")
+            return self._categorize(income_items, "income"), self._categorize(expense_items, "expense")
+
+        AICache.set_cached_response(cache_key, json.dumps(result, ensure_ascii=False), ttl=86400)
+        return result["income"], result["expense"]
+
+    @log_util.logging_decorator
+    async def categorize_both_async(
+        self, income_items: Dict[str, str], expense_items: Dict[str, str], session_id: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        소득/지출을 한 번의 GPT 호출로 분류 (비동기, 이벤트 루프 비차단)
+
+        Returns:
+            (소득 분류 결과, 지출 분류 결과)
+        """
+        if not income_items or not expense_items:
+            return tuple(await asyncio.gather(
+                self._categorize_async(income_items, "income", session_id),
+                self._categorize_async(expense_items, "expense", session_id)
+            ))
+
+        cache_key = self._combined_cache_key(income_items, expense_items)
+        cached = self._parse_cached_combined(await AICache.get_cached_response_async(cache_key, session_id))
+        if cached is not None:
+            return cached
+
+        # 🔥 같은 데이터로 동시에 들어온 분류 요청은 GPT 호출 1회로 병합
+        result = await AICache.single_flight(
+            cache_key, lambda: self._categorize_both_uncached_async(income_items, expense_items, cache_key, session_id)
+        )
+        if result is None:
+            logger.warning("[CATEGORIZE] 통합 분류 실패 → 소득/지출 분리 호출로 폴백")
+            return tuple(await asyncio.gather(
+                self._categorize_async(income_items, "income", session_id),
+                self._categorize_async(expense_items, "expense", session_id)
+            ))
+        return result["income"], result["expense"]
+
+    async def _categorize_both_uncached_async(
+        self,
+        income_items: Dict[str, str],
+        expense_items: Dict[str, str],
+        cache_key: str,
+        session_id: Optional[str] = None
+    ) -> Optional[Dict[str, Dict]]:
+        """캐시 미스 시 통합 분류 수행 (실패하면 None)"""
+        (income_rules, uncertain_income), (expense_rules, uncertain_expense) = await asyncio.gather(
+            asyncio.to_thread(self._split_with_hybrid_parser, income_items, self.CATEGORY_SPECS["income"]),
+            asyncio.to_thread(self._split_with_hybrid_parser, expense_items, self.CATEGORY_SPECS["expense"])
+        )
+        if not uncertain_income or not uncertain_expense:
+            # 한쪽이라도 전부 규칙으로 분류되면 남은 쪽만 GPT로 (양쪽 다면 GPT 호출 없음)
+            income_result, expense_result = await asyncio.gather(
+                self._categorize_split_async(income_items, "income", income_rules, uncertain_income, session_id=session_id),
+                self._categorize_split_async(expense_items, "expense", expense_rules, uncertain_expense, session_id=session_id)
+            )
+            return {"income": income_result, "expense": expense_result}
+
+        try:
+            result_text = await self.llm_gateway.chat(
+                self._build_combined_category_prompt(uncertain_income, uncertain_expense),
+                model="gpt-4o-mini",
+                max_tokens=self.COMBINED_MAX_TOKENS,
+                temperature=0,
+                seed=12345,
+                response_format={"type": "json_object"}
+            )
+            result = await asyncio.to_thread(self._finish_combined, result_text, {
+                "income": (income_items, income_rules, uncertain_income),
+                "expense": (expense_items, expense_rules, uncertain_expense),
+            })
+        except Exception as e:
+            logger.error(f"[ERROR] Combined categorization failed: {str(e)}")
+            return None
+
+        if result is not None:
+            await AICache.set_cached_response_async(
+                cache_key, json.dumps(result, ensure_ascii=False), ttl=86400, session_id=session_id
+            )
+        return result
+
+    @staticmethod
+    def _combined_cache_key(income_items: Dict[str, str], expense_items: Dict[str, str]) -> str:
+        data_str = json.dumps({"income": income_items, "expense": expense_items}, ensure_ascii=False, sort_keys=True)
+        return AICache.generate_cache_key(data_str, FinancialAnalyzerService.COMBINED_CACHE_ENDPOINT)
+
+    @staticmethod
+    def _parse_cached_combined(cached_response: Optional[str]) -> Optional[Tuple[Dict, Dict]]:
+        if cached_response:
+            try:
+                cached = json.loads(cached_response)
+                logger.info("[CACHE HIT] 소득/지출 통합 분류 캐시 사용")
+                return cached["income"], cached["expense"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                logger.warning("[CACHE] Failed to parse cached combined data, re-analyzing")
+        return None
+
+    def _finish_combined(
+        self, result_text: str, splits: Dict[str, Tuple[Dict[str, str], Optional[Dict[str, Any]], Dict[str, str]]]
+    ) -> Optional[Dict[str, Dict]]:
+        """
+        통합 분류 응답 파싱 + 학습 + 규칙 분류 항목 병합
+
+        Args:
+            splits: {"income"/"expense": (전체 항목, 규칙 분류 결과, GPT로 보낸 항목)}
+
+        Returns:
+            {"income": {...}, "expense": {...}}, 형식이 맞지 않으면 None
+        """
+        try:
+            result = json.loads(self._fix_json_string(result_text.strip()))
+        except json.JSONDecodeError as json_err:
+            logger.error(f"[ERROR] Combined JSON parsing failed: {json_err}")
+            return None
+
+        cleaned = {}
+        for kind in ("income", "expense"):
+            side = result.get(kind) if isinstance(result, dict) else None
+            if not isinstance(side, dict) or self.CATEGORY_SPECS[kind]["total_key"] not in side:
+                logger.error(f"[ERROR] Combined response missing '{kind}' section")
+                return None
+            cleaned[kind] = self._clean_item_names(side)
+
+        # 🎓 GPT 학습: 불확실했던 항목들을 DB에 저장
+        self._learn_from_gpt({
+            **self._gpt_classified_fields(splits["income"][2], cleaned["income"], "income"),
+            **self._gpt_classified_fields(splits["expense"][2], cleaned["expense"], "expense"),
+        })
+
+        for kind, (_, rule_result, _) in splits.items():
+            cleaned[kind] = self._merge_rule_categories(cleaned[kind], rule_result, self.CATEGORY_SPECS[kind])
+
+        logger.info(f"\n✅ [GPT COMPLETED] 소득/지출 통합 분류 완료")
+        return cleaned
+
+    @staticmethod
+    def _category_cache_key(items: Dict[str, str], spec: Dict[str, Any]) -> str:
+        """🔥 캐시 키 생성 (데이터 기반)"""
+        data_str = json.dumps(items, ensure_ascii=False, sort_keys=True)
+        return AICache.generate_cache_key(data_str, spec["cache_endpoint"])
+
+    @staticmethod
+    def _parse_cached_category(cached_response: Optional[str], spec: Dict[str, Any]) -> Optional[Dict]:
         if cached_response:
             try:
-                logger.info("[CACHE HIT] 소득 분류 캐시 사용")
+                logger.info(f"[CACHE HIT] {spec['label']} 분류 캐시 사용")
                 return json.loads(cached_response)
             except json.JSONDecodeError:
-                logger.warning("[CACHE] Failed to parse cached income data, re-analyzing")
+                logger.warning(f"[CACHE] Failed to parse cached {spec['label']} data, re-analyzing")
+        return None
 
-        # ============================================
-        # 🆕 하이브리드 파싱 (규칙 기반 우선)
-        # ============================================
+    @staticmethod
+    def _get_cached_category(
+        items: Dict[str, str], spec: Dict[str, Any], session_id: Optional[str] = None
+    ) -> Tuple[str, Optional[Dict]]:
+        """캐시 키 생성 및 캐시된 분류 결과 조회"""
+        cache_key = FinancialAnalyzerService._category_cache_key(items, spec)
+        cached_response = AICache.get_cached_response(cache_key, session_id)
+        return cache_key, FinancialAnalyzerService._parse_cached_category(cached_response, spec)
+
+    @staticmethod
+    async def _get_cached_category_async(
+        items: Dict[str, str], spec: Dict[str, Any], session_id: Optional[str] = None
+    ) -> Tuple[str, Optional[Dict]]:
+        """캐시 키 생성 및 캐시된 분류 결과 조회 (비동기)"""
+        cache_key = FinancialAnalyzerService._category_cache_key(items, spec)
+        cached_response = await AICache.get_cached_response_async(cache_key, session_id)
+        return cache_key, FinancialAnalyzerService._parse_cached_category(cached_response, spec)
+
+    @staticmethod
+    def _split_with_hybrid_parser(
+        items: Dict[str, str], spec: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+        """
+        하이브리드 파싱 (규칙 기반 우선)
+
+        규칙의 소득/지출 구분이 문서 종류와 같고 카테고리까지 있는 항목만 규칙으로 확정한다.
+
+        Returns:
+            (규칙 분류 결과 - _categorize_income/_categorize_expense와 같은 구조, 없으면 None,
+             규칙 기반으로 처리하지 못해 GPT가 필요한 항목)
+        """
+        label = spec["label"]
         logger.info(f"\n{'='*80}")
-        logger.info(f"📊 [HYBRID PARSING START] 소득 항목 분류 시작 ({len(income_items)}개 항목)")
+        logger.info(f"📊 [HYBRID PARSING START] {label} 항목 분류 시작 ({len(items)}개 항목)")
         logger.info(f"{'='*80}")
-        
+
         try:
             hybrid_parser = HybridParser()  # ✏️ confidence_threshold 제거
         except Exception as e:
@@ -137,29 +592,19 @@ class FinancialAnalyzerService:
             logger.error(f"   스택: {traceback.format_exc()}")
             # 폴백: GPT만 사용
             hybrid_parser = None
-        
-        confident_items = {}  # 규칙 기반 성공
+
+        rule_result = None  # 규칙 기반 분류 결과
         uncertain_items = {}  # GPT 필요
-        
+
         if hybrid_parser:
-            for field_name, value in income_items.items():
-                try:
-                    trans_type, category, metadata = hybrid_parser.classify_item(
-                        field_name, 
-                        value, 
-                        doc_type_hint='소득'
-                    )
-                    
-                    if metadata['method'] == 'rule_based':
-                        # ✅ 규칙 기반 성공
-                        confident_items[field_name] = value
-                    else:
-                        # ⚠️ GPT 필요
-                        uncertain_items[field_name] = value
-                except Exception as e:
-                    logger.warning(f"⚠️  [PARSE ERROR] '{field_name}' 파싱 실패: {str(e)}")
-                    uncertain_items[field_name] = value
-            
+            rule_result, uncertain_items = hybrid_parser.categorize_items(
+                items,
+                spec["transaction_type"],
+                spec["categories"],
+                spec["total_key"],
+                doc_type_hint=label
+            )
+
             # 📊 통계 출력
             try:
                 stats = hybrid_parser.get_statistics()
@@ -174,86 +619,48 @@ class FinancialAnalyzerService:
         else:
             # HybridParser 실패 시 모든 항목을 GPT로
             logger.warning("⚠️  HybridParser를 사용할 수 없습니다. 모든 항목을 GPT로 처리합니다.")
-            uncertain_items = income_items.copy()
-        
+            uncertain_items = items.copy()
+
         # ============================================
-        # GPT로 전체 재분석 (불확실한 항목 포함)
+        # 남은 항목만 GPT로 분류
         # ============================================
         if uncertain_items:
-            logger.warning(f"\n⚠️  [{len(uncertain_items)}개 항목] GPT로 재분석 필요:")
+            logger.warning(f"\n⚠️  [{len(uncertain_items)}개 항목] GPT로 분류 필요:")
             for field in uncertain_items.keys():
                 logger.warning(f"   - {field}")
-            logger.info(f"\n🤖 [GPT PARSING] 전체 항목을 GPT로 분석합니다...")
+            logger.info(f"\n🤖 [GPT PARSING] 규칙 분류 {len(items) - len(uncertain_items)}개 외 나머지 항목만 GPT로 분석합니다...")
         else:
-            logger.info(f"\n✅ [100% DB-RULE] 모든 항목을 규칙 기반으로 처리했습니다!")
-            logger.info(f"🤖 [GPT PARSING] 정확도 향상을 위해 GPT로 카테고리 분류를 진행합니다...")
+            logger.info(f"\n✅ [100% DB-RULE] 모든 항목을 규칙 기반으로 처리했습니다! (GPT 호출 생략)")
 
-        # 기존 GPT 프롬프트 사용 (전체 항목)
-        prompt = f"""
-다음 소득 항목들을 분석하여 아래 카테고리로 정확하게 분류해줘:
-
-소득 항목:
-{json.dumps(income_items, ensure_ascii=False, indent=2)}
+        return rule_result, uncertain_items
 
-**엄격한 분류 기준:**
-
-1. 고정소득: 매월 일정하게 들어오는 소득
-   - 급여, 월급, 연봉
-   - 식대 (고정)
-   - 정기 수당
-
-2. 변동소득: 불규칙적으로 들어오는 소득
-   - 상여금, 보너스, 성과급
-   - 수당 (변동)
-   - 야근수당, 연장근로수당
-
-3. 기타소득: 부가 수입
-   - 이자소득, 배당소득
-   - 임대소득
-   - 프리랜서 수입
-
-**절대 규칙:**
-1. 항목명의 언더스코어(_)를 띄어쓰기로 변경
-2. 원본 금액을 그대로 사용 (숫자 타입)
-3. 빈 객체 절대 사용 금지
-4. JSON 문법 엄수: 마지막 항목 뒤에 쉼표 없음, 모든 괄호 정확히 닫기
-
-**응답 형식 (반드시 이 형식을 정확히 따를 것):**
-
-```json
-{{
-  "고정소득": {{
-    "급여": 3000000,
-    "식대": 200000
-  }},
-  "변동소득": {{
-    "상여": 1000000
-  }},
-  "기타소득": {{
-    "이자": 50000
-  }},
-  "카테고리별 합계": {{
-    "고정소득": 3200000,
-    "변동소득": 1000000,
-    "기타소득": 50000
-  }},
-  "총소득": 4250000
-}}
-```
-
-중요: 위 형식을 정확히 따라야 합니다. JSON 코드블록(```)은 제외하고 순수 JSON만 반환하세요.
-"""
+    @staticmethod
+    def _merge_rule_categories(
+        gpt_result: Dict[str, Any],
+        rule_result: Optional[Dict[str, Any]],
+        spec: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        GPT 분류 결과(나머지 항목)에 규칙 분류 결과를 합치고 합계 재계산
 
+        규칙 분류 결과가 없으면 GPT 결과를 그대로 반환한다.
+        """
+        return HybridParser.merge_categorized(gpt_result, rule_result, spec["categories"], spec["total_key"])
+
+    def _finish_category(
+        self,
+        result_text: str,
+        items: Dict[str, str],
+        uncertain_items: Dict[str, str],
+        kind: str,
+        cache_key: str,
+        session_id: Optional[str] = None,
+        rule_result: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """GPT 응답 파싱, 학습, 규칙 분류 항목 병합, 캐시 저장"""
+        spec = self.CATEGORY_SPECS[kind]
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1500,
-                temperature=0,
-                seed=12345
-            )
-
-            result_text = response.choices[0].message.content.strip()
+            result_text = result_text.strip()
 
             # JSON 추출
             if "```json" in result_text:
@@ -269,174 +676,106 @@ class FinancialAnalyzerService:
                 result = json.loads(result_text)
                 # 언더스코어를 띄어쓰기로 변환
                 cleaned_result = self._clean_item_names(result)
-                
+
                 # 🎓 GPT 학습: 불확실했던 항목들을 DB에 저장
                 if uncertain_items:
-                    self._learn_from_gpt_income(uncertain_items, cleaned_result)
-                
+                    if kind == "income":
+                        self._learn_from_gpt_income(uncertain_items, cleaned_result)
+                    else:
+                        self._learn_from_gpt_expense(uncertain_items, cleaned_result)
+
                 # ✅ GPT 분석 완료 로깅
-                logger.info(f"\n✅ [GPT COMPLETED] 소득 분류 완료")
+                logger.info(f"\n✅ [GPT COMPLETED] {spec['label']} 분류 완료")
                 logger.info(f"{'='*80}\n")
-                
+
+                cleaned_result = self._merge_rule_categories(cleaned_result, rule_result, spec)
+
                 # 🔥 캐시 저장 (24시간)
-                AICache.set_cached_response(cache_key, json.dumps(cleaned_result, ensure_ascii=False), ttl=86400)
-                
+                AICache.set_cached_response(
+                    cache_key, json.dumps(cleaned_result, ensure_ascii=False), ttl=86400, session_id=session_id
+                )
+
                 return cleaned_result
             except json.JSONDecodeError as json_err:
                 logger.error(f"[ERROR] JSON parsing failed: {json_err}")
                 logger.error(f"[ERROR] Raw response text: {result_text}")
-                # JSON 파싱 실패 시 원본 데이터 반환
-                return {
-                    "error": f"AI 응답을 파싱할 수 없습니다: {str(json_err)}",
-                    "raw_items": income_items,
-                    "고정소득": {},
-                    "변동소득": {},
-                    "기타소득": {},
-                    "카테고리별 합계": {
-                        "고정소득": 0,
-                        "변동소득": 0,
-                        "기타소득": 0
-                    },
-                    "총소득": sum(int(v) for v in income_items.values() if v.isdigit())
-                }
+                # JSON 파싱 실패 시 원본 데이터 반환 (규칙 분류 항목은 유지)
+                return self._rule_fallback(
+                    uncertain_items, rule_result, spec, f"AI 응답을 파싱할 수 없습니다: {str(json_err)}"
+                )
         except Exception as e:
-            logger.error(f"[ERROR] Income categorization failed: {str(e)}")
-            return {
-                "error": str(e),
-                "raw_items": income_items,
-                "고정소득": {},
-                "변동소득": {},
-                "기타소득": {},
-                "카테고리별 합계": {
-                    "고정소득": 0,
-                    "변동소득": 0,
-                    "기타소득": 0
-                },
-                "총소득": sum(int(v) for v in income_items.values() if v.isdigit())
-            }
+            logger.error(f"[ERROR] {kind.capitalize()} categorization failed: {str(e)}")
+            return self._rule_fallback(uncertain_items, rule_result, spec, str(e))
 
-    @log_util.logging_decorator
-    def _categorize_expense(self, expense_items: Dict[str, str]) -> Dict[str, Any]:
-        """지출을 카테고리별로 분류"""
-        if not expense_items:
-            return {}
+    @staticmethod
+    def _rule_fallback(
+        uncertain_items: Dict[str, str],
+        rule_result: Optional[Dict[str, Any]],
+        spec: Dict[str, Any],
+        error: str
+    ) -> Dict[str, Any]:
+        """
+        GPT 분류 실패 시 기본 구조 + 규칙으로 이미 분류한 항목
 
-        # 🔥 캐시 키 생성 (데이터 기반)
-        data_str = json.dumps(expense_items, ensure_ascii=False, sort_keys=True)
-        cache_key = AICache.generate_cache_key(data_str, "categorize-expense")
-        
-        # 🔥 캐시 확인
-        cached_response = AICache.get_cached_response(cache_key)
-        if cached_response:
-            try:
-                logger.info("[CACHE HIT] 지출 분류 캐시 사용")
-                return json.loads(cached_response)
-            except json.JSONDecodeError:
-                logger.warning("[CACHE] Failed to parse cached expense data, re-analyzing")
+        raw_items에는 분류하지 못한 항목만 남기고, 총합에는 그 금액도 포함한다 (_category_fallback과 같은 기준).
+        """
+        fallback = FinancialAnalyzerService._category_fallback(uncertain_items, spec, error)
+        if not rule_result:
+            return fallback
 
-        # ============================================
-        # 🆕 하이브리드 파싱 (규칙 기반 우선)
-        # ============================================
-        logger.info(f"\n{'='*80}")
-        logger.info(f"📊 [HYBRID PARSING START] 지출 항목 분류 시작 ({len(expense_items)}개 항목)")
-        logger.info(f"{'='*80}")
-        
-        try:
-            hybrid_parser = HybridParser()  # ✏️ confidence_threshold 제거
-        except Exception as e:
-            logger.error(f"❌ [HYBRID PARSER] 초기화 실패: {str(e)}")
-            logger.error(f"   스택: {traceback.format_exc()}")
-            # 폴백: GPT만 사용
-            hybrid_parser = None
-        
-        confident_items = {}  # 규칙 기반 성공
-        uncertain_items = {}  # GPT 필요
-        
-        if hybrid_parser:
-            for field_name, value in expense_items.items():
-                try:
-                    trans_type, category, metadata = hybrid_parser.classify_item(
-                        field_name, 
-                        value, 
-                        doc_type_hint='지출'
-                    )
-                    
-                    if metadata['method'] == 'rule_based':
-                        # ✅ 규칙 기반 성공
-                        confident_items[field_name] = value
-                    else:
-                        # ⚠️ GPT 필요
-                        uncertain_items[field_name] = value
-                except Exception as e:
-                    logger.warning(f"⚠️  [PARSE ERROR] '{field_name}' 파싱 실패: {str(e)}")
-                    uncertain_items[field_name] = value
-            
-            # 📊 통계 출력
-            try:
-                stats = hybrid_parser.get_statistics()
-                logger.info(f"\n📊 [PARSING STATS]")
-                logger.info(f"   전체: {stats['total_items']}개")
-                logger.info(f"   ✅ DB 규칙 성공: {stats['db_rule_success']}개 ({stats['db_rule_rate']*100:.1f}%)")
-                logger.info(f"   ⚠️  GPT 필요: {stats['gpt_fallback']}개 ({stats['gpt_fallback_rate']*100:.1f}%)")
-                logger.info(f"   💰 비용 절감률: {stats['cost_saving_rate']*100:.1f}%")
-                logger.info(f"   🎓 새로 학습: {stats['new_keywords_learned']}개")
-            except Exception as e:
-                logger.warning(f"⚠️  통계 출력 실패: {str(e)}")
-        else:
-            # HybridParser 실패 시 모든 항목을 GPT로
-            logger.warning("⚠️  HybridParser를 사용할 수 없습니다. 모든 항목을 GPT로 처리합니다.")
-            uncertain_items = expense_items.copy()
-        
-        # ============================================
-        # GPT로 전체 재분석 (불확실한 항목 포함)
-        # ============================================
-        if uncertain_items:
-            logger.warning(f"\n⚠️  [{len(uncertain_items)}개 항목] GPT로 재분석 필요:")
-            for field in uncertain_items.keys():
-                logger.warning(f"   - {field}")
-            logger.info(f"\n🤖 [GPT PARSING] 전체 항목을 GPT로 분석합니다...")
-        else:
-            logger.info(f"\n✅ [100% DB-RULE] 모든 항목을 규칙 기반으로 처리했습니다!")
-            logger.info(f"🤖 [GPT PARSING] 정확도 향상을 위해 GPT로 카테고리 분류를 진행합니다...")
+        merged = HybridParser.merge_categorized(fallback, rule_result, spec["categories"], spec["total_key"])
+        merged[spec["total_key"]] += fallback[spec["total_key"]]
+        return merged
+
+    @staticmethod
+    def _category_fallback(items: Dict[str, str], spec: Dict[str, Any], error: str) -> Dict[str, Any]:
+        """분류 실패 시 원본 데이터 기반 기본 구조 반환"""
+        return {
+            "error": error,
+            "raw_items": items,
+            **{category: {} for category in spec["categories"]},
+            "카테고리별 합계": {category: 0 for category in spec["categories"]},
+            spec["total_key"]: sum(int(v) for v in items.values() if v.isdigit())
+        }
+
+    @staticmethod
+    def _build_category_prompt(items: Dict[str, str], kind: str) -> str:
+        """소득/지출 분류용 GPT 프롬프트 생성"""
+        if kind == "income":
+            return f"""
+다음 소득 항목들을 분석하여 아래 카테고리로 정확하게 분류해줘:
+
+소득 항목:
+{json.dumps(items, ensure_ascii=False, indent=2)}
+
+**엄격한 분류 기준:**
+
+{INCOME_CATEGORY_CRITERIA}
+
+**절대 규칙:**
+1. 항목명의 언더스코어(_)를 띄어쓰기로 변경
+2. 원본 금액을 그대로 사용 (숫자 타입)
+3. 빈 객체 절대 사용 금지
+4. JSON 문법 엄수: 마지막 항목 뒤에 쉼표 없음, 모든 괄호 정확히 닫기
 
+**응답 형식 (반드시 이 형식을 정확히 따를 것):**
 
-        # 기존 GPT 프롬프트 사용
-        prompt = f"""
+```json
+{INCOME_CATEGORY_EXAMPLE}
+```
+
+중요: 위 형식을 정확히 따라야 합니다. JSON 코드블록(```)은 제외하고 순수 JSON만 반환하세요.
+"""
+
+        return f"""
 다음 지출 항목들을 분석하여 아래 카테고리로 정확하게 분류해줘:
 
 지출 항목:
-{json.dumps(expense_items, ensure_ascii=False, indent=2)}
+{json.dumps(items, ensure_ascii=False, indent=2)}
 
 **엄격한 분류 기준:**
 
-1. 고정지출 (매달 일정하게 나가는 고정 금액):
-   - 월세, 관리비, 주택담보대출
-   - 통신비 (휴대폰, 인터넷, TV)
-   - 보험료 (건강보험, 자동차보험, 생명보험, 실손보험 등 모든 보험)
-   - 구독료 (넷플릭스, 멜론 등)
-   - 교통비 정기권
-   - 학원비, 등록금 (정기 납부)
-   
-2. 변동지출 (매달 금액이 달라지는 지출):
-   - 식비, 외식비, 배달음식
-   - 쇼핑 (의류, 잡화, 화장품)
-   - 문화생활 (영화, 공연, 취미)
-   - 교통비 (택시, 주유비, 대중교통)
-   - 의료비
-   - 카드 사용액 (전통시장, 일반 카드 사용)
-   
-3. 저축 및 투자:
-   - 적금, 예금, 청약저축
-   - 주식, 펀드, 채권
-   - 연금저축
-   - 대출 원금 상환
-   
-4. 기타 및 예비비 (일회성 또는 분류 애매한 지출):
-   - 병원비 (큰 치료비)
-   - 경조사비
-   - 선물비
-   - 수리비
-   - 일회성 지출
+{EXPENSE_CATEGORY_CRITERIA}
 
 **절대 규칙:**
 1. 모든 보험료는 반드시 "고정지출"에 포함
@@ -449,108 +788,48 @@ class FinancialAnalyzerService:
 **응답 형식 (반드시 이 형식을 정확히 따를 것):**
 
 ```json
-{{
-  "고정지출": {{
-    "월세": 1000000,
-    "국민연금보험료 총합계": 675000
-  }},
-  "변동지출": {{
-    "식비": 300000,
-    "카드 전통시장 합계": 120000
-  }},
-  "저축 및 투자": {{
-    "적금": 500000
-  }},
-  "기타 및 예비비": {{
-    "경조사비": 100000
-  }},
-  "카테고리별 합계": {{
-    "고정지출": 1675000,
-    "변동지출": 420000,
-    "저축 및 투자": 500000,
-    "기타 및 예비비": 100000
-  }},
-  "총지출": 2695000
-}}
+{EXPENSE_CATEGORY_EXAMPLE}
 ```
 
 중요: 위 형식을 정확히 따라야 합니다. JSON 코드블록(```)은 제외하고 순수 JSON만 반환하세요.
 """
 
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=2000,
-                temperature=0,
-                seed=12345
-            )
+    @staticmethod
+    def _build_combined_category_prompt(income_items: Dict[str, str], expense_items: Dict[str, str]) -> str:
+        """소득+지출 통합 분류용 GPT 프롬프트 생성 (JSON 객체 응답)"""
+        return f"""
+다음 소득 항목과 지출 항목을 각각 아래 카테고리로 정확하게 분류해줘:
 
-            result_text = response.choices[0].message.content.strip()
+소득 항목:
+{json.dumps(income_items, ensure_ascii=False, indent=2)}
 
-            # JSON 추출
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
+지출 항목:
+{json.dumps(expense_items, ensure_ascii=False, indent=2)}
 
-            # JSON 수정 (잘못된 문법 자동 수정)
-            result_text = self._fix_json_string(result_text)
+**소득 분류 기준:**
 
-            # JSON 파싱 시도
-            try:
-                result = json.loads(result_text)
-                # 언더스코어를 띄어쓰기로 변환
-                cleaned_result = self._clean_item_names(result)
-                
-                # 🎓 GPT 학습: 불확실했던 항목들을 DB에 저장
-                if uncertain_items:
-                    self._learn_from_gpt_expense(uncertain_items, cleaned_result)
-                
-                # ✅ GPT 분석 완료 로깅
-                logger.info(f"\n✅ [GPT COMPLETED] 지출 분류 완료")
-                logger.info(f"{'='*80}\n")
-                
-                # 🔥 캐시 저장 (24시간)
-                AICache.set_cached_response(cache_key, json.dumps(cleaned_result, ensure_ascii=False), ttl=86400)
-                
-                return cleaned_result
-            except json.JSONDecodeError as json_err:
-                logger.error(f"[ERROR] JSON parsing failed: {json_err}")
-                logger.error(f"[ERROR] Raw response text: {result_text}")
-                # JSON 파싱 실패 시 원본 데이터 반환
-                return {
-                    "error": f"AI 응답을 파싱할 수 없습니다: {str(json_err)}",
-                    "raw_items": expense_items,
-                    "고정지출": {},
-                    "변동지출": {},
-                    "저축 및 투자": {},
-                    "기타 및 예비비": {},
-                    "카테고리별 합계": {
-                        "고정지출": 0,
-                        "변동지출": 0,
-                        "저축 및 투자": 0,
-                        "기타 및 예비비": 0
-                    },
-                    "총지출": sum(int(v) for v in expense_items.values() if v.isdigit())
-                }
-        except Exception as e:
-            logger.error(f"[ERROR] Expense categorization failed: {str(e)}")
-            return {
-                "error": str(e),
-                "raw_items": expense_items,
-                "고정지출": {},
-                "변동지출": {},
-                "저축 및 투자": {},
-                "기타 및 예비비": {},
-                "카테고리별 합계": {
-                    "고정지출": 0,
-                    "변동지출": 0,
-                    "저축 및 투자": 0,
-                    "기타 및 예비비": 0
-                },
-                "총지출": sum(int(v) for v in expense_items.values() if v.isdigit())
-            }
+{INCOME_CATEGORY_CRITERIA}
+
+**지출 분류 기준:**
+
+{EXPENSE_CATEGORY_CRITERIA}
+
+**절대 규칙:**
+1. 소득 항목은 "income"에만, 지출 항목은 "expense"에만 분류 (항목 누락/이동 금지)
+2. 모든 보험료는 반드시 지출의 "고정지출"에 포함
+3. 카드 사용액은 지출의 "변동지출"에 포함
+4. 항목명의 언더스코어(_)를 띄어쓰기로 변경
+5. 원본 금액을 그대로 사용 (숫자 타입)
+6. 빈 객체 절대 사용 금지
+7. JSON 문법 엄수: 마지막 항목 뒤에 쉼표 없음, 모든 괄호 정확히 닫기
+
+**응답 형식 (반드시 이 형식의 JSON 객체 하나만 반환):**
+
+{{
+  "income": {INCOME_CATEGORY_EXAMPLE},
+  "expense": {EXPENSE_CATEGORY_EXAMPLE}
+}}
+"""
 
     @log_util.logging_decorator
     def _generate_recommendations(self, income_data: Dict, expense_data: Dict, use_ai: bool = False) -> Dict[str, Any]:
@@ -566,23 +845,69 @@ class FinancialAnalyzerService:
 
         # 🔥 규칙 기반 추천 (기본값)
         if not use_ai:
-            from asset_allocation.domain.service.rule_based_allocation_service import RuleBasedAllocationService
-            rule_service = RuleBasedAllocationService()
-            return rule_service.generate_recommendation(income_data, expense_data, risk_profile="balanced")
+            return self._generate_rule_based_recommendations(income_data, expense_data)
 
         # 🔥 AI 기반 추천 (use_ai=True일 때만)
-        # 안전한 타입 변환
+        prompt = self._build_recommendation_prompt(income_data, expense_data)
+
         try:
-            total_income = int(income_data.get("total_income", 0)) if income_data.get("total_income") else 0
-        except (ValueError, TypeError):
-            total_income = 0
+            result_text = self.llm_gateway.chat_sync(
+                prompt,
+                model="gpt-4o-mini",
+                max_tokens=2500,
+                temperature=0,  # 일관성을 위해 0으로 변경
+                seed=12345  # 동일한 입력에 대해 일관된 결과 보장
+            )
+            return self._parse_recommendation(result_text)
+        except Exception as e:
+            logger.error(f"[ERROR] Recommendation generation failed: {str(e)}")
+            return {"error": str(e)}
+
+    @log_util.logging_decorator
+    async def _generate_recommendations_async(self, income_data: Dict, expense_data: Dict, use_ai: bool = False) -> Dict[str, Any]:
+        """자산 분배 추천 (비동기, 이벤트 루프 비차단)"""
+        if not income_data or not expense_data:
+            return {"message": "소득 또는 지출 데이터가 부족합니다"}
+
+        if not use_ai:
+            return self._generate_rule_based_recommendations(income_data, expense_data)
+
+        prompt = self._build_recommendation_prompt(income_data, expense_data)
 
         try:
-            total_expense = int(expense_data.get("total_expense", 0)) if expense_data.get("total_expense") else 0
-        except (ValueError, TypeError):
-            total_expense = 0
+            result_text = await self.llm_gateway.chat(
+                prompt,
+                model="gpt-4o-mini",
+                max_tokens=2500,
+                temperature=0,
+                seed=12345
+            )
+            return self._parse_recommendation(result_text)
+        except Exception as e:
+            logger.error(f"[ERROR] Recommendation generation failed: {str(e)}")
+            return {"error": str(e)}
 
-        prompt = f"""
+    def stream_recommendations_async(self, income_data: Dict, expense_data: Dict) -> AsyncIterator[str]:
+        """AI 자산 분배 추천 스트리밍 (JSON 응답 조각, 완성 후 _parse_recommendation으로 파싱)"""
+        prompt = self._build_recommendation_prompt(income_data, expense_data)
+        return self.llm_gateway.stream_chat(
+            prompt,
+            model="gpt-4o-mini",
+            max_tokens=2500,
+            temperature=0,
+            seed=12345
+        )
+
+    @staticmethod
+    def _generate_rule_based_recommendations(income_data: Dict, expense_data: Dict) -> Dict[str, Any]:
+        from asset_allocation.domain.service.rule_based_allocation_service import RuleBasedAllocationService
+        rule_service = RuleBasedAllocationService()
+        return rule_service.generate_recommendation(income_data, expense_data, risk_profile="balanced")
+
+    @staticmethod
+    def _build_recommendation_prompt(income_data: Dict, expense_data: Dict) -> str:
+        """자산 분배 추천용 GPT 프롬프트 생성"""
+        return f"""
 당신은 전문 재무설계사입니다. 다음 데이터를 분석하여 자산 분배를 추천해주세요.
 
 소득 분석:
@@ -644,25 +969,15 @@ class FinancialAnalyzerService:
 }}
 """
 
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=2500,
-                temperature=0,  # 일관성을 위해 0으로 변경
-                seed=12345  # 동일한 입력에 대해 일관된 결과 보장
-            )
-
-            result_text = response.choices[0].message.content.strip()
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
+    @staticmethod
+    def _parse_recommendation(result_text: str) -> Dict[str, Any]:
+        result_text = result_text.strip()
+        if "```json" in result_text:
+            result_text = result_text.split("```json")[1].split("```")[0].strip()
+        elif "```" in result_text:
+            result_text = result_text.split("```")[1].split("```")[0].strip()
 
-            return json.loads(result_text)
-        except Exception as e:
-            logger.error(f"[ERROR] Recommendation generation failed: {str(e)}")
-            return {"error": str(e)}
+        return json.loads(result_text)
 
     @log_util.logging_decorator
     def _generate_summary(self, income_data: Dict, expense_data: Dict) -> Dict[str, Any]:
@@ -691,6 +1006,58 @@ class FinancialAnalyzerService:
             "status": "흑자" if surplus > 0 else "적자" if surplus < 0 else "수지균형"
         }
     
+    # GPT 결과에서 항목이 아닌 키 (합계 등)
+    _LEARN_SKIP_KEYS = {
+        "income": {'카테고리별 합계', '총소득', 'total_income', 'error', 'raw_items'},
+        "expense": {'카테고리별 합계', '총지출', 'total_expense', 'error', 'raw_items'},
+    }
+
+    @staticmethod
+    def _gpt_classified_fields(
+        uncertain_items: Dict[str, str], gpt_result: Dict, kind: str
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        규칙 기반으로 처리 못한 항목 중 GPT 결과 카테고리에 들어간 항목
+
+        Returns:
+            {항목명: (kind, 카테고리)}
+        """
+        skip_keys = FinancialAnalyzerService._LEARN_SKIP_KEYS[kind]
+        classified = {}
+        for field_name in uncertain_items.keys():
+            # 모든 카테고리에서 해당 항목 찾기 (GPT 결과는 언더스코어가 띄어쓰기로 바뀜)
+            clean_name = field_name.replace("_", " ")
+            category = next(
+                (
+                    category_name for category_name, items in gpt_result.items()
+                    if category_name not in skip_keys and isinstance(items, dict)
+                    and (field_name in items or clean_name in items)
+                ),
+                None
+            )
+            if category is not None:
+                classified[field_name] = (kind, category)
+            else:
+                logger.debug(f"[LEARN] 항목 '{field_name}'을 GPT 결과에서 찾을 수 없음")
+        return classified
+
+    @staticmethod
+    def _learn_from_gpt(classified: Dict[str, Tuple[str, str]]):
+        """
+        GPT가 분류한 항목을 DB에 일괄 학습
+
+        Args:
+            classified: {항목명: ('income' or 'expense', 카테고리)}
+        """
+        if not classified:
+            return
+        try:
+            from documents_multi_agents.domain.service.hybrid_parser import HybridParser
+
+            HybridParser().learn_from_gpt_results(classified)
+        except Exception as e:
+            logger.error(f"[LEARN] 학습 오류: {str(e)}")
+
     def _learn_from_gpt_income(self, uncertain_items: Dict[str, str], gpt_result: Dict):
         """
         GPT가 분류한 소득 항목을 DB에 학습
@@ -699,30 +1066,7 @@ class FinancialAnalyzerService:
             uncertain_items: 규칙 기반으로 처리 못한 항목들
             gpt_result: GPT 분석 결과
         """
-        try:
-            from documents_multi_agents.domain.service.hybrid_parser import HybridParser
-            
-            learner = HybridParser()
-            
-            # GPT 결과에서 각 항목이 어느 카테고리에 속하는지 확인
-            for field_name in uncertain_items.keys():
-                # 모든 카테고리에서 해당 항목 찾기
-                found = False
-                for category_name, items in gpt_result.items():
-                    if category_name in ['카테고리별 합계', '총소득', 'total_income', 'error', 'raw_items']:
-                        continue
-                    
-                    if isinstance(items, dict) and field_name in items:
-                        # 이 항목은 소득으로 분류됨
-                        learner.learn_from_gpt_result(field_name, 'income')
-                        found = True
-                        break
-                
-                if not found:
-                    logger.debug(f"[LEARN] 항목 '{field_name}'을 GPT 결과에서 찾을 수 없음")
-        
-        except Exception as e:
-            logger.error(f"[LEARN] 소득 학습 오류: {str(e)}")
+        self._learn_from_gpt(self._gpt_classified_fields(uncertain_items, gpt_result, "income"))
     
     def _learn_from_gpt_expense(self, uncertain_items: Dict[str, str], gpt_result: Dict):
         """
@@ -732,27 +1076,4 @@ class FinancialAnalyzerService:
             uncertain_items: 규칙 기반으로 처리 못한 항목들
             gpt_result: GPT 분석 결과
         """
-        try:
-            from documents_multi_agents.domain.service.hybrid_parser import HybridParser
-            
-            learner = HybridParser()
-            
-            # GPT 결과에서 각 항목이 어느 카테고리에 속하는지 확인
-            for field_name in uncertain_items.keys():
-                # 모든 카테고리에서 해당 항목 찾기
-                found = False
-                for category_name, items in gpt_result.items():
-                    if category_name in ['카테고리별 합계', '총지출', 'total_expense', 'error', 'raw_items']:
-                        continue
-                    
-                    if isinstance(items, dict) and field_name in items:
-                        # 이 항목은 지출로 분류됨
-                        learner.learn_from_gpt_result(field_name, 'expense')
-                        found = True
-                        break
-                
-                if not found:
-                    logger.debug(f"[LEARN] 항목 '{field_name}'을 GPT 결과에서 찾을 수 없음")
-        
-        except Exception as e:
-            logger.error(f"[LEARN] 지출 학습 오류: {str(e)}")
+        self._learn_from_gpt(self._gpt_classified_fields(uncertain_items, gpt_result, "expense"))
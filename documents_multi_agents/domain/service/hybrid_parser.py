@@ -3,7 +3,7 @@
 """
 
 import json
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Iterable, Optional, Tuple
 from documents_multi_agents.domain.service.db_rule_parser import DBRuleBasedParser, ParsedTransaction
 from ieinfo.infrastructure.repository.ie_rule_repository_impl import IERuleRepositoryImpl
 from ieinfo.infrastructure.orm.ie_info import IEType
@@ -54,9 +54,8 @@ class HybridParser:
         """
         self.stats['total_items'] += 1
         
-        # DB 규칙 기반 파싱 시도
-        line_text = f"{field_name}: {value}"
-        parsed = self.db_parser.parse_line(line_text, doc_type_hint)
+        # DB 규칙 기반 파싱 시도 (추출 결과는 단위 없는 금액이므로 항목 단위로 분류)
+        parsed = self.db_parser.parse_item(field_name, value, doc_type_hint)
         
         if parsed:
             # ✅ DB 규칙 성공
@@ -69,6 +68,8 @@ class HybridParser:
                 'method': 'db_rule',
                 'confidence': parsed.confidence,
                 'matched_keyword': parsed.matched_keyword,
+                'rule_category': parsed.category,
+                'rule_sub_category': parsed.sub_category,
                 'original_field': field_name,
                 'amount': value
             }
@@ -86,39 +87,162 @@ class HybridParser:
                 'amount': value
             }
     
-    def learn_from_gpt_result(self, field_name: str, gpt_classified_type: str) -> bool:
+    def categorize_items(
+        self,
+        items: Dict[str, str],
+        transaction_type: str,
+        categories: Iterable[str],
+        total_key: str,
+        doc_type_hint: str = None
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
         """
-        GPT 분류 결과를 DB에 학습
+        문서 항목 전체를 규칙으로 카테고리 분류
+        
+        규칙의 소득/지출 구분이 transaction_type과 같고 카테고리가 categories 중 하나인 항목만 확정한다.
+        
+        Args:
+            items: {항목명: 금액}
+            transaction_type: 'income' or 'expense'
+            categories: 분류 기준 카테고리 (예: ["고정소득", "변동소득", "기타소득"])
+            total_key: 총합 키 (예: "총소득")
+            doc_type_hint: 문서 타입 힌트 ('소득', '지출', None)
+        
+        Returns:
+            (규칙 분류 결과 - GPT 분류와 같은 구조, 규칙 분류 항목이 없으면 None,
+             규칙으로 분류하지 못해 GPT가 필요한 항목 {항목명: 금액})
+        """
+        categories = list(categories)
+        sections: Dict[str, Dict[str, int]] = {category: {} for category in categories}
+        uncertain_items: Dict[str, str] = {}
+        
+        for field_name, value in items.items():
+            try:
+                trans_type, category, metadata = self.classify_item(field_name, value, doc_type_hint)
+            except Exception as e:
+                logger.warning(f"⚠️  [PARSE ERROR] '{field_name}' 파싱 실패: {str(e)}")
+                uncertain_items[field_name] = value
+                continue
+            
+            if metadata['method'] == 'db_rule' and trans_type == transaction_type and category in sections:
+                sections[category][field_name.replace('_', ' ')] = self.amount_value(value)
+            else:
+                uncertain_items[field_name] = value
+        
+        if len(uncertain_items) == len(items):
+            return None, uncertain_items
+        return self._with_totals(sections, categories, total_key), uncertain_items
+    
+    @staticmethod
+    def merge_categorized(
+        gpt_result: Dict[str, Any],
+        rule_result: Optional[Dict[str, Any]],
+        categories: Iterable[str],
+        total_key: str
+    ) -> Dict[str, Any]:
+        """
+        GPT 분류 결과(나머지 항목)에 규칙 분류 결과를 합치고 합계 재계산
+        
+        규칙 분류 결과가 없으면 GPT 결과를 그대로 반환한다.
+        """
+        if not rule_result:
+            return gpt_result
+        
+        categories = list(categories)
+        sections: Dict[str, Dict[str, Any]] = {}
+        for category in categories:
+            section = gpt_result.get(category)
+            sections[category] = dict(section) if isinstance(section, dict) else {}
+            sections[category].update(rule_result.get(category) or {})
+        
+        merged = HybridParser._with_totals(sections, categories, total_key)
+        # GPT 결과의 나머지 키 (기준에 없는 카테고리 등) 유지
+        for key, value in gpt_result.items():
+            merged.setdefault(key, value)
+        return merged
+    
+    @staticmethod
+    def _with_totals(sections: Dict[str, Dict[str, Any]], categories: list, total_key: str) -> Dict[str, Any]:
+        """{카테고리: {항목: 금액}} → 카테고리별 합계/총합이 붙은 분류 결과 (카테고리 순서 유지)"""
+        result: Dict[str, Any] = {category: sections[category] for category in categories}
+        result["카테고리별 합계"] = {
+            category: sum(HybridParser.amount_value(value) for value in sections[category].values())
+            for category in categories
+        }
+        result[total_key] = sum(result["카테고리별 합계"].values())
+        return result
+    
+    @staticmethod
+    def amount_value(value: Any) -> int:
+        """금액 → 정수 (숫자 문자열/콤마 허용, 그 외 0)"""
+        if isinstance(value, (int, float)):
+            return int(value)
+        digits = str(value).replace(",", "").strip()
+        return int(digits) if digits.isdigit() else 0
+    
+    def learn_from_gpt_result(self, field_name: str, gpt_classified_type: str, category: Optional[str] = None) -> bool:
+        """
+        GPT 분류 결과를 DB에 학습 (단건)
         
         Args:
             field_name: 항목명 (예: "기타수당")
             gpt_classified_type: GPT가 분류한 타입 ('income' or 'expense')
+            category: GPT가 분류한 카테고리 (예: "변동소득")
         
         Returns:
             학습 성공 여부
         """
-        # 키워드 추출 (항목명에서 핵심 키워드 찾기)
-        keyword = self._extract_core_keyword(field_name)
+        return self.learn_from_gpt_results({field_name: (gpt_classified_type, category)}) > 0
+    
+    def learn_from_gpt_results(self, classified: Dict[str, Tuple[str, Optional[str]]]) -> int:
+        """
+        문서 하나의 GPT 분류 결과를 한 번에 학습
         
-        # 이미 DB에 있는지 확인
-        if self.rule_repo.keyword_exists(keyword):
-            logger.debug(f"[LEARN] 키워드 이미 존재: {keyword}")
-            return False
+        색인에 없는 키워드만 모아 INSERT ... ON DUPLICATE KEY 한 번으로 저장하고,
+        저장한 규칙은 현재 프로세스 색인에 바로 더하고, 규칙 버전을 올려 다른 워커에 알린다.
+        이미 있는 키워드(카테고리 없는 시드 "수당"/"공제" 등)에는 카테고리를 붙이지 않는다.
+        (부분 문자열 매칭이라 "야간수당" 등 모든 "*수당" 항목의 분류가 바뀌므로)
         
-        # IEType 변환
-        ie_type = IEType.INCOME if gpt_classified_type == 'income' else IEType.EXPENSE
+        Args:
+            classified: {항목명: ('income' or 'expense', 카테고리)}
         
-        # DB에 저장
-        success = self.rule_repo.save_keyword(keyword, ie_type)
+        Returns:
+            새로 학습한 키워드 수
+        """
+        rule_index = self.db_parser.rule_index
         
-        if success:
-            self.stats['new_keywords_learned'] += 1
-            logger.info(f"🎓 [LEARN] 새 키워드 학습: '{keyword}' → {ie_type.value}")
+        # 키워드 추출 + 중복 제거 (같은 키워드는 먼저 나온 분류 유지)
+        new_rules: Dict[str, Tuple[IEType, Optional[str]]] = {}
+        for field_name, (gpt_classified_type, category) in classified.items():
+            keyword = self._extract_core_keyword(field_name)
+            if not keyword or keyword in new_rules:
+                continue
+            if rule_index.contains(keyword):
+                logger.debug(f"[LEARN] 키워드 이미 존재: {keyword}")
+                continue
             
-            # 파서 키워드 재로드
-            self.db_parser.reload_keywords()
+            ie_type = IEType.INCOME if gpt_classified_type == 'income' else IEType.EXPENSE
+            new_rules[keyword] = (ie_type, category)
+        
+        if not new_rules:
+            return 0
+        
+        # DB에 일괄 저장 (다른 워커가 먼저 저장한 키워드는 DB에서 무시됨)
+        if not self.rule_repo.save_keywords(
+            [(keyword, ie_type, category) for keyword, (ie_type, category) in new_rules.items()]
+        ):
+            return 0
+        
+        self.stats['new_keywords_learned'] += len(new_rules)
+        for keyword, (ie_type, category) in new_rules.items():
+            logger.info(f"🎓 [LEARN] 새 키워드 학습: '{keyword}' → {ie_type.value} ({category or '카테고리 없음'})")
+        
+        # 현재 프로세스 색인에 반영 (+ 다른 워커에 버전 증가 알림)
+        rule_index.publish(
+            {"keyword": keyword, "ie_type": ie_type, "category": category}
+            for keyword, (ie_type, category) in new_rules.items()
+        )
         
-        return success
+        return len(new_rules)
     
     def _extract_core_keyword(self, field_name: str) -> str:
         """
@@ -129,11 +253,13 @@ class HybridParser:
         """
         # 일단 전체 항목명을 키워드로 사용
         # 향후 개선: NLP로 핵심 단어 추출
-        return field_name.strip().lower()
+        # 언더스코어는 항목명 매칭과 같게 띄어쓰기로
+        return field_name.replace('_', ' ').strip().lower()
     
     def _get_category(self, parsed: ParsedTransaction) -> str:
-        """파싱 결과에서 카테고리 추론"""
-        # 기본 카테고리 (추후 확장 가능)
+        """파싱 결과에서 카테고리 추론 (규칙에 카테고리가 없으면 소득/지출만)"""
+        if parsed.category:
+            return parsed.category
         if parsed.transaction_type == 'income':
             return '소득'
         else:
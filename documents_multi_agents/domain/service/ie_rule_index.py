@@ -0,0 +1,181 @@
+"""
+IE_RULE 키워드 색인 (프로세스 공용)
+요청마다 IE_RULE 전체를 조회하지 않고 시작 시 한 번 로드한 뒤 공유
+
+- 규칙 버전: Redis ie_rule:version 카운터 (키워드 학습 시 INCR)
+- 학습한 워커는 새 규칙을 현재 스냅샷에 더해 바로 교체 (재로드 없음)
+- 다른 워커는 버전이 바뀌면 전체 재로드 (테이블이 작아 전체 로드로 충분)
+- 버전 확인은 IE_RULE_VERSION_CHECK_SECONDS마다 한 번 (그 사이에는 Redis 조회도 없음)
+- 스냅샷은 읽기 전용, 새 스냅샷을 만든 뒤 통째로 교체
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from config.database.session import get_db_session
+from config.redis_config import get_redis
+from documents_multi_agents.domain.service.keyword_automaton import KeywordAutomaton
+from ieinfo.infrastructure.orm.ie_info import IEType
+from ieinfo.infrastructure.repository.ie_rule_repository_impl import IERuleRepositoryImpl
+from util.log.log import Log
+
+load_dotenv()
+logger = Log.get_logger()
+redis_client = get_redis()
+
+IE_RULE_VERSION_KEY = "ie_rule:version"
+IE_RULE_VERSION_CHECK_SECONDS = float(os.getenv("IE_RULE_VERSION_CHECK_SECONDS", "2"))
+
+
+class RuleSnapshot:
+    """로드된 규칙 (읽기 전용)"""
+
+    __slots__ = ("rules", "income_keywords", "expense_keywords", "by_keyword", "automaton")
+
+    def __init__(self, rules: Tuple[dict, ...] = ()):
+        # 로드 순서(id 오름차순, 학습 규칙은 뒤에 추가) 규칙 {"id", "keyword", "ie_type", "category", "sub_category", "priority"}
+        self.rules = rules
+        self.income_keywords = tuple(rule["keyword"] for rule in rules if rule["ie_type"] == IEType.INCOME)
+        self.expense_keywords = tuple(rule["keyword"] for rule in rules if rule["ie_type"] != IEType.INCOME)
+        self.by_keyword: Dict[str, dict] = {}
+        for rule in rules:
+            self.by_keyword.setdefault(rule["keyword"].lower(), rule)
+
+        # 값: 규칙 dict - 우선순위/길이가 같으면 소득 → 지출 순
+        self.automaton = KeywordAutomaton(
+            [(rule["keyword"], rule, rule["priority"]) for rule in rules if rule["ie_type"] == IEType.INCOME]
+            + [(rule["keyword"], rule, rule["priority"]) for rule in rules if rule["ie_type"] != IEType.INCOME]
+        )
+
+
+class IERuleIndex:
+    """
+    IE_RULE 키워드 색인 (Singleton)
+
+    DBRuleBasedParser/HybridParser가 요청마다 만들어져도 규칙 조회는 여기서 한 번만 한다.
+    """
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self._snapshot: Optional[RuleSnapshot] = None
+            self._version: Optional[int] = None
+            self._checked_at = 0.0
+            self._lock = threading.Lock()
+            self._stats = {"loads": 0, "errors": 0}
+            self.initialized = True
+
+    def snapshot(self) -> RuleSnapshot:
+        """현재 규칙 (버전 확인 주기가 지났으면 먼저 갱신)"""
+        if time.monotonic() - self._checked_at >= IE_RULE_VERSION_CHECK_SECONDS:
+            self.refresh()
+        return self._snapshot or RuleSnapshot()
+
+    def contains(self, keyword: str) -> bool:
+        return keyword.lower() in self.snapshot().by_keyword
+
+    def find(self, keyword: str) -> Optional[dict]:
+        """키워드 규칙 {"id", "keyword", "ie_type", "category", "sub_category", "priority"} (없으면 None)"""
+        return self.snapshot().by_keyword.get(keyword.lower())
+
+    def load(self):
+        """전체 로드 (서버 시작 시)"""
+        self.refresh(full=True)
+
+    def refresh(self, full: bool = False):
+        """
+        Redis 규칙 버전 확인 후 바뀌었으면 전체 재로드
+
+        Args:
+            full: 버전과 관계없이 재로드
+        """
+        with self._lock:
+            self._checked_at = time.monotonic()
+            version = self._read_version()
+
+            if not full and self._snapshot is not None and (version is None or version == self._version):
+                # 변경 없음 (Redis 오류 시에도 기존 규칙 유지)
+                return
+
+            try:
+                rules = IERuleRepositoryImpl(get_db_session()).find_all_rules()
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"[IE_RULE INDEX] 규칙 로드 실패: {str(e)}")
+                return
+
+            self._snapshot = snapshot = RuleSnapshot(tuple(rules))
+            self._version = version
+            self._stats["loads"] += 1
+
+            logger.info(
+                f"📚 [IE_RULE INDEX] 규칙 로드: {len(rules)}개 "
+                f"(소득 {len(snapshot.income_keywords)}개, 지출 {len(snapshot.expense_keywords)}개, version={version})"
+            )
+
+    def publish(self, rules: Iterable[dict] = ()):
+        """
+        규칙이 추가되었음을 알림 (버전 증가 → 다른 워커는 다음 확인 때 재로드)
+
+        현재 프로세스는 DB를 다시 읽지 않고 새 규칙을 스냅샷에 더해 교체한다.
+        그 사이 다른 워커도 규칙을 추가했으면(버전이 2 이상 증가) 다음 확인 때 전체 재로드.
+
+        Args:
+            rules: 저장한 규칙 [{"keyword", "ie_type", "category", ...}] (이미 있는 키워드는 무시)
+        """
+        try:
+            version = int(redis_client.incr(IE_RULE_VERSION_KEY))
+        except Exception as e:
+            logger.error(f"[IE_RULE INDEX] 버전 갱신 실패: {str(e)}")
+            version = None
+
+        with self._lock:
+            base = self._snapshot or RuleSnapshot()
+            known = set(base.by_keyword)
+            added = []
+            for rule in rules:
+                keyword = rule["keyword"].lower()
+                if keyword in known:
+                    continue
+                known.add(keyword)
+                # DB id는 다음 전체 로드 때 채워짐
+                added.append({"id": None, "sub_category": None, "priority": 0, **rule})
+            if added:
+                self._snapshot = RuleSnapshot(base.rules + tuple(added))
+            if version is not None and self._version is not None and version == self._version + 1:
+                self._version = version
+            logger.info(f"📚 [IE_RULE INDEX] 학습 규칙 반영: {len(added)}개 (version={self._version})")
+
+    def get_stats(self) -> dict:
+        snapshot = self._snapshot or RuleSnapshot()
+        return {
+            **self._stats,
+            "version": self._version,
+            "income_keywords": len(snapshot.income_keywords),
+            "expense_keywords": len(snapshot.expense_keywords),
+            "uncategorized": sum(1 for rule in snapshot.rules if not rule["category"]),
+        }
+
+    @staticmethod
+    def _read_version() -> Optional[int]:
+        try:
+            return int(redis_client.get(IE_RULE_VERSION_KEY) or 0)
+        except Exception as e:
+            logger.warning(f"[IE_RULE INDEX] 버전 확인 실패: {str(e)}")
+            return None
@@ -0,0 +1,116 @@
+"""
+키워드 다중 패턴 매처 (Aho–Corasick)
+IE_RULE 키워드 전체를 한 번에 컴파일하여 항목명을 한 번만 훑어 매칭
+
+- 대소문자 구분 없음 (키워드는 빌드 시 한 번만 소문자화)
+- 여러 키워드가 걸리면 우선순위(priority)가 높은 키워드 → 가장 긴 키워드 → 먼저 추가된 키워드 순
+- 빌드 후에는 읽기 전용 (재로드 시 새로 만들어 통째로 교체)
+"""
+
+from collections import deque
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class KeywordAutomaton(Generic[T]):
+    """
+    Aho–Corasick 오토마톤
+
+    사용 예:
+        automaton = KeywordAutomaton([("급여", "income"), ("보험료", "expense")])
+        automaton.longest_match("국민연금보험료")  # → ("보험료", "expense")
+
+    키워드는 (키워드, 값) 또는 (키워드, 값, 우선순위) - 우선순위 기본값 0
+    """
+
+    __slots__ = ("_goto", "_fail", "_best", "_patterns")
+
+    def __init__(self, keywords: Iterable[Union[Tuple[str, T], Tuple[str, T, int]]]):
+        # 노드 0 = 루트
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 노드에서 끝나는 가장 우선순위 높은 패턴 번호 (실패 링크로 이어지는 접미사 포함, 없으면 -1)
+        self._best: List[int] = [-1]
+        # 패턴 번호 → (원래 키워드, 값, 소문자 길이, 우선순위)
+        self._patterns: List[Tuple[str, T, int, int]] = []
+
+        for keyword, value, *priority in keywords:
+            self._add(keyword, value, priority[0] if priority else 0)
+        self._build_fail_links()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def _add(self, keyword: str, value: T, priority: int):
+        lowered = keyword.lower()
+        if not lowered:
+            return
+
+        node = 0
+        for char in lowered:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(-1)
+            node = next_node
+
+        # 같은 키워드가 다시 오면 먼저 추가된 것 유지
+        if self._best[node] == -1:
+            self._best[node] = len(self._patterns)
+            self._patterns.append((keyword, value, len(lowered), priority or 0))
+
+    def _build_fail_links(self):
+        """BFS로 실패 링크 계산, 각 노드의 최우선 패턴을 접미사 노드에서 물려받음"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+
+                # 접미사 노드(더 얕음, 이미 계산됨)의 최우선 패턴과 비교
+                inherited = self._best[self._fail[child]]
+                if inherited != -1 and self._prefer(inherited, self._best[child]):
+                    self._best[child] = inherited
+                queue.append(child)
+
+    def _prefer(self, candidate: int, current: int) -> bool:
+        """candidate가 current보다 우선인지 (우선순위 → 길이 → 먼저 추가된 순)"""
+        if current == -1:
+            return True
+        _, _, candidate_length, candidate_priority = self._patterns[candidate]
+        _, _, current_length, current_priority = self._patterns[current]
+        return (-candidate_priority, -candidate_length, candidate) < (-current_priority, -current_length, current)
+
+    def longest_match(self, text: str) -> Optional[Tuple[str, T]]:
+        """
+        text에 포함된 키워드 중 가장 우선인 것 (없으면 None)
+        우선순위가 모두 같으면 가장 긴 키워드
+
+        Returns:
+            (키워드, 값)
+        """
+        goto, fail, best = self._goto, self._fail, self._best
+        node = 0
+        found = -1
+
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            candidate = best[node]
+            if candidate != -1 and self._prefer(candidate, found):
+                found = candidate
+
+        if found == -1:
+            return None
+        keyword, value, _, _ = self._patterns[found]
+        return keyword, value
@@ -0,0 +1,72 @@
+"""
+LLM 응답 후처리
+마크다운/주석/구분선 제거와 "항목명: 금액" 파싱을 미리 컴파일한 정규식으로 처리
+
+- clean_llm_output: 조언형 응답 정리 (별표, ※ 주석 줄, --- 이후 제거)
+- parse_amount_items: 추출 응답 → {항목명: 금액} (합계성 중복 항목 제거)
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+_COMMENT_PATTERN = re.compile(r'※[^\n]*')
+_SEPARATOR = "---"
+_ITEM_PATTERN = re.compile(r'([가-힣\w\s]+)\s*:\s*([\d,]+)')
+
+# 같은 금액이면 중복으로 보는 합계성 키워드
+DUPLICATE_KEYWORDS: Tuple[str, ...] = ("총급여", "총소득", "합계", "총합", "총액")
+_TOTAL_LABEL_PATTERN = re.compile("|".join(map(re.escape, DUPLICATE_KEYWORDS)))
+
+
+def clean_llm_output(text: str) -> str:
+    """
+    AI 응답 전처리: 마크다운, 설명문 제거
+
+    replace("**") → replace("*") → re.sub('※.*') → re.sub('---.*', DOTALL) 순서와 같은 결과
+    """
+    text = text.replace("*", "")
+    if "※" in text:
+        text = _COMMENT_PATTERN.sub('', text)
+    separator_at = text.find(_SEPARATOR)
+    return text if separator_at < 0 else text[:separator_at]
+
+
+def _is_total_label(field: str) -> bool:
+    return _TOTAL_LABEL_PATTERN.search(field) is not None
+
+
+def parse_amount_items(answer: str) -> Tuple[Dict[str, str], int]:
+    """
+    추출 응답 → {항목명: 금액(콤마 제거)}
+
+    같은 금액의 항목이 이미 있고 둘 중 하나가 합계성 항목("총급여", "합계" 등)이면 뒤에 나온 항목은 건너뛴다.
+    금액별 색인(dict)으로 확인하므로 항목 수에 선형이다.
+
+    Returns:
+        (항목 dict, 건너뛴 중복 항목 수)
+    """
+    items: Dict[str, str] = {}
+    # 금액 → 그 금액의 항목명들 (합계성 여부는 금액이 겹칠 때만 확인)
+    by_amount: Dict[str, List[str]] = {}
+    duplicates = 0
+
+    for match in _ITEM_PATTERN.finditer(clean_llm_output(answer)):
+        field, value = match.groups()
+        field = field.strip()
+        value = value.replace(",", "").strip()
+
+        same_amount = by_amount.get(value)
+        if same_amount and (_is_total_label(field) or any(map(_is_total_label, same_amount))):
+            duplicates += 1
+            continue
+
+        previous = items.get(field)
+        if previous is None:
+            by_amount.setdefault(value, []).append(field)
+        elif previous != value:
+            # 같은 항목명이 다른 금액으로 다시 나오면 나중 값으로 교체
+            by_amount[previous].remove(field)
+            by_amount.setdefault(value, []).append(field)
+        items[field] = value
+
+    return items, duplicates
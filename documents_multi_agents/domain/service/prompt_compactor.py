@@ -0,0 +1,127 @@
+"""
+문서 QA 프롬프트 압축기
+LLM에 보내기 전에 금액이 있는 부분(+ 바로 앞 항목명)만 남기고 토큰 예산 단위로 분할
+
+처리 흐름:
+1. 줄(페이지)마다 금액 위치를 찾아 앞쪽 라벨 문맥과 함께 구간 추출
+2. 반복되는 머리글/바닥글 등 동일 구간 제거
+3. 토큰 예산을 넘으면 구간 경계에서 여러 조각으로 분할 (조각별 동시 호출 후 병합)
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Iterable, List
+
+from dotenv import load_dotenv
+
+from util.llm.token_counter import count_tokens
+
+load_dotenv()
+
+# 문서 본문에 허용하는 토큰 수 (프롬프트 지시문 제외)
+PROMPT_DOCUMENT_TOKEN_BUDGET = int(os.getenv("PROMPT_DOCUMENT_TOKEN_BUDGET", "6000"))
+# 금액 앞에 함께 남길 라벨 문맥 길이 (문자)
+PROMPT_COMPACT_LABEL_CHARS = int(os.getenv("PROMPT_COMPACT_LABEL_CHARS", "40"))
+
+# 1,000 / 1,000원 / ₩1,000 / 10000 / 500원 (1~3자리 단독 숫자는 날짜·페이지 번호일 가능성이 높아 제외)
+AMOUNT_PATTERN = re.compile(r'(?:₩\s*)?(?:\d{1,3}(?:,\d{3})+|\d{4,})(?:\.\d+)?(?:\s*원)?|\d+\s*원')
+
+
+@dataclass
+class CompactedDocument:
+    chunks: List[str]
+    original_tokens: int
+    compacted_tokens: int
+    segment_count: int
+
+
+def extract_amount_segments(text: str) -> List[str]:
+    """
+    금액이 포함된 구간 목록 (문서 순서 유지, 중복 제거)
+
+    가까운 금액끼리는 하나의 구간으로 합친다. (표의 한 행)
+    """
+    segments = []
+    seen = set()
+    for line in text.splitlines():
+        spans: List[List[int]] = []
+        for match in AMOUNT_PATTERN.finditer(line):
+            start = max(0, match.start() - PROMPT_COMPACT_LABEL_CHARS)
+            if spans and start <= spans[-1][1]:
+                spans[-1][1] = match.end()
+            else:
+                spans.append([start, match.end()])
+
+        for start, end in spans:
+            segment = line[start:end]
+            # 잘린 첫 단어 제거 (라벨 문맥이 단어 중간에서 시작한 경우)
+            if start > 0 and not line[start - 1].isspace() and " " in segment:
+                segment = segment.split(" ", 1)[1]
+            segment = re.sub(r'\s+', ' ', segment).strip()
+
+            if segment and segment not in seen:
+                seen.add(segment)
+                segments.append(segment)
+    return segments
+
+
+def split_by_budget(segments: Iterable[str], budget: int, model: str = "gpt-4.1") -> List[str]:
+    """구간을 순서대로 묶어 조각마다 budget 토큰 이하로 분할 (구간 하나가 예산보다 크면 문자 단위로 자름)"""
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for segment in segments:
+        tokens = count_tokens(segment, model) + 1  # 줄바꿈
+        if tokens > budget:
+            # 한 구간이 예산 초과 → 비율대로 잘라서 별도 조각
+            size = max(1, len(segment) * budget // tokens)
+            pieces = [segment[i:i + size] for i in range(0, len(segment), size)]
+        else:
+            pieces = [segment]
+
+        for piece in pieces:
+            piece_tokens = tokens if len(pieces) == 1 else count_tokens(piece, model) + 1
+            if current and current_tokens + piece_tokens > budget:
+                chunks.append("\n".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def compact_document(text: str, budget: int = PROMPT_DOCUMENT_TOKEN_BUDGET, model: str = "gpt-4.1") -> CompactedDocument:
+    """
+    문서 압축 + 토큰 예산 분할
+
+    금액이 하나도 없으면 원문을 그대로 (예산 단위로 분할만 해서) 사용한다.
+    """
+    original_tokens = count_tokens(text, model)
+    segments = extract_amount_segments(text)
+    if not segments:
+        segments = [line for line in text.splitlines() if line.strip()]
+
+    chunks = split_by_budget(segments, budget, model) or [text]
+    return CompactedDocument(
+        chunks=chunks,
+        original_tokens=original_tokens,
+        compacted_tokens=sum(count_tokens(chunk, model) for chunk in chunks),
+        segment_count=len(segments)
+    )
+
+
+def merge_answers(answers: Iterable[str]) -> str:
+    """조각별 "항목명: 금액" 응답 병합 (같은 줄 중복 제거, 순서 유지)"""
+    merged = []
+    seen = set()
+    for answer in answers:
+        for line in answer.splitlines():
+            line = line.strip()
+            if line and line not in seen:
+                seen.add(line)
+                merged.append(line)
+    return "\n".join(merged)
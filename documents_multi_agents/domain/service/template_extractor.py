@@ -0,0 +1,256 @@
+"""
+템플릿 기반 구조화 추출기
+원천징수영수증, 급여명세서처럼 형식이 정해진 문서는 GPT 없이 "항목명: 금액"을 추출
+
+처리 흐름:
+1. 공백을 제거한 텍스트에서 양식 지문(고정 문구)으로 템플릿 판별
+2. 미리 컴파일한 정규식으로 항목별 금액 추출 (문서 종류에 맞는 항목만)
+3. 합계 칸(총급여, 지급합계, 공제합계)은 추출하지 않고 항목 합과 맞는지 확인만 함
+   (세션 항목은 모두 더해서 총소득/총지출을 내므로 합계를 넣으면 이중 집계)
+4. 알 수 없는 양식, 찾은 항목 부족, 합계 불일치면 None → GPT 추출로 폴백
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+from util.log.log import Log
+from util.session.doc_type import classify_doc_type
+
+logger = Log.get_logger()
+
+# 항목명 뒤 금액 (콤마 형식 또는 4자리 이상 숫자, ⑬ 같은 원문자는 \d가 아님)
+_AMOUNT = r'(\d{1,3}(?:,\d{3})+|\d{4,})'
+# 항목명과 금액 사이: 괄호 설명 허용, 한글/숫자가 끼면 다른 칸으로 보고 매칭하지 않음
+_GAP = r'(?:\s*\([^)]{0,30}\))?[^\d가-힣]{0,12}?'
+
+
+def _label_pattern(labels: Sequence[str]) -> Pattern:
+    """
+    항목명 후보 → 정규식
+
+    양식 PDF는 "급 여"처럼 글자 사이에 공백이 들어가므로 글자마다 \\s* 허용.
+    "총급여"의 "급여", "지방소득세"의 "소득세"가 잡히지 않도록 앞에 한글이 오면 제외.
+    """
+    alternatives = sorted(labels, key=len, reverse=True)
+    label_regex = "|".join(r'\s*'.join(map(re.escape, label)) for label in alternatives)
+    return re.compile(rf'(?<![가-힣])(?:{label_regex}){_GAP}{_AMOUNT}')
+
+
+@dataclass
+class DocumentTemplate:
+    """
+    문서 양식 정의
+
+    Attributes:
+        name: 템플릿 이름 (통계 키)
+        fingerprint: 지문 그룹 목록 - 그룹마다 하나 이상이 (공백 제거 텍스트에) 있어야 함
+        income_fields: 소득 문서에서 추출할 (항목명, 항목명 후보들)
+        expense_fields: 지출 문서에서 추출할 (항목명, 항목명 후보들)
+        income_total: 소득 항목 합계 칸 후보들 (검증용, 추출 결과에는 넣지 않음)
+        expense_total: 지출 항목 합계 칸 후보들 (검증용, 추출 결과에는 넣지 않음)
+        total_excludes: 합계 칸에 포함되지 않는 항목명 (예: 총급여에 없는 비과세소득)
+        min_fields: 템플릿 추출로 인정할 최소 항목 수
+    """
+    name: str
+    fingerprint: Tuple[Tuple[str, ...], ...]
+    income_fields: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    expense_fields: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    income_total: Tuple[str, ...] = ()
+    expense_total: Tuple[str, ...] = ()
+    total_excludes: Tuple[str, ...] = ()
+    min_fields: int = 2
+    _patterns: Dict[str, List[Tuple[str, Pattern]]] = field(default_factory=dict, repr=False)
+    _total_patterns: Dict[str, Pattern] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._patterns = {
+            "income": [(name, _label_pattern(labels)) for name, labels in self.income_fields],
+            "expense": [(name, _label_pattern(labels)) for name, labels in self.expense_fields],
+        }
+        self._total_patterns = {
+            side: _label_pattern(labels)
+            for side, labels in (("income", self.income_total), ("expense", self.expense_total))
+            if labels
+        }
+
+    def matches(self, compact_text: str) -> bool:
+        return all(any(phrase in compact_text for phrase in group) for group in self.fingerprint)
+
+    def extract(self, text: str, kind: str) -> Optional[Dict[str, str]]:
+        """
+        {항목명: 금액(콤마 제거)} - 같은 항목은 처음 나온 값 사용
+
+        합계 칸이 있는데 항목 합과 다르면(놓친 항목이 있음) None
+        """
+        items = {}
+        for side in (kind,) if kind in self._patterns else ("income", "expense"):
+            side_items = {}
+            for name, pattern in self._patterns[side]:
+                amount = self._search_amount(pattern, text)
+                if amount:
+                    side_items[name] = str(amount)
+
+            total_pattern = self._total_patterns.get(side)
+            total = self._search_amount(total_pattern, text) if total_pattern and side_items else None
+            if total:
+                field_sum = sum(int(amount) for name, amount in side_items.items() if name not in self.total_excludes)
+                if total != field_sum:
+                    logger.info(f"[TEMPLATE] {self.name}: {side} total {total} != sum of fields {field_sum}")
+                    return None
+            items.update(side_items)
+        return items
+
+    @staticmethod
+    def _search_amount(pattern: Pattern, text: str) -> int:
+        match = pattern.search(text)
+        return int(match.group(1).replace(",", "")) if match else 0
+
+
+WITHHOLDING_RECEIPT = DocumentTemplate(
+    name="withholding_receipt",
+    fingerprint=(
+        ("근로소득원천징수영수증", "근로소득지급명세서"),
+        ("결정세액",),
+        ("총급여", "근로소득공제"),
+    ),
+    income_fields=(
+        ("급여", ("급여",)),
+        ("상여", ("상여",)),
+        ("인정상여", ("인정상여",)),
+        ("비과세소득", ("비과세소득계", "비과세소득")),
+    ),
+    expense_fields=(
+        ("국민연금보험료", ("국민연금보험료",)),
+        ("건강보험료", ("건강보험료",)),
+        ("고용보험료", ("고용보험료",)),
+        # 결정세액은 기납부세액과 같은 세금의 정산 결과라 기납부세액(실제 원천징수액)만 사용
+        ("기납부세액", ("기납부세액",)),
+    ),
+    # 총급여 = 급여 + 상여 + 인정상여 (비과세소득 제외)
+    income_total=("총급여",),
+    total_excludes=("비과세소득",),
+)
+
+PAYSLIP = DocumentTemplate(
+    name="payslip",
+    fingerprint=(
+        ("급여명세서", "임금명세서", "급여명세표", "급여지급명세서"),
+        ("공제",),
+        ("실수령액", "차인지급액", "실지급액", "실지급총액"),
+    ),
+    income_fields=(
+        ("기본급", ("기본급",)),
+        ("연장근로수당", ("연장근로수당", "연장수당")),
+        ("야간근로수당", ("야간근로수당", "야간수당")),
+        ("휴일근로수당", ("휴일근로수당", "휴일수당")),
+        ("직책수당", ("직책수당",)),
+        ("식대", ("식대",)),
+        ("상여금", ("상여금",)),
+        ("성과급", ("성과급",)),
+    ),
+    expense_fields=(
+        ("국민연금", ("국민연금",)),
+        ("건강보험", ("건강보험료", "건강보험")),
+        ("장기요양보험", ("장기요양보험료", "장기요양보험")),
+        ("고용보험", ("고용보험료", "고용보험")),
+        ("소득세", ("소득세",)),
+        ("지방소득세", ("지방소득세",)),
+    ),
+    income_total=("지급합계", "지급총액", "지급액계"),
+    expense_total=("공제합계", "공제총액", "공제액계"),
+)
+
+DEFAULT_TEMPLATES: Tuple[DocumentTemplate, ...] = (WITHHOLDING_RECEIPT, PAYSLIP)
+
+
+class TemplateExtractor:
+    """
+    템플릿 기반 추출기 (Singleton)
+
+    템플릿 적중률은 프로세스 단위로 집계한다. (get_stats)
+    """
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self, templates: Sequence[DocumentTemplate] = DEFAULT_TEMPLATES):
+        if not hasattr(self, 'initialized'):
+            self.templates = tuple(templates)
+            self._stats = {"total": 0, "template_hit": 0, "fallback": 0, "insufficient_fields": 0, "total_mismatch": 0}
+            self._template_hits: Dict[str, int] = {template.name: 0 for template in self.templates}
+            self._lock = threading.Lock()
+            self.initialized = True
+
+    def detect(self, text: str) -> Optional[DocumentTemplate]:
+        """양식 판별 (알 수 없으면 None)"""
+        compact_text = re.sub(r'\s+', '', text)
+        for template in self.templates:
+            if template.matches(compact_text):
+                return template
+        return None
+
+    def extract(self, text: str, type_of_doc: str) -> Optional[str]:
+        """
+        알려진 양식이면 "항목명: 금액" 줄 목록 반환 (qa_on_document 응답과 같은 형식)
+
+        Args:
+            text: PDF에서 추출한 텍스트
+            type_of_doc: 문서 종류 (소득/지출)
+
+        Returns:
+            추출 결과 문자열, 알 수 없는 양식이거나 항목이 부족하면 None (GPT로 폴백)
+        """
+        template = self.detect(text)
+        items = template.extract(text, classify_doc_type(type_of_doc) or "other") if template else {}
+
+        with self._lock:
+            self._stats["total"] += 1
+            if template is None:
+                self._stats["fallback"] += 1
+            elif items is None:
+                self._stats["fallback"] += 1
+                self._stats["total_mismatch"] += 1
+            elif len(items) < template.min_fields:
+                self._stats["fallback"] += 1
+                self._stats["insufficient_fields"] += 1
+            else:
+                self._stats["template_hit"] += 1
+                self._template_hits[template.name] += 1
+
+        if template is None:
+            logger.info("[TEMPLATE] Unknown layout → LLM fallback")
+            return None
+        if items is None:
+            logger.info(f"[TEMPLATE] {template.name}: totals do not match fields → LLM fallback")
+            return None
+        if len(items) < template.min_fields:
+            logger.info(f"[TEMPLATE] {template.name}: only {len(items)} fields matched → LLM fallback")
+            return None
+
+        logger.info(f"[TEMPLATE] {template.name}: extracted {len(items)} fields without LLM")
+        return "\n".join(f"{name}: {amount}" for name, amount in items.items())
+
+    def get_stats(self) -> Dict:
+        """
+        템플릿 적중 통계
+
+        Returns:
+            {"total": 10, "template_hit": 7, "fallback": 3, "hit_rate": 0.7, "templates": {...}, ...}
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["templates"] = dict(self._template_hits)
+        stats["hit_rate"] = round(stats["template_hit"] / stats["total"], 4) if stats["total"] else 0.0
+        return stats
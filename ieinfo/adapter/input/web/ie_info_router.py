@@ -2,14 +2,15 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 
 from account.adapter.input.web.session_helper import get_current_user
-from config.redis_config import get_redis
+from config.redis_config import get_async_redis
 from ieinfo.application.usecase.ie_info_usecase import IEInfoUseCase
+from jobs.ie_save_scheduler import IESaveScheduler
 from util.log.log import Log
 
 logger = Log.get_logger()
 ie_info_router = APIRouter(tags=["ie_info_router"])
 usecase = IEInfoUseCase().get_instance()
-redis_client = get_redis()
+redis_client = get_async_redis()
 
 
 @ie_info_router.post("/save")
@@ -31,7 +32,7 @@ async def save_ie_data_to_db(
     """
     try:
         # 로그인 여부 확인
-        user_token = redis_client.hget(session_id, "USER_TOKEN")
+        user_token = await redis_client.hget(session_id, "USER_TOKEN")
         
         if not user_token:
             raise HTTPException(
@@ -69,3 +70,17 @@ async def save_ie_data_to_db(
     except Exception as e:
         logger.error(f"Error in save_ie_data_to_db: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@ie_info_router.get("/save-status")
+async def get_ie_save_status(session_id: str = Depends(get_current_user)):
+    """
+    업로드 후 자동 DB 저장(백그라운드) 상태 조회
+
+    Returns:
+        {"status": "pending" | "saved" | "skipped" | "failed", "saved_count": ..., "attempts": ..., ...}
+    """
+    status = await IESaveScheduler.get_instance().get_status(session_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="예약되었거나 완료된 저장 작업이 없습니다.")
+    return status
@@ -3,7 +3,7 @@ IE_RULE Repository Port (인터페이스)
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ieinfo.infrastructure.orm.ie_info import IEType
 
 
@@ -21,10 +21,27 @@ class IERuleRepositoryPort(ABC):
         pass
     
     @abstractmethod
-    def save_keyword(self, keyword: str, ie_type: IEType) -> bool:
+    def find_all_rules(self) -> List[dict]:
+        """분류용 전체 규칙 조회 (id 오름차순)"""
+        pass
+    
+    @abstractmethod
+    def save_keyword(
+        self,
+        keyword: str,
+        ie_type: IEType,
+        category: Optional[str] = None,
+        sub_category: Optional[str] = None,
+        priority: int = 0
+    ) -> bool:
         """새 키워드 저장 (중복 시 무시)"""
         pass
     
+    @abstractmethod
+    def save_keywords(self, rules: List[Tuple[str, IEType, Optional[str]]]) -> bool:
+        """여러 키워드를 한 번에 저장 (이미 있는 키워드는 변경 없음)"""
+        pass
+    
     @abstractmethod
     def keyword_exists(self, keyword: str) -> bool:
         """키워드 존재 여부 확인"""
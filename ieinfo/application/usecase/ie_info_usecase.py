@@ -6,6 +6,7 @@ from config.redis_config import get_redis
 from ieinfo.infrastructure.orm.ie_info import IEInfo, IEType
 from ieinfo.infrastructure.repository.ie_info_repository_impl import IEInfoRepositoryImpl
 from util.log.log import Log
+from util.session.session_snapshot import SessionSnapshotService, classify_doc_type
 
 logger = Log.get_logger()
 
@@ -29,6 +30,7 @@ class IEInfoUseCase:
             self.repository = IEInfoRepositoryImpl.get_instance()
             self.redis_client = get_redis()
             self.crypto = Crypto.get_instance()
+            self.session_snapshot_service = SessionSnapshotService.get_instance()
     
     def save_ie_data_from_redis(self, session_id: str, year: int, month: int) -> Dict:
         """
@@ -43,10 +45,10 @@ class IEInfoUseCase:
             저장 결과 정보
         """
         try:
-            # Redis에서 데이터 가져오기
-            encrypted_data = self.redis_client.hgetall(session_id)
+            # Redis에서 데이터 가져오기 (복호화된 스냅샷)
+            snapshot = self.session_snapshot_service.load(session_id)
             
-            if not encrypted_data:
+            if snapshot.field_count == 0:
                 logger.warning(f"No data found in Redis for session: {session_id}")
                 return {
                     "success": False,
@@ -60,39 +62,14 @@ class IEInfoUseCase:
             ie_info_list = []
             skipped_count = 0
             
-            for key_bytes, value_bytes in encrypted_data.items():
+            # 복호화/"타입:필드명" 파싱은 스냅샷에서 처리됨
+            for doc_type, field_name, value_plain in snapshot.items:
                 try:
-                    # bytes를 문자열로 변환
-                    if isinstance(key_bytes, bytes):
-                        key_str = key_bytes.decode('utf-8')
-                    else:
-                        key_str = str(key_bytes)
-                    
-                    if isinstance(value_bytes, bytes):
-                        value_str = value_bytes.decode('utf-8')
-                    else:
-                        value_str = str(value_bytes)
-                    
-                    # USER_TOKEN 제외
-                    if key_str == "USER_TOKEN":
-                        continue
-                    
-                    # 복호화
-                    key_plain = self.crypto.dec_data(key_str)
-                    value_plain = self.crypto.dec_data(value_str)
-                    
-                    # "타입:필드명" 형태 파싱
-                    if ":" not in key_plain:
-                        logger.warning(f"Invalid key format: {key_plain}")
-                        skipped_count += 1
-                        continue
-                    
-                    doc_type, field_name = key_plain.split(":", 1)
-                    
                     # IE_Type 결정
-                    if "소득" in doc_type or "income" in doc_type.lower():
+                    kind = classify_doc_type(doc_type)
+                    if kind == "income":
                         ie_type = IEType.INCOME
-                    elif "지출" in doc_type or "expense" in doc_type.lower():
+                    elif kind == "expense":
                         ie_type = IEType.EXPENSE
                     else:
                         logger.warning(f"Unknown document type: {doc_type}")
@@ -150,6 +127,7 @@ class IEInfoUseCase:
             traceback.print_exc()
             return {
                 "success": False,
-                "message": f"데이터 저장 중 오류가 발생했습니다: {str(e)}"
+                "message": f"데이터 저장 중 오류가 발생했습니다: {str(e)}",
+                "error": str(e)  # 재시도 대상 (DB/Redis 오류)
             }
 
@@ -22,12 +22,22 @@ class IERule(Base):
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     ie_type = Column(SAEnum(IEType, native_enum=True), nullable=False, index=True)
     keyword = Column(String(100), nullable=False, unique=True, index=True)
+    # 세부 카테고리 (고정소득/변동소득/기타소득, 고정지출/변동지출/저축 및 투자/기타 및 예비비)
+    # NULL이면 소득/지출 구분만 알고 카테고리는 GPT가 분류
+    category = Column(String(50), nullable=True)
+    # 하위 카테고리 (예: 급여/상여/보험/카드) - 분류 결과 구조에는 영향 없음
+    sub_category = Column(String(50), nullable=True)
+    # 매칭 우선순위 (여러 키워드가 걸리면 큰 값 우선, 같으면 긴 키워드 우선)
+    priority = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=func.now(), nullable=False)
     
     # 복합 인덱스: 타입 + 키워드 조회 최적화
+    # 카테고리 인덱스: 카테고리 단위 조회 최적화
+    # (IERuleIndex 전체 로드는 인덱스 없이 기본 키 순서로 처리)
     __table_args__ = (
         Index('idx_ie_type_keyword', 'ie_type', 'keyword'),
+        Index('idx_ie_rule_category', 'category', 'sub_category'),
     )
     
     def __repr__(self):
-        return f"<IERule(id={self.id}, type={self.ie_type.value}, keyword='{self.keyword}')>"
+        return f"<IERule(id={self.id}, type={self.ie_type.value}, keyword='{self.keyword}', category={self.category!r}, sub_category={self.sub_category!r}, priority={self.priority})>"
@@ -2,7 +2,8 @@
 IE_RULE Repository 구현체
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -56,13 +57,50 @@ class IERuleRepositoryImpl(IERuleRepositoryPort):
             return [rule.keyword for rule in rules]
         finally:
             self.session.close()
-    def save_keyword(self, keyword: str, ie_type: IEType) -> bool:
+    def find_all_rules(self) -> List[dict]:
+        try:
+            """
+            분류에 필요한 컬럼만 전체 규칙 조회 (IERuleIndex 로드용)
+            
+            Returns:
+                규칙 리스트 [{"id": 1, "keyword": "급여", "ie_type": IEType.INCOME, "category": "고정소득",
+                             "sub_category": "급여", "priority": 0}, ...]
+                (id 오름차순)
+            """
+            rows = self.session.query(
+                IERule.id, IERule.keyword, IERule.ie_type, IERule.category, IERule.sub_category, IERule.priority
+            ).order_by(IERule.id).all()
+
+            return [
+                {
+                    "id": row.id,
+                    "keyword": row.keyword,
+                    "ie_type": row.ie_type,
+                    "category": row.category,
+                    "sub_category": row.sub_category,
+                    "priority": row.priority or 0
+                }
+                for row in rows
+            ]
+        finally:
+            self.session.close()
+    def save_keyword(
+        self,
+        keyword: str,
+        ie_type: IEType,
+        category: Optional[str] = None,
+        sub_category: Optional[str] = None,
+        priority: int = 0
+    ) -> bool:
         """
         새 키워드 저장 (중복 시 무시)
         
         Args:
             keyword: 저장할 키워드
             ie_type: INCOME 또는 EXPENSE
+            category: 세부 카테고리 (예: "고정소득", 없으면 None)
+            sub_category: 하위 카테고리 (예: "급여", 없으면 None)
+            priority: 매칭 우선순위 (기본 0)
         
         Returns:
             성공 여부
@@ -80,7 +118,10 @@ class IERuleRepositoryImpl(IERuleRepositoryPort):
             # 새 규칙 추가
             new_rule = IERule(
                 keyword=keyword,
-                ie_type=ie_type
+                ie_type=ie_type,
+                category=category,
+                sub_category=sub_category,
+                priority=priority
             )
             
             self.session.add(new_rule)
@@ -100,6 +141,43 @@ class IERuleRepositoryImpl(IERuleRepositoryPort):
         finally:
             self.session.close()
 
+    def save_keywords(self, rules: List[Tuple[str, IEType, Optional[str]]]) -> bool:
+        """
+        여러 키워드를 INSERT ... ON DUPLICATE KEY UPDATE 한 번으로 저장
+        (이미 있는 키워드는 그대로 유지 - 먼저 저장된 타입/카테고리 우선)
+        
+        Args:
+            rules: [(키워드, INCOME 또는 EXPENSE, 카테고리 또는 None), ...]
+        
+        Returns:
+            성공 여부
+        """
+        if not rules:
+            return True
+        
+        try:
+            stmt = mysql_insert(IERule).values(
+                [
+                    {"keyword": keyword, "ie_type": ie_type, "category": category}
+                    for keyword, ie_type, category in rules
+                ]
+            )
+            # 중복 키워드는 변경 없음 (no-op 업데이트)
+            stmt = stmt.on_duplicate_key_update(keyword=IERule.keyword)
+            
+            self.session.execute(stmt)
+            self.session.commit()
+            
+            logger.info(f"✅ [IE_RULE] 키워드 일괄 저장: {len(rules)}개")
+            return True
+            
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"[IE_RULE] 키워드 일괄 저장 오류: {str(e)}")
+            return False
+        finally:
+            self.session.close()
+
     def keyword_exists(self, keyword: str) -> bool:
 
         try:
@@ -127,7 +205,7 @@ class IERuleRepositoryImpl(IERuleRepositoryPort):
             모든 규칙 조회
             
             Returns:
-                규칙 리스트 [{"id": 1, "keyword": "급여", "ie_type": "INCOME"}, ...]
+                규칙 리스트 [{"id": 1, "keyword": "급여", "ie_type": "INCOME", "category": "고정소득", ...}, ...]
             """
             rules = self.session.query(IERule).all()
 
@@ -136,6 +214,9 @@ class IERuleRepositoryImpl(IERuleRepositoryPort):
                     "id": rule.id,
                     "keyword": rule.keyword,
                     "ie_type": rule.ie_type.value,
+                    "category": rule.category,
+                    "sub_category": rule.sub_category,
+                    "priority": rule.priority,
                     "created_at": rule.created_at.isoformat() if rule.created_at else None
                 }
                 for rule in rules
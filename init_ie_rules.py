@@ -23,6 +23,24 @@ INITIAL_EXPENSE_KEYWORDS = [
     "공제", "공제액", "차감"
 ]
 
+# 초기 키워드 카테고리 {키워드: (카테고리, 하위 카테고리)}
+# (분류 기준이 분명한 키워드만, 나머지는 GPT 분류 후 학습으로 채움)
+INITIAL_KEYWORD_CATEGORIES = {
+    # 소득
+    "급여": ("고정소득", "급여"), "월급": ("고정소득", "급여"), "연봉": ("고정소득", "급여"),
+    "봉급": ("고정소득", "급여"), "임금": ("고정소득", "급여"),
+    "식대": ("고정소득", "수당"), "주거수당": ("고정소득", "수당"),
+    "상여": ("변동소득", "상여"), "상여금": ("변동소득", "상여"), "보너스": ("변동소득", "상여"),
+    "성과급": ("변동소득", "성과급"), "인센티브": ("변동소득", "성과급"),
+    "이자": ("기타소득", "이자"), "이자소득": ("기타소득", "이자"),
+    "배당": ("기타소득", "배당"), "배당금": ("기타소득", "배당"),
+    # 지출
+    "보험료": ("고정지출", "보험"), "건강보험": ("고정지출", "보험"), "고용보험": ("고정지출", "보험"),
+    "산재보험": ("고정지출", "보험"), "국민연금": ("고정지출", "연금"),
+    "카드": ("변동지출", "카드"), "신용카드": ("변동지출", "카드"), "체크카드": ("변동지출", "카드"),
+    "카드사용액": ("변동지출", "카드"),
+}
+
 
 def init_ie_rules():
     """IE_RULE 테이블에 초기 키워드 삽입"""
@@ -38,7 +56,7 @@ def init_ie_rules():
     income_count = 0
     print("📥 소득 키워드 삽입 중...")
     for keyword in INITIAL_INCOME_KEYWORDS:
-        if repo.save_keyword(keyword, IEType.INCOME):
+        if repo.save_keyword(keyword, IEType.INCOME, *INITIAL_KEYWORD_CATEGORIES.get(keyword, (None, None))):
             income_count += 1
             print(f"  ✅ {keyword}")
         else:
@@ -48,7 +66,7 @@ def init_ie_rules():
     expense_count = 0
     print("\n📥 지출 키워드 삽입 중...")
     for keyword in INITIAL_EXPENSE_KEYWORDS:
-        if repo.save_keyword(keyword, IEType.EXPENSE):
+        if repo.save_keyword(keyword, IEType.EXPENSE, *INITIAL_KEYWORD_CATEGORIES.get(keyword, (None, None))):
             expense_count += 1
             print(f"  ✅ {keyword}")
         else:
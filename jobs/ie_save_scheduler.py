@@ -0,0 +1,203 @@
+"""
+업로드 후 IE_INFO 자동 저장 스케줄러
+요청 처리 경로에서 DB 저장(세션 전체 재조회/복호화 → DELETE → bulk INSERT)을 분리
+
+- 디바운스: 같은 세션의 저장 요청이 IE_SAVE_DEBOUNCE_SECONDS 안에 다시 오면 한 번의 저장으로 병합
+  (계속 업로드되더라도 첫 요청 후 IE_SAVE_MAX_DELAY_SECONDS 안에는 저장)
+- 저장 중에 새 요청이 오면 저장이 끝난 뒤 한 번 더 저장
+- DB/Redis 오류는 지수 백오프로 재시도, 결과는 ie_save:{session_id} 해시에 기록
+- 서버 종료 시 대기 중인 저장은 바로 실행 (flush)
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+from config.redis_config import get_async_redis
+from util.log.log import Log
+
+load_dotenv()
+logger = Log.get_logger()
+async_redis_client = get_async_redis()
+
+IE_SAVE_DEBOUNCE_SECONDS = float(os.getenv("IE_SAVE_DEBOUNCE_SECONDS", "5"))
+IE_SAVE_MAX_DELAY_SECONDS = float(os.getenv("IE_SAVE_MAX_DELAY_SECONDS", "30"))
+IE_SAVE_MAX_RETRIES = int(os.getenv("IE_SAVE_MAX_RETRIES", "3"))
+IE_SAVE_RETRY_BASE_DELAY = float(os.getenv("IE_SAVE_RETRY_BASE_DELAY", "2"))
+IE_SAVE_STATUS_TTL = int(os.getenv("IE_SAVE_STATUS_TTL", str(24 * 60 * 60)))
+
+
+class _PendingSave:
+    __slots__ = ("first_requested", "due", "year", "month", "requests", "dirty", "task", "wakeup")
+
+    def __init__(self, now: float, year: int, month: int):
+        self.first_requested = now
+        self.due = now
+        self.year = year
+        self.month = month
+        self.requests = 0  # 병합된 요청 수
+        self.dirty = False  # 저장 중에 들어온 요청 여부
+        self.task: Optional[asyncio.Task] = None
+        self.wakeup = asyncio.Event()  # flush 시 대기 중단
+
+
+class IESaveScheduler:
+    """
+    세션별 IE_INFO 저장 디바운서 (Singleton)
+
+    세션당 하나의 작업만 유지하며 마감 시각이 밀리면 다시 대기한다.
+    (프로세스 내 디바운스 - 여러 워커 프로세스 사이의 병합은 하지 않음)
+    """
+
+    __instance = None
+
+    KEY_PREFIX = "ie_save"
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self._pending: Dict[str, _PendingSave] = {}
+            self._stats = {"requested": 0, "saves": 0, "merged": 0, "retries": 0, "failed": 0}
+            self.initialized = True
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"{IESaveScheduler.KEY_PREFIX}:{session_id}"
+
+    def schedule(self, session_id: str, year: Optional[int] = None, month: Optional[int] = None) -> Dict:
+        """
+        저장 예약 (즉시 반환)
+
+        Args:
+            session_id: 세션 ID
+            year/month: 저장할 연월 (기본값: 현재, 병합 시 마지막 요청 기준)
+
+        Returns:
+            {"scheduled": True, "merged": 이미 대기 중인 저장과 합쳐졌는지, "due_in_seconds": ...}
+        """
+        now = time.time()
+        today = datetime.now()
+        year = year or today.year
+        month = month or today.month
+        self._stats["requested"] += 1
+
+        pending = self._pending.get(session_id)
+        merged = pending is not None
+        if pending is None:
+            pending = _PendingSave(now, year, month)
+            self._pending[session_id] = pending
+        else:
+            self._stats["merged"] += 1
+
+        pending.year, pending.month = year, month
+        pending.requests += 1
+        pending.dirty = True
+        pending.due = min(now + IE_SAVE_DEBOUNCE_SECONDS, pending.first_requested + IE_SAVE_MAX_DELAY_SECONDS)
+
+        if pending.task is None:
+            pending.task = asyncio.create_task(self._run(session_id, pending))
+
+        return {"scheduled": True, "merged": merged, "due_in_seconds": round(max(0.0, pending.due - now), 2)}
+
+    async def flush(self):
+        """대기 중인 저장을 바로 실행하고 끝날 때까지 대기 (서버 종료 시)"""
+        for pending in self._pending.values():
+            pending.due = 0
+            pending.wakeup.set()
+        tasks = [pending.task for pending in self._pending.values() if pending.task is not None]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_status(self, session_id: str) -> Optional[Dict]:
+        """마지막 저장 결과 (pending | saved | skipped | failed)"""
+        status = await async_redis_client.hgetall(self._key(session_id))
+        if session_id in self._pending:
+            status = {**(status or {}), "status": "pending"}
+        return status or None
+
+    def get_stats(self) -> Dict:
+        return {**self._stats, "pending": len(self._pending)}
+
+    async def _run(self, session_id: str, pending: _PendingSave):
+        try:
+            while pending.dirty:
+                # 디바운스: 마감 시각이 밀리면 다시 대기
+                while (delay := pending.due - time.time()) > 0:
+                    try:
+                        await asyncio.wait_for(pending.wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+
+                pending.dirty = False
+                merged = pending.requests
+                pending.requests = 0
+                pending.first_requested = time.time()
+                await self._save_with_retry(session_id, pending.year, pending.month, merged)
+        finally:
+            if self._pending.get(session_id) is pending:
+                del self._pending[session_id]
+
+    async def _save_with_retry(self, session_id: str, year: int, month: int, merged: int):
+        from ieinfo.application.usecase.ie_info_usecase import IEInfoUseCase
+
+        usecase = IEInfoUseCase.get_instance()
+        result: Dict = {}
+        for attempt in range(IE_SAVE_MAX_RETRIES + 1):
+            try:
+                result = await asyncio.to_thread(usecase.save_ie_data_from_redis, session_id, year, month)
+            except Exception as e:
+                result = {"success": False, "message": str(e), "error": str(e)}
+
+            if result.get("success") or "error" not in result or attempt >= IE_SAVE_MAX_RETRIES:
+                break
+            self._stats["retries"] += 1
+            delay = IE_SAVE_RETRY_BASE_DELAY * (2 ** attempt)
+            logger.warning(f"[IE SAVE] {session_id} 저장 실패, {delay:.1f}s 후 재시도 ({attempt + 1}/{IE_SAVE_MAX_RETRIES})")
+            await asyncio.sleep(delay)
+
+        if result.get("success"):
+            status = "saved"
+            self._stats["saves"] += 1
+            logger.info(f"[IE SAVE] {session_id}: {result.get('saved_count', 0)} items saved (merged {merged} requests)")
+        elif "error" in result:
+            status = "failed"
+            self._stats["failed"] += 1
+            logger.error(f"[IE SAVE] {session_id}: failed after {attempt + 1} attempts: {result.get('error')}")
+        else:
+            # 저장할 데이터 없음 등 (재시도 대상 아님)
+            status = "skipped"
+
+        await self._record(session_id, {
+            "status": status,
+            "message": result.get("message", ""),
+            "saved_count": result.get("saved_count", 0),
+            "year": year,
+            "month": month,
+            "attempts": attempt + 1,
+            "merged_requests": merged,
+            "updated_at": time.time(),
+        })
+
+    async def _record(self, session_id: str, fields: Dict):
+        key = self._key(session_id)
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping={name: str(value) for name, value in fields.items()})
+                pipe.expire(key, IE_SAVE_STATUS_TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"[IE SAVE] Failed to record status for {session_id}: {str(e)}")
@@ -0,0 +1,215 @@
+"""
+프로세스 내 비동기 작업 큐
+오래 걸리는 요청(/analyze 등)을 백그라운드 워커에서 실행하고 상태는 Redis에 저장
+
+- 워커 수만큼만 동시에 실행 (JOB_QUEUE_WORKERS)
+- 대기열이 가득 차면 JobQueueFull (라우터에서 HTTP 429)
+- 상태/진행률/결과는 job:{job_id} 해시에 저장 (결과는 암호화, TTL 이후 자동 삭제)
+- 대기열은 메모리에만 있으므로 서버 종료 시 남은 작업은 실패 처리
+- 결과 암호화 키(Crypto)는 프로세스마다 달라서 결과는 작업을 실행한 프로세스에서만 읽을 수 있음
+  (상태/진행률은 어느 프로세스에서나 조회 가능, 다른 프로세스/재시작 후 결과 조회는 result_unavailable)
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from config.crypto import Crypto
+from config.redis_config import get_async_redis
+from util.log.log import Log
+
+load_dotenv()
+logger = Log.get_logger()
+async_redis_client = get_async_redis()
+
+JOB_QUEUE_WORKERS = max(1, int(os.getenv("JOB_QUEUE_WORKERS", "4")))
+JOB_QUEUE_MAX_SIZE = max(1, int(os.getenv("JOB_QUEUE_MAX_SIZE", "20")))
+JOB_TIMEOUT_SECONDS = float(os.getenv("JOB_TIMEOUT_SECONDS", "300"))
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", str(60 * 60)))
+
+# 현재 프로세스 식별자 (Crypto 키와 수명이 같음 → 결과를 복호화할 수 있는 프로세스인지 확인)
+PROCESS_ID = uuid.uuid4().hex
+
+# 진행률 보고 콜백: await progress("categorizing", 70)
+ProgressCallback = Callable[[str, int], Awaitable[None]]
+JobHandler = Callable[[ProgressCallback], Awaitable[Dict]]
+
+
+class JobQueueFull(Exception):
+    """대기열 초과 (잠시 후 다시 시도)"""
+
+
+class JobQueue:
+    """
+    백그라운드 작업 큐 (Singleton)
+
+    워커는 start()(서버 시작 시) 또는 첫 submit()에서 시작된다.
+
+    작업 상태:
+        queued → running → succeeded | failed
+    """
+
+    __instance = None
+
+    KEY_PREFIX = "job"
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self._queue: Optional[asyncio.Queue] = None
+            self._workers: List[asyncio.Task] = []
+            self._running = 0
+            self.initialized = True
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"{JobQueue.KEY_PREFIX}:{job_id}"
+
+    def start(self):
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=JOB_QUEUE_MAX_SIZE)
+        self._workers = [asyncio.create_task(self._worker(index)) for index in range(JOB_QUEUE_WORKERS)]
+        logger.info(f"[JOB] Queue started (workers={JOB_QUEUE_WORKERS}, max_size={JOB_QUEUE_MAX_SIZE})")
+
+    async def stop(self):
+        """워커 종료, 대기 중인 작업은 실패 처리"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        while self._queue is not None and not self._queue.empty():
+            job_id, _ = self._queue.get_nowait()
+            await self._update(job_id, status="failed", error="서버가 종료되어 작업이 취소되었습니다.")
+
+    async def submit(self, kind: str, session_id: str, handler: JobHandler) -> str:
+        """
+        작업 등록
+
+        Args:
+            kind: 작업 종류 (예: "analyze")
+            session_id: 요청한 세션 (조회 권한 확인용)
+            handler: 실제 작업 (진행률 콜백을 받아 결과 dict 반환)
+
+        Returns:
+            job_id
+
+        Raises:
+            JobQueueFull: 대기열이 가득 참
+        """
+        self.start()
+        if self._queue.full():
+            raise JobQueueFull(f"Job queue is full ({JOB_QUEUE_MAX_SIZE})")
+
+        job_id = uuid.uuid4().hex
+        now = str(time.time())
+        await self._update(
+            job_id, kind=kind, session_id=session_id, status="queued",
+            stage="queued", progress=0, created_at=now, owner=PROCESS_ID
+        )
+
+        try:
+            self._queue.put_nowait((job_id, handler))
+        except asyncio.QueueFull:
+            # 상태 저장 중에 다른 요청이 자리를 채운 경우
+            await async_redis_client.delete(self._key(job_id))
+            raise JobQueueFull(f"Job queue is full ({JOB_QUEUE_MAX_SIZE})")
+
+        logger.info(f"[JOB] Queued {kind} job {job_id} (pending={self._queue.qsize()})")
+        return job_id
+
+    async def get(self, job_id: str) -> Optional[Dict]:
+        """
+        작업 상태 조회 (없거나 만료되면 None)
+
+        결과는 작업을 실행한 프로세스에서만 복호화할 수 있으므로,
+        다른 프로세스(다른 워커, 재시작 후)에서 조회하면 result=None, result_unavailable=True
+
+        Returns:
+            {"job_id": ..., "status": "running", "stage": "categorizing", "progress": 70, "result": {...}, ...}
+        """
+        raw = await async_redis_client.hgetall(self._key(job_id))
+        if not raw:
+            return None
+
+        job = {"job_id": job_id, **raw}
+        job["progress"] = int(job.get("progress", 0))
+        job["result_unavailable"] = False
+        if "result" in job:
+            try:
+                if job.get("owner") != PROCESS_ID:
+                    raise ValueError(f"job {job_id} belongs to another process")
+                job["result"] = json.loads(Crypto.dec_data(job["result"]))
+            except Exception:
+                # 다른 프로세스 키로 암호화된 결과 (다른 워커, 재시작 등)
+                job["result"] = None
+                job["result_unavailable"] = True
+                job.setdefault("error", "작업을 실행한 서버에서만 결과를 읽을 수 있습니다. (서버 재시작 등) 다시 요청해주세요.")
+        return job
+
+    def get_stats(self) -> Dict:
+        return {
+            "workers": len(self._workers),
+            "running": self._running,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": JOB_QUEUE_MAX_SIZE,
+        }
+
+    async def _update(self, job_id: str, **fields):
+        fields["updated_at"] = str(time.time())
+        key = self._key(job_id)
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping={name: str(value) for name, value in fields.items()})
+                pipe.expire(key, JOB_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"[JOB] Failed to save state of {job_id}: {str(e)}")
+
+    async def _worker(self, index: int):
+        while True:
+            job_id, handler = await self._queue.get()
+            self._running += 1
+            try:
+                await self._run(job_id, handler)
+            finally:
+                self._running -= 1
+                self._queue.task_done()
+
+    async def _run(self, job_id: str, handler: JobHandler):
+        started = time.perf_counter()
+        await self._update(job_id, status="running", stage="started")
+
+        async def progress(stage: str, percent: int):
+            await self._update(job_id, stage=stage, progress=percent)
+
+        try:
+            result = await asyncio.wait_for(handler(progress), timeout=JOB_TIMEOUT_SECONDS)
+            await self._update(
+                job_id, status="succeeded", stage="done", progress=100,
+                result=Crypto.enc_data(json.dumps(result, ensure_ascii=False))
+            )
+            logger.info(f"[JOB] {job_id} succeeded in {time.perf_counter() - started:.2f}s")
+        except asyncio.TimeoutError:
+            await self._update(job_id, status="failed", error=f"작업 시간 초과 ({JOB_TIMEOUT_SECONDS}s)")
+            logger.error(f"[JOB] {job_id} timed out")
+        except Exception as e:
+            detail = getattr(e, "detail", None) or f"{type(e).__name__}: {str(e)}"
+            await self._update(job_id, status="failed", error=detail)
+            logger.error(f"[JOB] {job_id} failed: {detail}")
@@ -5,7 +5,7 @@ from fastapi.responses import RedirectResponse
 
 from account.application.usecase.account_usecase import AccountUseCase
 from account.infrastructure.repository.account_repository_impl import AccountRepositoryImpl
-from config.redis_config import get_redis
+from config.redis_config import get_async_redis
 from kakao_authentication.application.usecase.kakao_oauth_usecase import KakaoOAuthUseCase
 from kakao_authentication.infrastructure.client.kakao_oauth_client import KakaoOAuthClient
 from util.log.log import Log
@@ -20,7 +20,7 @@ kakao_usecase = KakaoOAuthUseCase(kakao_client)
 account_repository = AccountRepositoryImpl()
 account_usecase = AccountUseCase(account_repository)
 
-redis_client = get_redis()
+redis_client = get_async_redis()
 
 CORS_ALLOWED_FRONTEND_URL = os.getenv("CORS_ALLOWED_FRONTEND_URL")
 
@@ -57,15 +57,17 @@ async def kakao_redirect(code: str):
     print(f"[DEBUG] Generated session_id:", session_id)
 
     # Redis에 session 저장 (1시간 TTL)
-    redis_client.hset(
-        session_id,
-        "USER_TOKEN",
-        access_token,
-    )
-    redis_client.expire(session_id, 24 * 60 * 60)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(
+            session_id,
+            "USER_TOKEN",
+            access_token,
+        )
+        pipe.expire(session_id, 24 * 60 * 60)
+        await pipe.execute()
 
     logger.debug(f"Kakao User ID: {session_id}")
-    logger.debug("Session saved in Redis: %s", redis_client.exists(session_id))
+    logger.debug("Session saved in Redis: %s", await redis_client.exists(session_id))
 
     logger.debug("CSRF token generated")
 
@@ -5,12 +5,13 @@ ETF 추천 UseCase
 from typing import Dict, List
 from datetime import datetime, timedelta
 from config.crypto import Crypto
-from config.redis_config import get_redis
+from config.redis_config import get_async_redis
 from ieinfo.infrastructure.repository.ie_info_repository_impl import IEInfoRepositoryImpl
 from ieinfo.infrastructure.orm.ie_info import IEType
 from product.infrastructure.repository.product_repository_impl import ProductRepositoryImpl
 from recommendation.domain.service.etf_recommendation_service import ETFRecommendationService
 from util.log.log import Log
+from util.session.session_snapshot import SessionSnapshotService, classify_doc_type
 
 logger = Log.get_logger()
 
@@ -35,8 +36,9 @@ class ETFRecommendationUseCase:
         if not hasattr(self, 'initialized'):
             self.ie_repository = IEInfoRepositoryImpl.get_instance()
             self.product_repository = ProductRepositoryImpl.get_instance()
-            self.redis_client = get_redis()
+            self.redis_client = get_async_redis()
             self.crypto = Crypto.get_instance()
+            self.session_snapshot_service = SessionSnapshotService.get_instance()
             self.initialized = True
     
     def _get_financial_data_from_db(self, session_id: str, year: int, month: int) -> Dict:
@@ -75,12 +77,12 @@ class ETFRecommendationUseCase:
             logger.error(f"Error loading data from DB: {str(e)}")
             return None
     
-    def _get_financial_data_from_redis(self, session_id: str) -> Dict:
+    async def _get_financial_data_from_redis(self, session_id: str) -> Dict:
         """Redis에서 자산 정보 가져오기 (비로그인 사용자)"""
         try:
-            encrypted_data = self.redis_client.hgetall(session_id)
+            snapshot = await self.session_snapshot_service.load_async(session_id)
             
-            if not encrypted_data:
+            if snapshot.field_count == 0:
                 logger.warning(f"No data found in Redis for session: {session_id}")
                 return None
             
@@ -89,38 +91,16 @@ class ETFRecommendationUseCase:
             total_income = 0
             total_expense = 0
             
-            for key_bytes, value_bytes in encrypted_data.items():
+            # 복호화된 스냅샷 사용 ("타입:필드명" 파싱 완료)
+            for doc_type, field_name, value_plain in snapshot.items:
                 try:
-                    # bytes를 문자열로 변환
-                    if isinstance(key_bytes, bytes):
-                        key_str = key_bytes.decode('utf-8')
-                    else:
-                        key_str = str(key_bytes)
-                    
-                    if isinstance(value_bytes, bytes):
-                        value_str = value_bytes.decode('utf-8')
-                    else:
-                        value_str = str(value_bytes)
-                    
-                    # USER_TOKEN 제외
-                    if key_str == "USER_TOKEN":
-                        continue
-                    
-                    # 복호화
-                    key_plain = self.crypto.dec_data(key_str)
-                    value_plain = self.crypto.dec_data(value_str)
-                    
-                    # "타입:필드명" 형태 파싱
-                    if ":" not in key_plain:
-                        continue
-                    
-                    doc_type, field_name = key_plain.split(":", 1)
                     value_int = int(value_plain.replace(",", ""))
+                    kind = classify_doc_type(doc_type)
                     
-                    if "소득" in doc_type or "income" in doc_type.lower():
+                    if kind == "income":
                         income_data[field_name] = value_int
                         total_income += value_int
-                    elif "지출" in doc_type or "expense" in doc_type.lower():
+                    elif kind == "expense":
                         expense_data[field_name] = value_int
                         total_expense += value_int
                         
@@ -168,7 +148,7 @@ class ETFRecommendationUseCase:
         """
         try:
             # 1. 로그인 여부 확인
-            user_token = self.redis_client.hget(session_id, "USER_TOKEN")
+            user_token = await self.redis_client.hget(session_id, "USER_TOKEN")
             
             if isinstance(user_token, bytes):
                 user_token = user_token.decode('utf-8')
@@ -186,10 +166,10 @@ class ETFRecommendationUseCase:
                 if not financial_data:
                     # DB에 데이터가 없으면 Redis 시도
                     logger.warning("No data in DB, trying Redis...")
-                    financial_data = self._get_financial_data_from_redis(session_id)
+                    financial_data = await self._get_financial_data_from_redis(session_id)
             else:
                 # 비로그인 사용자 또는 연도/월 미지정 - Redis에서 조회
-                financial_data = self._get_financial_data_from_redis(session_id)
+                financial_data = await self._get_financial_data_from_redis(session_id)
             
             if not financial_data:
                 return {
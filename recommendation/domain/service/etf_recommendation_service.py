@@ -2,13 +2,12 @@
 ETF 추천 AI 서비스
 사용자의 자산 정보를 기반으로 적합한 ETF를 추천
 """
-import asyncio
 from typing import Dict, List
-from openai import OpenAI
+from util.llm.llm_gateway import LLMGateway
 from util.log.log import Log
 
 logger = Log.get_logger()
-client = OpenAI()
+llm_gateway = LLMGateway.get_instance()
 
 
 class ETFRecommendationService:
@@ -16,17 +15,8 @@ class ETFRecommendationService:
     
     @staticmethod
     async def _call_gpt(prompt: str, max_tokens: int = 2000) -> str:
-        """GPT API 비동기 호출"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=max_tokens,
-                temperature=0.7
-            ).choices[0].message.content
-        )
+        """GPT API 비동기 호출 (LLM 게이트웨이 경유)"""
+        return await llm_gateway.chat(prompt, model="gpt-4o", max_tokens=max_tokens, temperature=0.7)
     
     @staticmethod
     def _build_financial_profile(
@@ -4,7 +4,7 @@ import httpx
 from fastapi import APIRouter, Request, Cookie, Header
 from fastapi.responses import RedirectResponse, JSONResponse
 
-from config.redis_config import get_redis
+from config.redis_config import get_async_redis
 from sosial_oauth.application.usecase.google_oauth2_usecase import GoogleOAuth2UseCase
 from util.cache.ai_cache import AICache
 from util.log.log import Log
@@ -13,7 +13,7 @@ from util.security.crsf import generate_csrf_token, verify_csrf_token, CSRF_COOK
 # Singleton 방식으로 변경
 authentication_router = APIRouter()
 usecase = GoogleOAuth2UseCase().get_instance()
-redis_client = get_redis()
+redis_client = get_async_redis()
 logger = Log.get_logger()
 
 @authentication_router.get("/google")
@@ -37,18 +37,18 @@ async def logout_to_google(request: Request, session_id: str | None = Cookie(Non
         response.delete_cookie(key="session_id")
         return response
 
-    exists = redis_client.exists(session_id)
+    exists = await redis_client.exists(session_id)
     logger.debug("Redis has session_id? %s", exists)
 
     if exists:
         # 🔥 사용자 세션 데이터 삭제 전에 캐시도 함께 삭제
         logger.info(f"Invalidating cache for session: {session_id}")
-        invalidated_count = AICache.invalidate_user_cache(session_id)
+        invalidated_count = await AICache.invalidate_user_cache_async(session_id)
         logger.info(f"Invalidated {invalidated_count} cache entries")
 
         # 세션 데이터 삭제
-        redis_client.delete(session_id)
-        logger.debug("Redis session deleted: %s", redis_client.exists(session_id))
+        await redis_client.delete(session_id)
+        logger.debug("Redis session deleted: %s", await redis_client.exists(session_id))
 
     # 쿠키 삭제와 함께 응답 반환
     response = JSONResponse({"logged_out": bool(exists)})
@@ -80,13 +80,15 @@ async def process_google_redirect(
     logger.debug(f"Tokeninfo fetched from Google text: {r.text}, status: {r.status_code}")
 
     # Redis에 session 저장 (1시간 TTL)
-    redis_client.hset(
-        session_id,
-        "USER_TOKEN",
-        access_token.access_token,
-    )
-    redis_client.expire(session_id, 24 * 60 * 60)
-    logger.debug("Session saved in Redis: %s", redis_client.exists(session_id))
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(
+            session_id,
+            "USER_TOKEN",
+            access_token.access_token,
+        )
+        pipe.expire(session_id, 24 * 60 * 60)
+        await pipe.execute()
+    logger.debug("Session saved in Redis: %s", await redis_client.exists(session_id))
 
     # CSRF 토큰 생성
     csrf_token = generate_csrf_token()
@@ -131,7 +133,7 @@ async def auth_status(request: Request, session_id: str | None = Cookie(None)):
         logger.debug("No session_id received. Returning logged_in: False")
         return {"logged_in": False}
 
-    exists = redis_client.exists(session_id)
+    exists = await redis_client.exists(session_id)
     logger.debug("Redis session exists: %s", exists)
 
     return {"logged_in": bool(exists)}
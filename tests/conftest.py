@@ -0,0 +1,19 @@
+"""
+테스트 공통 설정
+모듈 import 시 읽는 환경 변수 기본값 (.env가 없어도 import 가능하도록, 실제 DB/Redis 연결은 하지 않음)
+"""
+
+import os
+
+for name, value in {
+    "MYSQL_USER": "test",
+    "MYSQL_PASSWORD": "test",
+    "MYSQL_HOST": "localhost",
+    "MYSQL_PORT": "3306",
+    "MYSQL_DATABASE": "test",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_DB": "0",
+    "OPENAI_API_KEY": "test",
+}.items():
+    os.environ.setdefault(name, value)
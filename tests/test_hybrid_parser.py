@@ -0,0 +1,131 @@
+"""
+HybridParser 규칙 분류 테스트
+IERuleIndex 스냅샷을 고정 규칙으로 바꿔 DB/Redis 없이 실행
+"""
+
+import pytest
+
+from documents_multi_agents.domain.service.financial_analyzer_service import FinancialAnalyzerService
+from documents_multi_agents.domain.service.hybrid_parser import HybridParser
+from documents_multi_agents.domain.service.ie_rule_index import IERuleIndex, RuleSnapshot
+from ieinfo.infrastructure.orm.ie_info import IEType
+from util.cache.ai_cache import AICache
+
+INCOME_CATEGORIES = ["고정소득", "변동소득", "기타소득"]
+
+RULES = (
+    {"id": 1, "keyword": "급여", "ie_type": IEType.INCOME, "category": "고정소득", "sub_category": "급여", "priority": 0},
+    {"id": 2, "keyword": "상여", "ie_type": IEType.INCOME, "category": "변동소득", "sub_category": "상여", "priority": 0},
+    {"id": 3, "keyword": "수당", "ie_type": IEType.INCOME, "category": None, "sub_category": None, "priority": 0},
+    {"id": 4, "keyword": "보험료", "ie_type": IEType.EXPENSE, "category": "고정지출", "sub_category": "보험", "priority": 0},
+)
+
+
+@pytest.fixture(autouse=True)
+def rule_snapshot(monkeypatch):
+    snapshot = RuleSnapshot(RULES)
+    monkeypatch.setattr(IERuleIndex.get_instance(), "snapshot", lambda: snapshot)
+    return snapshot
+
+
+def test_rule_hits_build_full_structure():
+    rule_result, uncertain = HybridParser().categorize_items(
+        {"기본_급여": "3,000,000", "정기상여": "500000"}, "income", INCOME_CATEGORIES, "총소득"
+    )
+
+    assert uncertain == {}
+    assert rule_result == {
+        "고정소득": {"기본 급여": 3000000},
+        "변동소득": {"정기상여": 500000},
+        "기타소득": {},
+        "카테고리별 합계": {"고정소득": 3000000, "변동소득": 500000, "기타소득": 0},
+        "총소득": 3500000,
+    }
+
+
+def test_side_mismatch_goes_to_gpt():
+    # 소득 문서에 지출 규칙(보험료)이 걸린 항목은 규칙으로 확정하지 않음
+    rule_result, uncertain = HybridParser().categorize_items(
+        {"급여": "100", "보험료 환급": "20"}, "income", INCOME_CATEGORIES, "총소득"
+    )
+
+    assert uncertain == {"보험료 환급": "20"}
+    assert rule_result["고정소득"] == {"급여": 100}
+    assert rule_result["총소득"] == 100
+
+
+def test_missing_category_goes_to_gpt():
+    # 규칙은 있지만 카테고리가 없는 항목(수당)과 규칙이 없는 항목
+    rule_result, uncertain = HybridParser().categorize_items(
+        {"야간수당": "30", "기타": "7"}, "income", INCOME_CATEGORIES, "총소득"
+    )
+
+    assert rule_result is None
+    assert uncertain == {"야간수당": "30", "기타": "7"}
+
+
+def test_merge_recomputes_totals():
+    rule_result, _ = HybridParser().categorize_items({"급여": "100"}, "income", INCOME_CATEGORIES, "총소득")
+    gpt_result = {
+        "고정소득": {"직책수당": "50"},
+        "변동소득": {"야간수당": 30},
+        "카테고리별 합계": {"고정소득": 50, "변동소득": 30},
+        "총소득": 80,
+        "분석": "참고용",
+    }
+
+    merged = HybridParser.merge_categorized(gpt_result, rule_result, INCOME_CATEGORIES, "총소득")
+
+    assert list(merged) == INCOME_CATEGORIES + ["카테고리별 합계", "총소득", "분석"]
+    assert merged["고정소득"] == {"직책수당": "50", "급여": 100}
+    assert merged["카테고리별 합계"] == {"고정소득": 150, "변동소득": 30, "기타소득": 0}
+    assert merged["총소득"] == 180
+    assert merged["분석"] == "참고용"
+
+
+def test_merge_without_rule_result_returns_gpt_result():
+    gpt_result = {"고정소득": {"급여": 1}, "총소득": 1}
+
+    assert HybridParser.merge_categorized(gpt_result, None, INCOME_CATEGORIES, "총소득") is gpt_result
+
+
+class _RecordingRepo:
+    def __init__(self):
+        self.saved = []
+
+    def save_keywords(self, rules):
+        self.saved.extend(rules)
+        return True
+
+
+def test_learning_existing_keyword_keeps_substring_matches_uncertain():
+    # 카테고리 없는 시드 "수당"에 GPT 카테고리를 붙이면 "야간수당"까지 규칙으로 확정되어 버림
+    parser = HybridParser()
+    parser.rule_repo = _RecordingRepo()
+
+    assert parser.learn_from_gpt_results({"수당": ("income", "고정소득")}) == 0
+    assert parser.rule_repo.saved == []
+
+    rule_result, uncertain = parser.categorize_items({"야간수당": "30"}, "income", INCOME_CATEGORIES, "총소득")
+    assert rule_result is None
+    assert uncertain == {"야간수당": "30"}
+
+
+class _NoLLM:
+    def chat_sync(self, *args, **kwargs):
+        raise AssertionError("LLM must not be called")
+
+    async def chat(self, *args, **kwargs):
+        raise AssertionError("LLM must not be called")
+
+
+def test_full_rule_hit_makes_no_llm_call(monkeypatch):
+    monkeypatch.setattr(AICache, "get_cached_response", lambda *args, **kwargs: None)
+    service = FinancialAnalyzerService()
+    monkeypatch.setattr(service, "llm_gateway", _NoLLM())
+
+    result = service._categorize({"급여": "200", "성과상여": "50"}, "income")
+
+    assert result["고정소득"] == {"급여": 200}
+    assert result["변동소득"] == {"성과상여": 50}
+    assert result["총소득"] == 250
@@ -0,0 +1,89 @@
+"""
+템플릿 기반 추출기 테스트
+합계 칸(총급여, 지급합계, 공제합계, 결정세액)은 세션에 들어가면 이중 집계되므로 추출 결과에 없어야 함
+"""
+
+from documents_multi_agents.domain.service.template_extractor import TemplateExtractor
+
+WITHHOLDING_RECEIPT_TEXT = """
+[ ] 근로소득 원천징수영수증 [ ] 근로소득 지급명세서
+Ⅰ 근무처별 소득명세
+⑬ 급 여 36,000,000
+⑭ 상 여 6,000,000
+⑮ 인정상여 500,000
+⑳ 비과세소득 계 2,400,000
+㉑ 총급여 42,500,000
+㉒ 근로소득공제 12,375,000
+국민연금보험료 1,620,000
+건강보험료 1,276,000
+고용보험료 340,000
+Ⅲ 세액명세
+㊵ 결정세액 1,850,000
+㊶ 기납부세액 2,100,000
+"""
+
+PAYSLIP_TEXT = """
+2024년 3월 급여명세서
+[지급 내역]
+기본급 3,000,000
+연장근로수당 250,000
+식대 200,000
+지급합계 3,450,000
+[공제 내역]
+국민연금 135,000
+건강보험료 106,350
+고용보험 27,000
+소득세 84,850
+지방소득세 8,480
+공제합계 361,680
+실수령액 3,088,320
+"""
+
+
+def _fields(answer):
+    return dict(line.split(": ") for line in answer.splitlines())
+
+
+def test_withholding_receipt_income_excludes_total():
+    fields = _fields(TemplateExtractor().extract(WITHHOLDING_RECEIPT_TEXT, "소득"))
+
+    assert fields == {"급여": "36000000", "상여": "6000000", "인정상여": "500000", "비과세소득": "2400000"}
+    assert "총급여" not in fields
+
+
+def test_withholding_receipt_expense_excludes_determined_tax():
+    fields = _fields(TemplateExtractor().extract(WITHHOLDING_RECEIPT_TEXT, "지출"))
+
+    assert fields == {
+        "국민연금보험료": "1620000",
+        "건강보험료": "1276000",
+        "고용보험료": "340000",
+        "기납부세액": "2100000",
+    }
+    assert "결정세액" not in fields
+
+
+def test_payslip_excludes_totals():
+    fields = _fields(TemplateExtractor().extract(PAYSLIP_TEXT, "급여명세서"))
+
+    assert fields == {
+        "기본급": "3000000",
+        "연장근로수당": "250000",
+        "식대": "200000",
+        "국민연금": "135000",
+        "건강보험": "106350",
+        "고용보험": "27000",
+        "소득세": "84850",
+        "지방소득세": "8480",
+    }
+    assert "지급합계" not in fields and "공제합계" not in fields
+
+
+def test_total_mismatch_falls_back_to_llm():
+    # 템플릿에 없는 항목(가족수당)이 있으면 지급합계와 맞지 않음 → GPT 추출로 폴백
+    text = PAYSLIP_TEXT.replace("지급합계 3,450,000", "가족수당 100,000\n지급합계 3,550,000")
+    extractor = TemplateExtractor()
+    mismatches = extractor.get_stats()["total_mismatch"]
+
+    assert extractor.extract(text, "소득") is None
+    assert extractor.get_stats()["total_mismatch"] == mismatches + 1
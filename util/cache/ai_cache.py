@@ -1,23 +1,181 @@
+import asyncio
+import copy
 import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import defaultdict, OrderedDict
 from functools import wraps
-from typing import Optional, Callable
+from typing import Optional, Callable, Awaitable, Any, AsyncIterator, Dict, Tuple
 
-from config.redis_config import get_redis
+from dotenv import load_dotenv
+
+from config.redis_config import get_redis, get_async_redis
 from util.log.log import Log
 
+load_dotenv()
 logger = Log.get_logger()
 redis_client = get_redis()
+async_redis_client = get_async_redis()
+
+# L1(프로세스 내 LRU) 캐시 설정 - 기본 비활성화
+AI_CACHE_L1_ENABLED = os.getenv("AI_CACHE_L1_ENABLED", "false").lower() == "true"
+AI_CACHE_L1_MAX_ITEMS = int(os.getenv("AI_CACHE_L1_MAX_ITEMS", "1024"))
+AI_CACHE_L1_TTL_SECONDS = float(os.getenv("AI_CACHE_L1_TTL_SECONDS", "60"))
+# 확률적 조기 갱신(XFetch) 강도 - 0이면 비활성화
+AI_CACHE_XFETCH_BETA = float(os.getenv("AI_CACHE_XFETCH_BETA", "1.0"))
+# 엔드포인트별 생성 시간 EWMA 가중치
+COMPUTE_TIME_EWMA_ALPHA = 0.2
+
+# "3,000,000", "3,000,000원", "₩ 3000000" 같은 금액 표기
+AMOUNT_PATTERN = re.compile(r'^\s*(?:₩|KRW)?\s*(-?\d[\d,]*(?:\.\d+)?)\s*(?:원|KRW)?\s*$')
+# "항목: 금액, 항목: 금액" 형태의 구분자 (금액 내부 쉼표는 공백이 없으므로 제외됨)
+PAIR_SEPARATOR_PATTERN = re.compile(r',\s+')
+
+# 세션별 캐시 키 인덱스 (SET) / 전체 캐시 키 레지스트리 (ZSET, score = 만료 시각)
+SESSION_INDEX_PREFIX = "ai_cache_meta:session:"
+REGISTRY_KEY = "ai_cache_meta:registry"
+
+
+class _L1Entry:
+    __slots__ = ("value", "expires_at", "l1_expires_at", "sessions")
+
+    def __init__(self, value: str, expires_at: float, l1_expires_at: float):
+        self.value = value
+        self.expires_at = expires_at  # Redis 기준 만료 시각
+        self.l1_expires_at = l1_expires_at
+        self.sessions = set()  # 세션 인덱스에 이미 등록한 세션
+
+
+class _LocalLRU:
+    """
+    프로세스 내 L1 캐시 (크기/TTL 제한 LRU)
+
+    무효화는 현재 프로세스에만 반영되므로 TTL을 짧게 유지해
+    다른 워커의 L1에 남은 항목이 오래 노출되지 않도록 한다.
+    """
+
+    def __init__(self, max_items: int, ttl: float):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._data: "OrderedDict[str, _L1Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[_L1Entry]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry.l1_expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: str, expires_at: float, session_id: Optional[str] = None):
+        entry = _L1Entry(value, expires_at, min(time.time() + self.ttl, expires_at))
+        if session_id:
+            entry.sessions.add(session_id)
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+
+    def mark_session(self, entry: _L1Entry, session_id: str) -> bool:
+        """세션 최초 조회 여부 반환 (True면 세션 인덱스 등록 필요)"""
+        with self._lock:
+            if session_id in entry.sessions:
+                return False
+            entry.sessions.add(session_id)
+            return True
+
+    def discard(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 class AICache:
     """AI 응답 캐싱을 위한 유틸리티 클래스"""
     
     DEFAULT_TTL = 86400  # 24시간
+
+    # 동일 키에 대해 진행 중인 생성 작업 (single-flight)
+    _inflight: Dict[str, asyncio.Future] = {}
+
+    # 엔드포인트별 계층 hit / miss / coalesced / 조기 갱신 카운터 (프로세스 단위)
+    _stats: Dict[str, Dict[str, int]] = defaultdict(
+        lambda: {"l1_hit": 0, "l2_hit": 0, "miss": 0, "coalesced": 0, "early_refresh": 0}
+    )
+    _stats_lock = threading.Lock()
+
+    # L1 캐시 (AI_CACHE_L1_ENABLED=true 일 때만 사용)
+    _l1: Optional[_LocalLRU] = _LocalLRU(AI_CACHE_L1_MAX_ITEMS, AI_CACHE_L1_TTL_SECONDS) if AI_CACHE_L1_ENABLED else None
+
+    # 엔드포인트별 응답 생성 시간 EWMA (초) - XFetch 계산용
+    _compute_time: Dict[str, float] = {}
+
+    # 백그라운드 조기 갱신 작업 (GC 방지용 참조 유지)
+    _refresh_tasks: set = set()
+
+    @staticmethod
+    def _normalize_amount(value: Any) -> Any:
+        """금액 표기를 숫자 문자열로 정규화 ("3,000,000원" → "3000000")"""
+        if not isinstance(value, str):
+            return value
+        match = AMOUNT_PATTERN.match(value)
+        if match:
+            return match.group(1).replace(",", "")
+        return value.strip()
+
+    @staticmethod
+    def _normalize_json(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {str(k).strip(): AICache._normalize_json(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [AICache._normalize_json(v) for v in value]
+        return AICache._normalize_amount(value)
+
+    @staticmethod
+    def canonicalize(data_str: str) -> str:
+        """
+        캐시 키 생성을 위한 데이터 정규화
+
+        - JSON: 키 정렬 + 금액 정규화
+        - "항목: 금액, ..." 문자열: 항목 단위 정렬 + 금액 정규화
+        항목 순서나 금액 표기("3,000,000" / "3000000")만 다른 요청이 같은 키를 갖도록 한다.
+        """
+        try:
+            parsed = json.loads(data_str)
+            if isinstance(parsed, (dict, list)):
+                return json.dumps(AICache._normalize_json(parsed), ensure_ascii=False,
+                                  sort_keys=True, separators=(",", ":"))
+        except (ValueError, TypeError):
+            pass
+
+        pairs = []
+        for part in PAIR_SEPARATOR_PATTERN.split(data_str.strip()):
+            if not part:
+                continue
+            if ":" in part:
+                label, value = part.split(":", 1)
+                pairs.append(f"{label.strip()}:{AICache._normalize_amount(value)}")
+            else:
+                pairs.append(part.strip())
+        return ", ".join(sorted(pairs))
     
     @staticmethod
     def generate_cache_key(data_str: str, endpoint_name: str) -> str:
         """
-        데이터 해시값과 엔드포인트명으로 캐시 키 생성
+        정규화된 데이터 해시값과 엔드포인트명으로 캐시 키 생성
         
         Args:
             data_str: 사용자 데이터 문자열
@@ -26,34 +184,415 @@ class AICache:
         Returns:
             캐시 키 (예: "ai_cache:future-assets:a1b2c3d4...")
         """
-        data_hash = hashlib.md5(data_str.encode('utf-8')).hexdigest()
+        canonical = AICache.canonicalize(data_str)
+        data_hash = hashlib.md5(canonical.encode('utf-8')).hexdigest()
         return f"ai_cache:{endpoint_name}:{data_hash}"
+
+    @staticmethod
+    def _endpoint_of(cache_key: str) -> str:
+        parts = cache_key.split(":")
+        return parts[1] if len(parts) >= 3 else "unknown"
+
+    @staticmethod
+    def _record(endpoint_name: str, counter: str):
+        with AICache._stats_lock:
+            AICache._stats[endpoint_name][counter] += 1
+
+    @staticmethod
+    def record_event(cache_key: str, event: str):
+        """
+        AICache 밖에서 관리하는 캐시(예: ExtractionCache)의 조회 결과를 엔드포인트 통계에 반영
+
+        Args:
+            cache_key: "{접두어}:{엔드포인트}:..." 형식 캐시 키 (두 번째 구간이 통계 엔드포인트)
+            event: 통계 항목 ("l2_hit", "miss" 등, get_endpoint_stats 참고)
+        """
+        AICache._record(AICache._endpoint_of(cache_key), event)
+
+    @staticmethod
+    def _session_index_key(session_id: str) -> str:
+        return f"{SESSION_INDEX_PREFIX}{session_id}"
+
+    @staticmethod
+    def _queue_register(pipe, cache_key: str, session_id: str, ttl: int = DEFAULT_TTL):
+        index_key = AICache._session_index_key(session_id)
+        pipe.sadd(index_key, cache_key)
+        pipe.expire(index_key, max(ttl, AICache.DEFAULT_TTL))
+
+    @staticmethod
+    def _register_session(cache_key: str, session_id: str):
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            AICache._queue_register(pipe, cache_key, session_id)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache session index error: {e}")
+
+    @staticmethod
+    async def _register_session_async(cache_key: str, session_id: str):
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                AICache._queue_register(pipe, cache_key, session_id)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache session index error: {e}")
+
+    @staticmethod
+    def _queue_read(pipe, cache_key: str, session_id: Optional[str]):
+        """조회/만료 확인/세션 인덱스 등록을 한 번의 왕복으로 처리"""
+        pipe.get(cache_key)
+        pipe.pttl(cache_key)
+        if session_id:
+            AICache._queue_register(pipe, cache_key, session_id)
+
+    @staticmethod
+    def _parse_read(results: list) -> Tuple[Optional[str], float]:
+        value, pttl = results[0], results[1]
+        expires_at = time.time() + pttl / 1000 if pttl and pttl > 0 else math.inf
+        return value, expires_at
+
+    @staticmethod
+    def _read(cache_key: str, session_id: Optional[str] = None) -> Tuple[Optional[str], float]:
+        """Redis 조회 (값, 만료 시각)"""
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            AICache._queue_read(pipe, cache_key, session_id)
+            return AICache._parse_read(pipe.execute())
+        except Exception as e:
+            logger.error(f"Cache read error: {e}")
+            return None, 0.0
+
+    @staticmethod
+    async def _read_async(cache_key: str, session_id: Optional[str] = None) -> Tuple[Optional[str], float]:
+        """Redis 조회 (값, 만료 시각) - 비동기"""
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                AICache._queue_read(pipe, cache_key, session_id)
+                return AICache._parse_read(await pipe.execute())
+        except Exception as e:
+            logger.error(f"Cache read error: {e}")
+            return None, 0.0
+
+    @staticmethod
+    def _lookup_l1(cache_key: str, session_id: Optional[str]) -> Tuple[Optional[Tuple[str, float]], bool]:
+        """
+        L1 조회
+
+        Returns:
+            ((캐시된 응답, 만료 시각) 또는 None, 세션 인덱스 등록 필요 여부)
+        """
+        if AICache._l1 is None:
+            return None, False
+        entry = AICache._l1.get(cache_key)
+        if entry is None:
+            return None, False
+
+        needs_register = bool(session_id) and AICache._l1.mark_session(entry, session_id)
+        logger.info(f"✅ Cache HIT (L1): {cache_key}")
+        AICache._record(AICache._endpoint_of(cache_key), "l1_hit")
+        return (entry.value, entry.expires_at), needs_register
+
+    @staticmethod
+    def _finish_lookup(
+        cache_key: str, cached_data: Optional[str], expires_at: float, session_id: Optional[str]
+    ) -> Optional[Tuple[str, float]]:
+        """Redis(L2) 조회 결과 집계 및 L1 채우기"""
+        endpoint_name = AICache._endpoint_of(cache_key)
+        if cached_data:
+            logger.info(f"✅ Cache HIT: {cache_key}")
+            AICache._record(endpoint_name, "l2_hit")
+            if AICache._l1 is not None:
+                AICache._l1.set(cache_key, cached_data, expires_at, session_id)
+            return cached_data, expires_at
+
+        # 이미 생성 중인 키는 single_flight에서 coalesced로 집계
+        if cache_key not in AICache._inflight:
+            logger.info(f"❌ Cache MISS: {cache_key}")
+            AICache._record(endpoint_name, "miss")
+        return None
+
+    @staticmethod
+    def _lookup(cache_key: str, session_id: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        """
+        L1 → Redis(L2) 순서로 조회
+
+        Returns:
+            (캐시된 응답, 만료 시각) 또는 None
+        """
+        hit, needs_register = AICache._lookup_l1(cache_key, session_id)
+        if hit:
+            if needs_register:
+                AICache._register_session(cache_key, session_id)
+            return hit
+
+        cached_data, expires_at = AICache._read(cache_key, session_id)
+        return AICache._finish_lookup(cache_key, cached_data, expires_at, session_id)
+
+    @staticmethod
+    async def _lookup_async(cache_key: str, session_id: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        """L1 → Redis(L2) 순서로 조회 (비동기)"""
+        hit, needs_register = AICache._lookup_l1(cache_key, session_id)
+        if hit:
+            if needs_register:
+                await AICache._register_session_async(cache_key, session_id)
+            return hit
+
+        cached_data, expires_at = await AICache._read_async(cache_key, session_id)
+        return AICache._finish_lookup(cache_key, cached_data, expires_at, session_id)
+
+    @staticmethod
+    def _should_refresh_early(endpoint_name: str, expires_at: float) -> bool:
+        """
+        XFetch 확률적 조기 갱신 판단
+
+        now - delta * beta * ln(rand) >= expiry 이면 만료 전에 미리 갱신한다.
+        생성 시간(delta)이 길고 만료가 가까울수록 갱신 확률이 높아져
+        인기 키가 한꺼번에 만료되어 GPT 호출이 몰리는 현상을 막는다.
+        """
+        delta = AICache._compute_time.get(endpoint_name)
+        if not delta or AI_CACHE_XFETCH_BETA <= 0 or math.isinf(expires_at):
+            return False
+        return time.time() - delta * AI_CACHE_XFETCH_BETA * math.log(1.0 - random.random()) >= expires_at
+
+    @staticmethod
+    def _observe_compute_time(endpoint_name: str, elapsed: float):
+        previous = AICache._compute_time.get(endpoint_name)
+        AICache._compute_time[endpoint_name] = (
+            elapsed if previous is None
+            else COMPUTE_TIME_EWMA_ALPHA * elapsed + (1 - COMPUTE_TIME_EWMA_ALPHA) * previous
+        )
+
+    @staticmethod
+    def _refresh_in_background(cache_key: str, producer: Callable[[], Awaitable[Any]]):
+        """만료 전 백그라운드 갱신 (이미 생성 중이면 생략)"""
+        if cache_key in AICache._inflight:
+            return
+
+        logger.info(f"♻️ Cache EARLY REFRESH: {cache_key}")
+        AICache._record(AICache._endpoint_of(cache_key), "early_refresh")
+
+        def _done(task: asyncio.Task):
+            AICache._refresh_tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(f"Cache early refresh error: {task.exception()}")
+
+        task = asyncio.create_task(AICache.single_flight(cache_key, producer))
+        AICache._refresh_tasks.add(task)
+        task.add_done_callback(_done)
     
     @staticmethod
-    def get_cached_response(cache_key: str) -> Optional[str]:
+    def get_cached_response(cache_key: str, session_id: Optional[str] = None) -> Optional[str]:
         """
-        Redis에서 캐시된 응답 조회
+        캐시된 응답 조회 (L1 활성화 시 L1 → Redis 순서)
         
         Args:
             cache_key: 캐시 키
+            session_id: 세션 ID (지정 시 세션 인덱스에 키 등록)
             
         Returns:
             캐시된 응답 또는 None
         """
-        try:
-            cached_data = redis_client.get(cache_key)
-            if cached_data:
-                logger.info(f"✅ Cache HIT: {cache_key}")
-                return cached_data
+        hit = AICache._lookup(cache_key, session_id)
+        return hit[0] if hit else None
+
+    @staticmethod
+    async def get_cached_response_async(cache_key: str, session_id: Optional[str] = None) -> Optional[str]:
+        """캐시된 응답 조회 (비동기, 이벤트 루프 비차단)"""
+        hit = await AICache._lookup_async(cache_key, session_id)
+        return hit[0] if hit else None
+
+    @staticmethod
+    async def single_flight(cache_key: str, producer: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        동일 키에 대한 동시 요청 병합 (single-flight)
+
+        같은 키로 생성 중인 작업이 있으면 새로 실행하지 않고 그 결과를 기다린다.
+        결과 저장 여부는 producer가 결정한다.
+
+        Args:
+            cache_key: 캐시 키
+            producer: 실제 생성 작업 (예: GPT 호출)
+
+        Returns:
+            producer 결과 (대기자에게는 사본)
+        """
+        inflight = AICache._inflight.get(cache_key)
+        while inflight is not None:
+            try:
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # 기다리던 생성 작업이 중단된 경우(스트림 클라이언트 연결 끊김 등)에만 직접 생성
+                if not inflight.cancelled():
+                    raise
+                inflight = AICache._inflight.get(cache_key)
             else:
-                logger.info(f"❌ Cache MISS: {cache_key}")
-                return None
+                logger.info(f"🔗 Cache COALESCED: {cache_key}")
+                AICache._record(AICache._endpoint_of(cache_key), "coalesced")
+                return copy.deepcopy(result)
+
+        future = asyncio.get_running_loop().create_future()
+        AICache._inflight[cache_key] = future
+        try:
+            result = await producer()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
         except Exception as e:
-            logger.error(f"Cache read error: {e}")
-            return None
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 미조회 경고 방지
+            raise
+        finally:
+            if AICache._inflight.get(cache_key) is future:
+                AICache._inflight.pop(cache_key, None)
+
+    @staticmethod
+    async def get_or_generate(
+        data_str: str,
+        endpoint_name: str,
+        generator: Callable[[], Awaitable[str]],
+        ttl: int = DEFAULT_TTL,
+        session_id: Optional[str] = None
+    ) -> str:
+        """
+        캐시 조회 → 미스 시 생성 후 저장 (동시 요청은 한 번만 생성)
+
+        캐시 적중 시에도 XFetch 판단에 따라 만료 전에 백그라운드로 미리 갱신한다.
+
+        Args:
+            data_str: 사용자 데이터 문자열
+            endpoint_name: 엔드포인트명
+            generator: 캐시 미스 시 응답을 생성하는 코루틴 함수
+            ttl: 캐시 유효 시간 (초)
+            session_id: 세션 ID (세션 단위 무효화 대상으로 등록)
+
+        Returns:
+            캐시된 응답 또는 새로 생성한 응답
+        """
+        cache_key = AICache.generate_cache_key(data_str, endpoint_name)
+
+        async def produce() -> str:
+            start_time = time.time()
+            response = await generator()
+            AICache._observe_compute_time(endpoint_name, time.time() - start_time)
+            await AICache.set_cached_response_async(cache_key, response, ttl, session_id)
+            return response
+
+        hit = await AICache._lookup_async(cache_key, session_id)
+        if hit:
+            cached_response, expires_at = hit
+            if AICache._should_refresh_early(endpoint_name, expires_at):
+                AICache._refresh_in_background(cache_key, produce)
+            return cached_response
+
+        return await AICache.single_flight(cache_key, produce)
     
     @staticmethod
-    def set_cached_response(cache_key: str, response: str, ttl: int = DEFAULT_TTL) -> bool:
+    async def stream_or_generate(
+        data_str: str,
+        endpoint_name: str,
+        streamer: Callable[[], AsyncIterator[str]],
+        finalize: Callable[[str], str] = lambda text: text,
+        ttl: int = DEFAULT_TTL,
+        session_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        get_or_generate의 스트리밍 버전
+
+        캐시 적중 시 저장된 응답을 한 조각으로, 미스 시 streamer 조각을 생성되는 대로 반환한다.
+        스트림이 끝나면 finalize(전체 응답)를 get_or_generate와 같은 키로 저장한다.
+        (같은 키를 생성 중인 요청이 있으면 그 결과를 기다림, 중간에 끊긴 스트림은 저장하지 않음)
+
+        Args:
+            data_str: 사용자 데이터 문자열
+            endpoint_name: 엔드포인트명
+            streamer: 캐시 미스 시 응답 조각을 생성하는 비동기 제너레이터 함수
+            finalize: 저장 전 전체 응답 후처리 (마크다운 제거 등)
+            ttl: 캐시 유효 시간 (초)
+            session_id: 세션 ID (세션 단위 무효화 대상으로 등록)
+
+        Yields:
+            응답 조각 (캐시 적중 시 finalize된 전체 응답 하나)
+        """
+        cache_key = AICache.generate_cache_key(data_str, endpoint_name)
+
+        async def produce() -> str:
+            # 조기 갱신용 (스트림을 끝까지 받아서 저장)
+            start_time = time.time()
+            response = finalize("".join([chunk async for chunk in streamer()]))
+            AICache._observe_compute_time(endpoint_name, time.time() - start_time)
+            await AICache.set_cached_response_async(cache_key, response, ttl, session_id)
+            return response
+
+        hit = await AICache._lookup_async(cache_key, session_id)
+        if hit:
+            cached_response, expires_at = hit
+            if AICache._should_refresh_early(endpoint_name, expires_at):
+                AICache._refresh_in_background(cache_key, produce)
+            yield cached_response
+            return
+
+        inflight = AICache._inflight.get(cache_key)
+        if inflight is not None:
+            try:
+                response = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # 기다리던 스트림이 중단된 경우에만 직접 생성
+                if not inflight.cancelled():
+                    raise
+            else:
+                logger.info(f"🔗 Cache COALESCED: {cache_key}")
+                AICache._record(endpoint_name, "coalesced")
+                yield response
+                return
+
+        future = asyncio.get_running_loop().create_future()
+        AICache._inflight[cache_key] = future
+        try:
+            start_time = time.time()
+            chunks = []
+            async for chunk in streamer():
+                chunks.append(chunk)
+                yield chunk
+
+            response = finalize("".join(chunks))
+            AICache._observe_compute_time(endpoint_name, time.time() - start_time)
+            await AICache.set_cached_response_async(cache_key, response, ttl, session_id)
+            future.set_result(response)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 미조회 경고 방지
+            raise
+        finally:
+            # 클라이언트 연결 종료(GeneratorExit)/취소 → 대기자는 직접 생성
+            if not future.done():
+                future.cancel()
+            if AICache._inflight.get(cache_key) is future:
+                AICache._inflight.pop(cache_key, None)
+
+    @staticmethod
+    def _queue_store(pipe, cache_key: str, response: str, ttl: int, session_id: Optional[str], now: float):
+        pipe.setex(cache_key, ttl, response)
+        # 레지스트리: 만료된 항목 정리 후 등록
+        pipe.zremrangebyscore(REGISTRY_KEY, "-inf", now)
+        pipe.zadd(REGISTRY_KEY, {cache_key: now + ttl})
+        if session_id:
+            AICache._queue_register(pipe, cache_key, session_id, ttl)
+
+    @staticmethod
+    def _after_store(cache_key: str, response: str, ttl: int, session_id: Optional[str], now: float):
+        if AICache._l1 is not None:
+            AICache._l1.set(cache_key, response, now + ttl, session_id)
+        logger.info(f"💾 Cache STORED: {cache_key} (TTL: {ttl}s)")
+
+    @staticmethod
+    def set_cached_response(
+        cache_key: str,
+        response: str,
+        ttl: int = DEFAULT_TTL,
+        session_id: Optional[str] = None
+    ) -> bool:
         """
         Redis에 응답 캐싱
         
@@ -61,13 +600,36 @@ class AICache:
             cache_key: 캐시 키
             response: AI 응답
             ttl: 캐시 유효 시간 (초)
+            session_id: 세션 ID (지정 시 세션 인덱스에 키 등록)
             
         Returns:
             성공 여부
         """
         try:
-            redis_client.setex(cache_key, ttl, response)
-            logger.info(f"💾 Cache STORED: {cache_key} (TTL: {ttl}s)")
+            now = time.time()
+            pipe = redis_client.pipeline(transaction=False)
+            AICache._queue_store(pipe, cache_key, response, ttl, session_id, now)
+            pipe.execute()
+            AICache._after_store(cache_key, response, ttl, session_id, now)
+            return True
+        except Exception as e:
+            logger.error(f"Cache write error: {e}")
+            return False
+
+    @staticmethod
+    async def set_cached_response_async(
+        cache_key: str,
+        response: str,
+        ttl: int = DEFAULT_TTL,
+        session_id: Optional[str] = None
+    ) -> bool:
+        """Redis에 응답 캐싱 (비동기, 이벤트 루프 비차단)"""
+        try:
+            now = time.time()
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                AICache._queue_store(pipe, cache_key, response, ttl, session_id, now)
+                await pipe.execute()
+            AICache._after_store(cache_key, response, ttl, session_id, now)
             return True
         except Exception as e:
             logger.error(f"Cache write error: {e}")
@@ -85,18 +647,41 @@ class AICache:
             성공 여부
         """
         try:
-            result = redis_client.delete(cache_key)
+            if AICache._l1 is not None:
+                AICache._l1.discard(cache_key)
+
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.unlink(cache_key)
+            pipe.zrem(REGISTRY_KEY, cache_key)
+            result = pipe.execute()[0]
             logger.info(f"🗑️ Cache INVALIDATED: {cache_key}")
             return result > 0
         except Exception as e:
             logger.error(f"Cache invalidation error: {e}")
             return False
     
+    @staticmethod
+    def _queue_invalidate(pipe, index_key: str, keys: list):
+        if keys and AICache._l1 is not None:
+            AICache._l1.discard(*keys)
+        if keys:
+            pipe.unlink(*keys)
+            pipe.zrem(REGISTRY_KEY, *keys)
+        pipe.unlink(index_key)
+
+    @staticmethod
+    def _after_invalidate(keys: list, results: list) -> int:
+        deleted = results[0] if keys else 0
+        logger.info(f"🗑️ User cache INVALIDATED: {deleted} keys deleted")
+        return deleted
+    
     @staticmethod
     def invalidate_user_cache(session_id: str) -> int:
         """
         특정 사용자의 모든 캐시 무효화
         
+        세션 인덱스에 등록된 키만 삭제한다 (KEYS 전체 스캔 없음).
+        
         Args:
             session_id: 세션 ID
             
@@ -104,19 +689,54 @@ class AICache:
             삭제된 캐시 개수
         """
         try:
-            # ai_cache:* 패턴의 모든 키 찾기
-            pattern = f"ai_cache:*"
-            keys = redis_client.keys(pattern)
-            
-            if keys:
-                deleted = redis_client.delete(*keys)
-                logger.info(f"🗑️ User cache INVALIDATED: {deleted} keys deleted")
-                return deleted
+            index_key = AICache._session_index_key(session_id)
+            keys = list(redis_client.smembers(index_key))
+
+            pipe = redis_client.pipeline(transaction=False)
+            AICache._queue_invalidate(pipe, index_key, keys)
+            return AICache._after_invalidate(keys, pipe.execute())
+        except Exception as e:
+            logger.error(f"User cache invalidation error: {e}")
             return 0
+    
+    @staticmethod
+    async def invalidate_user_cache_async(session_id: str) -> int:
+        """특정 사용자의 모든 캐시 무효화 (비동기, 이벤트 루프 비차단)"""
+        try:
+            index_key = AICache._session_index_key(session_id)
+            keys = list(await async_redis_client.smembers(index_key))
+
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                AICache._queue_invalidate(pipe, index_key, keys)
+                return AICache._after_invalidate(keys, await pipe.execute())
         except Exception as e:
             logger.error(f"User cache invalidation error: {e}")
             return 0
     
+    @staticmethod
+    def _queue_stats(pipe):
+        # 레지스트리에서 만료된 항목 정리 후 집계 (KEYS 전체 스캔 없음)
+        pipe.zremrangebyscore(REGISTRY_KEY, "-inf", time.time())
+        pipe.zcard(REGISTRY_KEY)
+        pipe.zrevrange(REGISTRY_KEY, 0, 9)  # 최근 등록 10개만
+        pipe.info("memory")
+
+    @staticmethod
+    def _build_stats(results: list) -> dict:
+        _, total, keys, memory_info = results
+        return {
+            "total_cached_items": total,
+            "cache_keys": keys,
+            "endpoint_stats": AICache.get_endpoint_stats(),
+            "l1": {
+                "enabled": AICache._l1 is not None,
+                "size": len(AICache._l1) if AICache._l1 is not None else 0,
+                "max_items": AI_CACHE_L1_MAX_ITEMS,
+                "ttl_seconds": AI_CACHE_L1_TTL_SECONDS,
+            },
+            "redis_info": memory_info
+        }
+
     @staticmethod
     def get_cache_stats() -> dict:
         """
@@ -126,19 +746,48 @@ class AICache:
             캐시 통계 딕셔너리
         """
         try:
-            pattern = "ai_cache:*"
-            keys = redis_client.keys(pattern)
-            
-            stats = {
-                "total_cached_items": len(keys),
-                "cache_keys": keys[:10] if keys else [],  # 처음 10개만
-                "redis_info": redis_client.info("memory")
-            }
-            return stats
+            pipe = redis_client.pipeline(transaction=False)
+            AICache._queue_stats(pipe)
+            return AICache._build_stats(pipe.execute())
         except Exception as e:
             logger.error(f"Cache stats error: {e}")
             return {}
 
+    @staticmethod
+    async def get_cache_stats_async() -> dict:
+        """캐시 통계 조회 (비동기, 이벤트 루프 비차단)"""
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                AICache._queue_stats(pipe)
+                return AICache._build_stats(await pipe.execute())
+        except Exception as e:
+            logger.error(f"Cache stats error: {e}")
+            return {}
+
+    @staticmethod
+    def get_endpoint_stats() -> dict:
+        """
+        엔드포인트별 계층 hit / miss / coalesced 카운터 조회 (현재 프로세스 기준)
+
+        - hit_rate: 전체 조회 대비 적중률 (L1 + L2)
+        - l1_hit_rate: 전체 조회 대비 L1 적중률
+        - l2_hit_rate: L1을 지나 Redis까지 간 조회 대비 L2 적중률
+
+        Returns:
+            {"tax-credit": {"l1_hit": 2, "l2_hit": 1, "hit": 3, "miss": 1, ..., "hit_rate": 0.75}, ...}
+        """
+        with AICache._stats_lock:
+            snapshot = {name: dict(counters) for name, counters in AICache._stats.items()}
+
+        for counters in snapshot.values():
+            counters["hit"] = counters["l1_hit"] + counters["l2_hit"]
+            lookups = counters["hit"] + counters["miss"]
+            l2_lookups = counters["l2_hit"] + counters["miss"]
+            counters["hit_rate"] = round(counters["hit"] / lookups, 4) if lookups else 0.0
+            counters["l1_hit_rate"] = round(counters["l1_hit"] / lookups, 4) if lookups else 0.0
+            counters["l2_hit_rate"] = round(counters["l2_hit"] / l2_lookups, 4) if l2_lookups else 0.0
+        return snapshot
+
 
 def with_cache(endpoint_name: str, ttl: int = AICache.DEFAULT_TTL):
     """
@@ -156,20 +805,12 @@ def with_cache(endpoint_name: str, ttl: int = AICache.DEFAULT_TTL):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(data_str: str, *args, **kwargs) -> str:
-            # 캐시 키 생성
-            cache_key = AICache.generate_cache_key(data_str, endpoint_name)
-            
-            # 캐시 조회
-            cached_response = AICache.get_cached_response(cache_key)
-            if cached_response:
-                return cached_response
-            
-            # 캐시 미스 - 원본 함수 실행
-            response = await func(data_str, *args, **kwargs)
-            
-            # 캐시 저장
-            AICache.set_cached_response(cache_key, response, ttl)
-            
-            return response
+            # 캐시 조회 → 미스 시 원본 함수 실행 (동시 요청은 한 번만 실행)
+            return await AICache.get_or_generate(
+                data_str,
+                endpoint_name,
+                lambda: func(data_str, *args, **kwargs),
+                ttl
+            )
         return wrapper
     return decorator
@@ -0,0 +1,122 @@
+"""
+업로드 문서 추출 결과 캐시 (내용 주소 기반)
+같은 PDF(재업로드, 동일 양식)는 PDF 파싱과 GPT 추출을 다시 하지 않는다.
+
+- 키: 업로드 바이트의 SHA-256 + 문서 종류 + 추출 프롬프트 버전
+- 값: qa_on_document 응답("항목명: 금액" 목록)만 암호화하여 저장 (원문 문서는 저장하지 않음)
+- 복호화 실패(프로세스 재시작으로 키 변경 등)는 캐시 미스로 처리
+"""
+
+import hashlib
+import os
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+
+from config.crypto import Crypto
+from config.redis_config import get_async_redis
+from util.cache.ai_cache import AICache
+from util.log.log import Log
+from util.session.doc_type import classify_doc_type
+
+load_dotenv()
+logger = Log.get_logger()
+async_redis_client = get_async_redis()
+
+EXTRACTION_CACHE_ENABLED = os.getenv("EXTRACTION_CACHE_ENABLED", "true").lower() == "true"
+EXTRACTION_CACHE_TTL = int(os.getenv("EXTRACTION_CACHE_TTL", str(7 * 24 * 60 * 60)))
+
+# 추출 프롬프트/후처리를 바꾸면 올려서 기존 결과를 무효화
+EXTRACTION_PROMPT_VERSION = "v2"
+
+
+class ExtractionCache:
+    """문서 추출 결과 캐시"""
+
+    KEY_PREFIX = "extraction_cache"
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def cache_key(content: bytes, type_of_doc: str) -> str:
+        """
+        캐시 키 생성
+
+        Returns:
+            캐시 키 (예: "extraction_cache:extraction-income:v2:9f86d0...")
+            AICache 통계에는 "extraction-income" 엔드포인트로 집계된다.
+        """
+        kind = classify_doc_type(type_of_doc) or "other"
+        return (
+            f"{ExtractionCache.KEY_PREFIX}:extraction-{kind}:"
+            f"{EXTRACTION_PROMPT_VERSION}:{ExtractionCache.content_hash(content)}"
+        )
+
+    @staticmethod
+    async def get(cache_key: str) -> Optional[str]:
+        try:
+            encrypted = await async_redis_client.get(cache_key)
+        except Exception as e:
+            logger.error(f"[EXTRACTION CACHE] Get error: {str(e)}")
+            return None
+        if encrypted is None:
+            return None
+
+        try:
+            return Crypto.dec_data(encrypted)
+        except Exception:
+            # 다른 키로 암호화된 항목 → 덮어쓸 수 있도록 미스 처리
+            logger.warning(f"[EXTRACTION CACHE] Undecryptable entry, treating as miss: {cache_key}")
+            return None
+
+    @staticmethod
+    async def set(cache_key: str, answer: str, ttl: int = EXTRACTION_CACHE_TTL) -> bool:
+        try:
+            await async_redis_client.setex(cache_key, ttl, Crypto.enc_data(answer))
+            return True
+        except Exception as e:
+            logger.error(f"[EXTRACTION CACHE] Set error: {str(e)}")
+            return False
+
+    @staticmethod
+    async def get_or_extract(
+        content: bytes,
+        type_of_doc: str,
+        extractor: Callable[[], Awaitable[str]],
+        ttl: int = EXTRACTION_CACHE_TTL
+    ) -> str:
+        """
+        캐시된 추출 결과 조회, 없으면 extractor 실행 후 저장
+
+        같은 문서가 동시에 올라오면 AICache.single_flight로 한 번만 추출한다.
+
+        Args:
+            content: 업로드된 파일 바이트
+            type_of_doc: 문서 종류 (소득/지출)
+            extractor: PDF 파싱 + GPT 추출 작업
+            ttl: 캐시 유효 시간 (초)
+
+        Returns:
+            추출 응답 ("항목명: 금액" 목록)
+        """
+        if not EXTRACTION_CACHE_ENABLED:
+            return await extractor()
+
+        cache_key = ExtractionCache.cache_key(content, type_of_doc)
+        cached = await ExtractionCache.get(cache_key)
+        if cached is not None:
+            logger.info(f"✅ Extraction cache HIT: {cache_key}")
+            AICache.record_event(cache_key, "l2_hit")
+            return cached
+
+        async def produce() -> str:
+            AICache.record_event(cache_key, "miss")
+            answer = await extractor()
+            if answer and answer.strip():
+                await ExtractionCache.set(cache_key, answer, ttl)
+                logger.info(f"💾 Extraction cache STORED: {cache_key} (TTL: {ttl}s)")
+            return answer
+
+        return await AICache.single_flight(cache_key, produce)
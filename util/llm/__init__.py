@@ -0,0 +1 @@
+# LLM module
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""
+공용 LLM 게이트웨이
+모든 GPT 호출을 한 곳으로 모아 모델별 동시 실행 수, 타임아웃, 재시도를 설정값으로 제어
+"""
+
+import asyncio
+import os
+import random
+import re
+import threading
+import time
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncOpenAI, OpenAI, APIConnectionError, RateLimitError, InternalServerError
+
+from util.log.log import Log
+
+load_dotenv()
+logger = Log.get_logger()
+
+# 모델별 동시 실행 수 (LLM_CONCURRENCY_GPT_4O_MINI 처럼 모델별로 덮어쓰기 가능)
+LLM_DEFAULT_CONCURRENCY = int(os.getenv("LLM_DEFAULT_CONCURRENCY", "8"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+LLM_CONNECT_TIMEOUT_SECONDS = float(os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "5"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5"))
+LLM_RETRY_MAX_DELAY = float(os.getenv("LLM_RETRY_MAX_DELAY", "8"))
+
+# 재시도 대상 오류 (APITimeoutError는 APIConnectionError의 하위 클래스)
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+
+def _model_concurrency(model: str) -> int:
+    env_key = "LLM_CONCURRENCY_" + re.sub(r"[^A-Z0-9]", "_", model.upper())
+    return max(1, int(os.getenv(env_key, LLM_DEFAULT_CONCURRENCY)))
+
+
+def _backoff_delay(attempt: int) -> float:
+    """지수 백오프 + Full Jitter"""
+    return random.uniform(0, min(LLM_RETRY_MAX_DELAY, LLM_RETRY_BASE_DELAY * (2 ** attempt)))
+
+
+class LLMGateway:
+    """
+    OpenAI 호출 게이트웨이 (Singleton)
+
+    - AsyncOpenAI 기반 비동기 호출 (스레드 풀 미사용)
+    - 모델별 세마포어로 동시 실행 수 제한
+    - httpx 커넥션 풀 재사용, 타임아웃, 지터 포함 재시도
+    - 동기 코드 경로를 위한 chat_sync 제공 (동일한 제한 정책 적용)
+    - 토큰 단위 스트리밍 stream_chat 제공 (SSE 응답용)
+    """
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            timeout = httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT_SECONDS)
+            limits = httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_CONNECTIONS
+            )
+
+            # 재시도는 게이트웨이에서 직접 처리하므로 SDK 재시도는 끔
+            self.async_client = AsyncOpenAI(
+                timeout=timeout,
+                max_retries=0,
+                http_client=httpx.AsyncClient(timeout=timeout, limits=limits)
+            )
+            self.sync_client = OpenAI(
+                timeout=timeout,
+                max_retries=0,
+                http_client=httpx.Client(timeout=timeout, limits=limits)
+            )
+
+            self._async_semaphores: Dict[str, asyncio.Semaphore] = {}
+            self._sync_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+            self._lock = threading.Lock()
+            self.initialized = True
+
+    def _get_async_semaphore(self, model: str) -> asyncio.Semaphore:
+        semaphore = self._async_semaphores.get(model)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(_model_concurrency(model))
+            self._async_semaphores[model] = semaphore
+        return semaphore
+
+    def _get_sync_semaphore(self, model: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._sync_semaphores.get(model)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(_model_concurrency(model))
+                self._sync_semaphores[model] = semaphore
+            return semaphore
+
+    @staticmethod
+    def _build_params(prompt: str, model: str, max_tokens: int, temperature: float,
+                      seed: Optional[int], options: dict) -> dict:
+        params = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if seed is not None:
+            params["seed"] = seed
+        params.update(options)
+        return params
+
+    async def chat(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int = 2000,
+        temperature: float = 0,
+        seed: Optional[int] = None,
+        **options
+    ) -> str:
+        """
+        단일 프롬프트 비동기 호출
+
+        Returns:
+            응답 본문 문자열
+        """
+        params = self._build_params(prompt, model, max_tokens, temperature, seed, options)
+        semaphore = self._get_async_semaphore(model)
+
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            try:
+                async with semaphore:
+                    response = await self.async_client.chat.completions.create(**params)
+                return response.choices[0].message.content
+            except RETRYABLE_ERRORS as e:
+                if attempt >= LLM_MAX_RETRIES:
+                    logger.error(f"[LLM] {model} 호출 실패 (재시도 {attempt}회 후): {type(e).__name__}")
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"[LLM] {model} 호출 오류 {type(e).__name__}, {delay:.2f}s 후 재시도 ({attempt + 1}/{LLM_MAX_RETRIES})")
+                await asyncio.sleep(delay)
+
+    async def stream_chat(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int = 2000,
+        temperature: float = 0,
+        seed: Optional[int] = None,
+        **options
+    ) -> AsyncIterator[str]:
+        """
+        단일 프롬프트 스트리밍 호출 (생성되는 대로 텍스트 조각 반환)
+
+        스트림이 열려 있는 동안 모델별 동시 실행 슬롯을 점유한다.
+        첫 조각을 받기 전 오류만 재시도 (이미 보낸 조각은 되돌릴 수 없으므로)
+
+        Yields:
+            응답 본문 조각
+        """
+        params = self._build_params(prompt, model, max_tokens, temperature, seed, options)
+        params["stream"] = True
+        semaphore = self._get_async_semaphore(model)
+
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            streamed = False
+            try:
+                async with semaphore:
+                    stream = await self.async_client.chat.completions.create(**params)
+                    async with stream:
+                        async for chunk in stream:
+                            if chunk.choices and chunk.choices[0].delta.content:
+                                streamed = True
+                                yield chunk.choices[0].delta.content
+                return
+            except RETRYABLE_ERRORS as e:
+                if streamed or attempt >= LLM_MAX_RETRIES:
+                    logger.error(f"[LLM] {model} 스트리밍 실패 (재시도 {attempt}회 후): {type(e).__name__}")
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"[LLM] {model} 스트리밍 오류 {type(e).__name__}, {delay:.2f}s 후 재시도 ({attempt + 1}/{LLM_MAX_RETRIES})")
+                await asyncio.sleep(delay)
+
+    def chat_sync(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int = 2000,
+        temperature: float = 0,
+        seed: Optional[int] = None,
+        **options
+    ) -> str:
+        """
+        단일 프롬프트 동기 호출 (동기 코드 경로 전용)
+
+        Returns:
+            응답 본문 문자열
+        """
+        params = self._build_params(prompt, model, max_tokens, temperature, seed, options)
+        semaphore = self._get_sync_semaphore(model)
+
+        for attempt in range(LLM_MAX_RETRIES + 1):
+            try:
+                with semaphore:
+                    response = self.sync_client.chat.completions.create(**params)
+                return response.choices[0].message.content
+            except RETRYABLE_ERRORS as e:
+                if attempt >= LLM_MAX_RETRIES:
+                    logger.error(f"[LLM] {model} 호출 실패 (재시도 {attempt}회 후): {type(e).__name__}")
+                    raise
+                delay = _backoff_delay(attempt)
+                logger.warning(f"[LLM] {model} 호출 오류 {type(e).__name__}, {delay:.2f}s 후 재시도 ({attempt + 1}/{LLM_MAX_RETRIES})")
+                time.sleep(delay)
+
+    async def aclose(self):
+        """커넥션 풀 정리 (서버 종료 시)"""
+        await self.async_client.close()
+        self.sync_client.close()
@@ -0,0 +1,34 @@
+"""
+프롬프트 토큰 수 계산
+tiktoken이 설치되어 있으면 정확한 값, 없으면 근사치 사용
+"""
+
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+DEFAULT_ENCODING = "o200k_base"  # gpt-4o / gpt-4.1 계열
+
+
+@lru_cache(maxsize=16)
+def _encoding(model: str):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+def count_tokens(text: str, model: str = "gpt-4.1") -> int:
+    """
+    텍스트 토큰 수
+
+    근사치(tiktoken 미설치): ASCII 4자당 1토큰, 한글 등 그 외 문자는 1자당 1토큰
+    """
+    if tiktoken is not None:
+        return len(_encoding(model).encode(text))
+
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
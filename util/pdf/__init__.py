@@ -0,0 +1 @@
+# PDF module
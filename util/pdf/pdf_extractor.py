@@ -0,0 +1,298 @@
+"""
+PDF 텍스트 추출기
+페이지 추출(pypdf)과 정규식 정리를 이벤트 루프 밖의 프로세스 풀에서 실행
+
+- 풀 크기와 동시 처리 문서 수 제한 (요청 폭주 시 대기)
+- 문서당 제한 시간 + 워커 CPU 시간 제한 (RLIMIT_CPU, 유닉스 계열)
+- 페이지 묶음 단위 병렬 추출 후 순서대로 조립
+  (업로드 바이트는 임시 파일로 한 번만 쓰고, 워커는 문서당 한 번만 열어 재사용 - 작업마다 바이트 전송/재파싱 없음)
+- 핵심 섹션이 모두 나오면 남은 페이지는 추출하지 않음 (빠른 경로)
+"""
+
+import asyncio
+import io
+import math
+import os
+import re
+import signal
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import List, Optional, Sequence, Tuple
+
+from dotenv import load_dotenv
+from pypdf import PdfReader
+
+from util.log.log import Log
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+load_dotenv()
+logger = Log.get_logger()
+
+PDF_EXTRACT_MAX_WORKERS = int(os.getenv("PDF_EXTRACT_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_EXTRACT_MAX_CONCURRENT_DOCS = int(os.getenv("PDF_EXTRACT_MAX_CONCURRENT_DOCS", str(PDF_EXTRACT_MAX_WORKERS * 2)))
+PDF_EXTRACT_TIMEOUT_SECONDS = float(os.getenv("PDF_EXTRACT_TIMEOUT_SECONDS", "20"))
+PDF_EXTRACT_CPU_SECONDS = float(os.getenv("PDF_EXTRACT_CPU_SECONDS", "15"))
+PDF_EXTRACT_PAGES_PER_TASK = max(1, int(os.getenv("PDF_EXTRACT_PAGES_PER_TASK", "4")))
+PDF_EXTRACT_EARLY_STOP = os.getenv("PDF_EXTRACT_EARLY_STOP", "true").lower() == "true"
+# 워커별로 열어 둘 문서 수 (동시에 처리 중인 문서의 묶음이 같은 워커로 올 수 있음)
+PDF_EXTRACT_READER_CACHE_SIZE = max(1, int(os.getenv("PDF_EXTRACT_READER_CACHE_SIZE", "4")))
+
+# 문서 종류별 핵심 섹션 (그룹마다 하나 이상 등장하면 해당 섹션을 찾은 것으로 간주)
+INCOME_KEY_SECTIONS: Tuple[Tuple[str, ...], ...] = (
+    ("총급여", "지급합계", "급여총액", "지급총액"),
+    ("결정세액", "공제합계", "차인지급액", "실수령액"),
+)
+
+
+class PdfExtractionError(Exception):
+    """PDF 파싱 실패"""
+
+
+class PdfExtractionTimeout(PdfExtractionError):
+    """문서당 제한 시간 또는 CPU 시간 초과"""
+
+
+# -----------------------
+# 워커 프로세스에서 실행되는 함수들
+# -----------------------
+_cpu_limit_active = False
+
+
+def _on_cpu_limit(signum, frame):
+    # 작업이 끝난 뒤 늦게 도착한 신호는 무시
+    if _cpu_limit_active:
+        raise PdfExtractionTimeout("PDF extraction exceeded CPU time limit")
+
+
+def _init_worker():
+    if resource is not None:
+        signal.signal(signal.SIGXCPU, _on_cpu_limit)
+
+
+@contextmanager
+def _cpu_limit(seconds: int):
+    """이번 작업에만 CPU 시간 제한 적용 (워커는 재사용되므로 누적 사용량 기준으로 설정 후 복원)"""
+    global _cpu_limit_active
+    if resource is None or seconds <= 0:
+        yield
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    limit = math.ceil(_cpu_used()) + math.ceil(seconds)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+    _cpu_limit_active = True
+    try:
+        yield
+    finally:
+        _cpu_limit_active = False
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _cpu_used() -> float:
+    return time.process_time()
+
+
+def clean_page_text(text: str) -> str:
+    text = re.sub(r'\s+', ' ', text)  # 공백 정리
+    text = re.sub(r'\d+\s*$', '', text)  # 페이지 번호 제거 (행 끝 숫자)
+    return text.strip()
+
+
+# 워커 프로세스별 열린 문서 (문서 ID → PdfReader, 최근 사용 순)
+_readers: "OrderedDict[str, PdfReader]" = OrderedDict()
+
+
+def _open_reader(doc_id: str, path: str) -> PdfReader:
+    """문서를 이 워커에서 처음 볼 때만 파일을 읽어 파싱하고, 이후 묶음은 같은 PdfReader 재사용"""
+    reader = _readers.get(doc_id)
+    if reader is not None:
+        _readers.move_to_end(doc_id)
+        return reader
+
+    with open(path, "rb") as file:
+        reader = PdfReader(io.BytesIO(file.read()))
+    _readers[doc_id] = reader
+    while len(_readers) > PDF_EXTRACT_READER_CACHE_SIZE:
+        _readers.popitem(last=False)
+    return reader
+
+
+def _count_pages(doc_id: str, path: str, cpu_seconds: float) -> Tuple[int, float]:
+    """(페이지 수, 사용한 CPU 시간)"""
+    started = _cpu_used()
+    with _cpu_limit(cpu_seconds):
+        page_count = len(_open_reader(doc_id, path).pages)
+    return page_count, _cpu_used() - started
+
+
+def _extract_pages(doc_id: str, path: str, start: int, end: int, cpu_seconds: float) -> Tuple[List[str], float]:
+    """([start, end) 페이지의 정리된 텍스트 (빈 페이지 제외), 사용한 CPU 시간)"""
+    started = _cpu_used()
+    with _cpu_limit(cpu_seconds):
+        try:
+            reader = _open_reader(doc_id, path)
+        except FileNotFoundError:
+            # 빠른 경로/타임아웃으로 문서 처리가 이미 끝나 임시 파일이 삭제된 경우 (결과는 쓰이지 않음)
+            return [], _cpu_used() - started
+        texts = []
+        for page in reader.pages[start:end]:
+            t = clean_page_text(page.extract_text() or "")
+            if t:
+                texts.append(t)
+    return texts, _cpu_used() - started
+
+
+def has_key_sections(text: str, key_sections: Sequence[Sequence[str]]) -> bool:
+    return all(any(keyword in text for keyword in group) for group in key_sections)
+
+
+def key_sections_for(type_of_doc: str) -> Optional[Tuple[Tuple[str, ...], ...]]:
+    """문서 종류 → 빠른 경로용 핵심 섹션 (지출 문서는 형식이 다양해 끝까지 추출)"""
+    if "소득" in type_of_doc or "income" in type_of_doc.lower():
+        return INCOME_KEY_SECTIONS
+    return None
+
+
+class PdfExtractor:
+    """
+    PDF 텍스트 추출기 (Singleton)
+
+    프로세스 풀은 첫 호출 시 생성되며, 워커가 죽으면(BrokenProcessPool) 다음 호출에서 다시 만든다.
+    """
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self._pool: Optional[ProcessPoolExecutor] = None
+            self._doc_slots = asyncio.Semaphore(PDF_EXTRACT_MAX_CONCURRENT_DOCS)
+            self.initialized = True
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=PDF_EXTRACT_MAX_WORKERS, initializer=_init_worker)
+            logger.info(f"[PDF] Process pool started (workers={PDF_EXTRACT_MAX_WORKERS})")
+        return self._pool
+
+    def _reset_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def extract_text(self, file_bytes: bytes, key_sections: Optional[Sequence[Sequence[str]]] = None) -> str:
+        """
+        PDF → 정리된 텍스트 (페이지 순서 유지, 페이지 사이 줄바꿈)
+
+        Args:
+            file_bytes: PDF 파일 내용
+            key_sections: 모두 찾으면 남은 페이지 추출을 생략할 핵심 섹션 (None이면 전체 추출)
+
+        Raises:
+            PdfExtractionTimeout: 제한 시간/CPU 시간 초과
+            PdfExtractionError: PDF 파싱 실패
+        """
+        async with self._doc_slots:
+            try:
+                return await asyncio.wait_for(
+                    self._extract(file_bytes, key_sections if PDF_EXTRACT_EARLY_STOP else None),
+                    timeout=PDF_EXTRACT_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                raise PdfExtractionTimeout(f"PDF extraction timed out after {PDF_EXTRACT_TIMEOUT_SECONDS}s")
+            except BrokenProcessPool as e:
+                # CPU 제한 등으로 워커가 죽은 경우 → 풀 재생성
+                self._reset_pool()
+                raise PdfExtractionError(f"PDF worker crashed: {str(e)}")
+            except PdfExtractionError:
+                raise
+            except Exception as e:
+                raise PdfExtractionError(str(e))
+
+    async def _extract(self, file_bytes: bytes, key_sections: Optional[Sequence[Sequence[str]]]) -> str:
+        # 워커에는 바이트 대신 임시 파일 경로만 전달 (워커는 문서당 한 번만 읽고 파싱)
+        path = await asyncio.to_thread(self._write_temp, file_bytes)
+        try:
+            return await self._extract_file(uuid.uuid4().hex, path, key_sections)
+        finally:
+            await asyncio.to_thread(self._remove_temp, path)
+
+    @staticmethod
+    def _write_temp(file_bytes: bytes) -> str:
+        fd, path = tempfile.mkstemp(prefix="pdf_extract_", suffix=".pdf")
+        with os.fdopen(fd, "wb") as file:
+            file.write(file_bytes)
+        return path
+
+    @staticmethod
+    def _remove_temp(path: str):
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning(f"[PDF] Failed to remove temp file {path}: {str(e)}")
+
+    async def _extract_file(
+        self, doc_id: str, path: str, key_sections: Optional[Sequence[Sequence[str]]]
+    ) -> str:
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+
+        # 문서당 CPU 예산: 워커별 RLIMIT_CPU는 한 작업의 상한, 합계는 여기서 누적 확인
+        page_count, cpu_spent = await loop.run_in_executor(
+            pool, _count_pages, doc_id, path, PDF_EXTRACT_CPU_SECONDS
+        )
+        tasks = [
+            loop.run_in_executor(
+                pool, _extract_pages, doc_id, path, start,
+                min(start + PDF_EXTRACT_PAGES_PER_TASK, page_count), PDF_EXTRACT_CPU_SECONDS
+            )
+            for start in range(0, page_count, PDF_EXTRACT_PAGES_PER_TASK)
+        ]
+
+        texts: List[str] = []
+        try:
+            # 병렬로 추출하되 페이지 순서대로 조립
+            for index, task in enumerate(tasks):
+                chunk_texts, chunk_cpu = await task
+                texts.extend(chunk_texts)
+                cpu_spent += chunk_cpu
+                if cpu_spent > PDF_EXTRACT_CPU_SECONDS:
+                    raise PdfExtractionTimeout(
+                        f"PDF extraction exceeded CPU budget ({cpu_spent:.1f}s > {PDF_EXTRACT_CPU_SECONDS}s)"
+                    )
+                if key_sections and index < len(tasks) - 1 and has_key_sections("\n".join(texts), key_sections):
+                    logger.info(f"[PDF] Key sections found, skipped {len(tasks) - index - 1} page chunks")
+                    break
+        finally:
+            # 빠른 경로/예외/타임아웃: 아직 시작하지 않은 묶음 취소
+            for task in tasks:
+                task.cancel()
+                if task.done() and not task.cancelled():
+                    task.exception()  # 회수하지 않은 예외 경고 방지
+
+        logger.info(f"[PDF] Extracted {len(texts)} non-empty pages of {page_count} (cpu={cpu_spent:.2f}s)")
+        return "\n".join(texts)
+
+    def shutdown(self):
+        self._reset_pool()
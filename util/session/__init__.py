@@ -0,0 +1 @@
+# Session module
\ No newline at end of file
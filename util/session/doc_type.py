@@ -0,0 +1,15 @@
+"""
+문서 타입 분류
+외부 의존성 없음 (Redis 설정 등을 불러오지 않고 도메인 서비스에서도 사용)
+"""
+
+from typing import Optional
+
+
+def classify_doc_type(doc_type: str) -> Optional[str]:
+    """문서 타입 → "income" / "expense" / None"""
+    if "소득" in doc_type or "income" in doc_type.lower():
+        return "income"
+    if "지출" in doc_type or "expense" in doc_type.lower():
+        return "expense"
+    return None
@@ -0,0 +1,111 @@
+"""
+세션 재무 문서 (FIN_DOC)
+세션의 추출 항목 전체를 하나의 암호화된 JSON 문서로 저장하는 포맷
+
+    세션 해시:
+        USER_TOKEN → 토큰 (평문)
+        FIN_DOC    → enc({"v": 1, "items": [[문서타입, 항목명, 값], ...]})
+
+기존 포맷(enc("문서타입:항목명") → enc(값) 필드)도 계속 읽을 수 있으며,
+FIN_DOC 포맷으로 쓸 때 기존 필드를 문서로 합치고 삭제한다.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from config.crypto import Crypto
+
+load_dotenv()
+
+# "fields": 기존 필드 단위 저장 / "blob": FIN_DOC 단일 문서 저장
+SESSION_STORE_FORMAT = os.getenv("SESSION_STORE_FORMAT", "fields").lower()
+
+USER_TOKEN_FIELD = "USER_TOKEN"
+FIN_DOC_FIELD = "FIN_DOC"
+FIN_DOC_VERSION = 1
+
+SessionItem = Tuple[str, str, str]  # (문서타입, 항목명, 값)
+
+
+def use_document_format() -> bool:
+    return SESSION_STORE_FORMAT == "blob"
+
+
+def is_legacy_field(field_name: str) -> bool:
+    """기존 포맷의 암호화된 "문서타입:항목명" 필드인지"""
+    return field_name not in (USER_TOKEN_FIELD, FIN_DOC_FIELD)
+
+
+def encode_document(items: Iterable[SessionItem]) -> str:
+    """항목 목록 → 암호화된 FIN_DOC 값"""
+    document = {"v": FIN_DOC_VERSION, "items": [list(item) for item in items]}
+    return Crypto.enc_data(json.dumps(document, ensure_ascii=False, separators=(",", ":")))
+
+
+def decode_document(encrypted: str) -> List[SessionItem]:
+    """
+    암호화된 FIN_DOC 값 → 항목 목록
+
+    Raises:
+        ValueError: 복호화 실패 또는 지원하지 않는 문서 버전
+    """
+    document = json.loads(Crypto.dec_data(encrypted))
+    version = document.get("v")
+    if version != FIN_DOC_VERSION:
+        raise ValueError(f"Unsupported FIN_DOC version: {version}")
+    return [(doc_type, field_name, value) for doc_type, field_name, value in document["items"]]
+
+
+def merge_items(*groups: Iterable[SessionItem]) -> List[SessionItem]:
+    """
+    항목 목록 병합 (뒤 그룹이 같은 문서타입:항목명의 값을 덮어씀, 처음 등장 순서 유지)
+    """
+    merged: Dict[Tuple[str, str], str] = {}
+    for items in groups:
+        for doc_type, field_name, value in items:
+            merged[(doc_type, field_name)] = value
+    return [(doc_type, field_name, value) for (doc_type, field_name), value in merged.items()]
+
+
+def decode_legacy_fields(legacy: Dict[str, str]) -> Tuple[List[SessionItem], int]:
+    """
+    기존 포맷 필드 → (항목 목록, 복호화 실패 수)
+
+    해시 전체를 dec_many 한 번으로 복호화한다.
+    """
+    encrypted = []
+    for key, value in legacy.items():
+        encrypted.append(key)
+        encrypted.append(value)
+
+    decrypted = Crypto.dec_many(encrypted, ignore_errors=True)
+
+    items = []
+    failed = 0
+    for key_plain, value_plain in zip(decrypted[0::2], decrypted[1::2]):
+        if key_plain is None or value_plain is None:
+            failed += 1
+            continue
+        # "타입:필드명" 형태만 사용
+        if ":" not in key_plain:
+            continue
+        doc_type, field_name = key_plain.split(":", 1)
+        items.append((doc_type, field_name, value_plain))
+    return items, failed
+
+
+def split_hash(raw: dict) -> Tuple[Optional[str], Dict[str, str]]:
+    """세션 해시 → (FIN_DOC 값, 기존 포맷 필드)"""
+    document = None
+    legacy = {}
+    for key, value in raw.items():
+        key = key.decode("utf-8") if isinstance(key, bytes) else str(key)
+        value = value.decode("utf-8") if isinstance(value, bytes) else str(value)
+        if key == FIN_DOC_FIELD:
+            document = value
+        elif is_legacy_field(key):
+            legacy[key] = value
+    return document, legacy
@@ -0,0 +1,239 @@
+"""
+세션 스냅샷 로더
+세션 해시(필드 단위 또는 FIN_DOC 문서)를 요청당 한 번만 복호화하여 공유
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from config.redis_config import get_redis, get_async_redis
+from util.log.log import Log
+from util.session.doc_type import classify_doc_type
+from util.session.session_document import (
+    decode_document,
+    decode_legacy_fields,
+    merge_items,
+    split_hash
+)
+
+load_dotenv()
+logger = Log.get_logger()
+
+# 세션 해시 버전 키 (세션 데이터를 쓸 때마다 INCR)
+SESSION_VERSION_PREFIX = "session_version:"
+SESSION_VERSION_TTL = 7 * 24 * 60 * 60  # 세션(24시간)보다 길게 유지
+
+# 프로세스 내 스냅샷 캐시 (session_id, version) → SessionSnapshot
+SESSION_SNAPSHOT_CACHE_SIZE = int(os.getenv("SESSION_SNAPSHOT_CACHE_SIZE", "256"))
+SESSION_SNAPSHOT_CACHE_TTL = float(os.getenv("SESSION_SNAPSHOT_CACHE_TTL", "300"))
+
+# 요청 단위 메모 (session_id → SessionSnapshot)
+_request_snapshots: ContextVar[Optional[Dict[str, "SessionSnapshot"]]] = ContextVar(
+    "request_session_snapshots", default=None
+)
+
+
+@dataclass
+class SessionSnapshot:
+    """
+    복호화된 세션 데이터
+
+    Attributes:
+        session_id: 세션 ID
+        version: 세션 해시 버전
+        items: (문서타입, 항목명, 값) 목록 - 해시 순서 유지
+        field_count: 해시 전체 필드 수 (USER_TOKEN 포함)
+    """
+    session_id: str
+    version: int
+    items: Tuple[Tuple[str, str, str], ...] = ()
+    field_count: int = 0
+    _income: Dict[str, str] = field(default_factory=dict, repr=False)
+    _expense: Dict[str, str] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        for doc_type, field_name, value in self.items:
+            kind = classify_doc_type(doc_type)
+            if kind == "income":
+                self._income[field_name] = value
+            elif kind == "expense":
+                self._expense[field_name] = value
+
+    @property
+    def is_empty(self) -> bool:
+        """재무 데이터가 없는지 여부 (USER_TOKEN만 있는 경우 포함)"""
+        return not self.items
+
+    def income_items(self) -> Dict[str, str]:
+        """소득 항목 (호출자가 수정해도 되도록 사본 반환)"""
+        return dict(self._income)
+
+    def expense_items(self) -> Dict[str, str]:
+        """지출 항목 (호출자가 수정해도 되도록 사본 반환)"""
+        return dict(self._expense)
+
+    def data_str(self) -> str:
+        """GPT 프롬프트용 "항목명: 값, ..." 문자열"""
+        return ", ".join(f"{field_name}: {value}" for _, field_name, value in self.items)
+
+
+class SessionSnapshotService:
+    """
+    세션 스냅샷 서비스 (Singleton)
+
+    - 요청 단위 메모: 같은 요청 안에서는 Redis 조회/복호화 1회
+    - 프로세스 캐시: (session_id, 버전)이 같으면 요청이 달라도 재복호화하지 않음
+    - 세션 데이터를 쓰는 쪽은 bump_version()으로 버전을 올려야 한다
+    """
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.redis_client = get_redis()
+            self.async_redis_client = get_async_redis()
+            self._cache: "OrderedDict[Tuple[str, int], Tuple[SessionSnapshot, float]]" = OrderedDict()
+            self._lock = threading.Lock()
+            self.initialized = True
+
+    @staticmethod
+    def version_key(session_id: str) -> str:
+        return f"{SESSION_VERSION_PREFIX}{session_id}"
+
+    def load(self, session_id: str) -> SessionSnapshot:
+        """
+        세션 스냅샷 조회
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            SessionSnapshot (데이터가 없으면 빈 스냅샷)
+        """
+        memo = _request_snapshots.get()
+        if memo is not None and session_id in memo:
+            return memo[session_id]
+
+        version = int(self.redis_client.get(self.version_key(session_id)) or 0)
+        snapshot = self._get_cached(session_id, version)
+        if snapshot is None:
+            snapshot = self._decrypt(session_id, version, self.redis_client.hgetall(session_id))
+            self._put_cached(snapshot)
+
+        self._remember(session_id, snapshot)
+        return snapshot
+
+    async def load_async(self, session_id: str) -> SessionSnapshot:
+        """세션 스냅샷 조회 (비동기, 이벤트 루프 비차단)"""
+        memo = _request_snapshots.get()
+        if memo is not None and session_id in memo:
+            return memo[session_id]
+
+        version = int(await self.async_redis_client.get(self.version_key(session_id)) or 0)
+        snapshot = self._get_cached(session_id, version)
+        if snapshot is None:
+            snapshot = self._decrypt(session_id, version, await self.async_redis_client.hgetall(session_id))
+            self._put_cached(snapshot)
+
+        self._remember(session_id, snapshot)
+        return snapshot
+
+    @staticmethod
+    def _remember(session_id: str, snapshot: SessionSnapshot):
+        memo = _request_snapshots.get()
+        if memo is None:
+            memo = {}
+            _request_snapshots.set(memo)
+        memo[session_id] = snapshot
+
+    def bump_version(self, session_id: str) -> int:
+        """
+        세션 데이터 변경 알림 (버전 증가 + 요청 메모 제거)
+
+        Returns:
+            새 버전
+        """
+        pipe = self.redis_client.pipeline(transaction=False)
+        self.queue_version_bump(pipe, session_id)
+        version = pipe.execute()[0]
+        self.forget(session_id)
+        return version
+
+    @staticmethod
+    def queue_version_bump(pipe, session_id: str):
+        """파이프라인에 버전 증가 명령 추가 (INCR 결과가 버전)"""
+        version_key = SessionSnapshotService.version_key(session_id)
+        pipe.incr(version_key)
+        pipe.expire(version_key, SESSION_VERSION_TTL)
+
+    def forget(self, session_id: str):
+        """현재 요청의 메모에서 세션 제거"""
+        memo = _request_snapshots.get()
+        if memo is not None:
+            memo.pop(session_id, None)
+
+    def _decrypt(self, session_id: str, version: int, encrypted_data: dict) -> SessionSnapshot:
+        document, legacy = split_hash(encrypted_data)
+
+        # 기존 포맷 필드 (FIN_DOC 이전 데이터) - 해시 전체를 한 번에 복호화
+        legacy_items, failed = decode_legacy_fields(legacy)
+        if failed:
+            logger.warning(f"[SESSION] Decryption failed for {failed} session fields")
+
+        document_items = []
+        if document is not None:
+            try:
+                document_items = decode_document(document)
+            except Exception as e:
+                logger.warning(f"[SESSION] FIN_DOC decode failed: {str(e)}")
+
+        # FIN_DOC 이후에 필드 단위로 쓴 값이 있으면 그 값이 최신
+        items = merge_items(document_items, legacy_items) if document_items else legacy_items
+
+        return SessionSnapshot(
+            session_id=session_id,
+            version=version,
+            items=tuple(items),
+            field_count=len(encrypted_data)
+        )
+
+    def _get_cached(self, session_id: str, version: int) -> Optional[SessionSnapshot]:
+        with self._lock:
+            entry = self._cache.get((session_id, version))
+            if entry is None:
+                return None
+            snapshot, expires_at = entry
+            if expires_at <= time.time():
+                del self._cache[(session_id, version)]
+                return None
+            self._cache.move_to_end((session_id, version))
+            return snapshot
+
+    def _put_cached(self, snapshot: SessionSnapshot):
+        if SESSION_SNAPSHOT_CACHE_SIZE <= 0:
+            return
+        with self._lock:
+            self._cache[(snapshot.session_id, snapshot.version)] = (
+                snapshot, time.time() + SESSION_SNAPSHOT_CACHE_TTL
+            )
+            self._cache.move_to_end((snapshot.session_id, snapshot.version))
+            while len(self._cache) > SESSION_SNAPSHOT_CACHE_SIZE:
+                self._cache.popitem(last=False)
@@ -0,0 +1,190 @@
+"""
+세션 쓰기 도우미
+추출된 항목을 암호화하여 세션 해시에 한 번의 파이프라인(MULTI)으로 저장
+
+SESSION_STORE_FORMAT=blob 이면 항목 전체를 FIN_DOC 문서 하나로 병합 저장한다.
+(WATCH 후 읽고-병합-쓰기, 기존 필드 단위 데이터는 문서로 옮기고 삭제)
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+from config.crypto import Crypto
+from config.redis_config import get_redis, get_async_redis
+from util.log.log import Log
+from util.session.session_document import (
+    FIN_DOC_FIELD,
+    SessionItem,
+    decode_document,
+    decode_legacy_fields,
+    encode_document,
+    merge_items,
+    split_hash,
+    use_document_format
+)
+from util.session.session_snapshot import SessionSnapshotService
+
+logger = Log.get_logger()
+
+SESSION_TTL = 24 * 60 * 60  # 24시간
+
+
+class SessionWriter:
+    """
+    세션 해시 일괄 저장 (Singleton)
+
+    항목마다 HSET + HGET(확인)을 반복하지 않고
+    HSET mapping + EXPIRE + 버전 증가를 한 번의 왕복으로 처리한다.
+    """
+
+    __instance = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
+    @classmethod
+    def get_instance(cls):
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.redis_client = get_redis()
+            self.async_redis_client = get_async_redis()
+            self.crypto = Crypto.get_instance()
+            self.snapshot_service = SessionSnapshotService.get_instance()
+            self.initialized = True
+
+    def _encrypt_items(self, items: List[SessionItem]) -> Dict[str, str]:
+        """[(문서타입, 항목명, 값)] → {enc("문서타입:항목명"): enc(값)}"""
+        plain = []
+        for doc_type, field_name, value in items:
+            plain.append(f"{doc_type}:{field_name}")
+            plain.append(value)
+        encrypted = self.crypto.enc_many(plain)
+        return dict(zip(encrypted[0::2], encrypted[1::2]))
+
+    def _queue_write(self, pipe, session_id: str, mapping: Dict[str, str], ttl: int):
+        if mapping:
+            pipe.hset(session_id, mapping=mapping)
+        pipe.expire(session_id, ttl)
+        if mapping:
+            self.snapshot_service.queue_version_bump(pipe, session_id)
+
+    def _merge_document(self, raw: dict, new_items: List[SessionItem]):
+        """현재 해시 + 새 항목 → (병합된 항목, 삭제할 기존 포맷 필드)"""
+        document, legacy = split_hash(raw)
+        legacy_items, failed = decode_legacy_fields(legacy)
+        if failed:
+            logger.warning(f"[SESSION] Dropping {failed} undecryptable legacy fields")
+
+        document_items: List[SessionItem] = []
+        if document is not None:
+            try:
+                document_items = decode_document(document)
+            except Exception as e:
+                logger.warning(f"[SESSION] FIN_DOC decode failed, rewriting: {str(e)}")
+
+        return merge_items(document_items, legacy_items, new_items), list(legacy)
+
+    def _queue_document_write(self, pipe, session_id: str, items: List[SessionItem], legacy_fields: List[str], ttl: int):
+        pipe.hset(session_id, FIN_DOC_FIELD, encode_document(items))
+        if legacy_fields:
+            pipe.hdel(session_id, *legacy_fields)
+        pipe.expire(session_id, ttl)
+        self.snapshot_service.queue_version_bump(pipe, session_id)
+
+    @staticmethod
+    def _to_items(documents: Sequence[Tuple[str, Dict[str, str]]]) -> List[SessionItem]:
+        """[(문서타입, {항목명: 값})] → 항목 목록 (같은 문서타입:항목명은 뒤의 값 사용)"""
+        return merge_items(*(
+            [(doc_type, field_name, value) for field_name, value in fields.items()]
+            for doc_type, fields in documents
+        ))
+
+    def write_fields(self, session_id: str, doc_type: str, fields: Dict[str, str], ttl: int = SESSION_TTL) -> int:
+        """
+        세션 해시에 항목 일괄 저장 (동기)
+
+        Args:
+            session_id: 세션 ID
+            doc_type: 문서 타입 (예: "소득", "지출")
+            fields: {항목명: 값}
+            ttl: 세션 만료 시간 (초)
+
+        Returns:
+            저장된 항목 수
+        """
+        return self.write_documents(session_id, [(doc_type, fields)], ttl)
+
+    async def write_fields_async(
+        self, session_id: str, doc_type: str, fields: Dict[str, str], ttl: int = SESSION_TTL
+    ) -> int:
+        """세션 해시에 항목 일괄 저장 (비동기, 이벤트 루프 비차단)"""
+        return await self.write_documents_async(session_id, [(doc_type, fields)], ttl)
+
+    def write_documents(
+        self, session_id: str, documents: Sequence[Tuple[str, Dict[str, str]]], ttl: int = SESSION_TTL
+    ) -> int:
+        """
+        여러 문서의 항목을 한 번에 저장 (동기)
+
+        Args:
+            session_id: 세션 ID
+            documents: [(문서 타입, {항목명: 값})]
+            ttl: 세션 만료 시간 (초)
+
+        Returns:
+            저장된 항목 수
+        """
+        items = self._to_items(documents)
+        if items and use_document_format():
+            def merge_and_write(pipe):
+                merged, legacy_fields = self._merge_document(pipe.hgetall(session_id), items)
+                pipe.multi()
+                self._queue_document_write(pipe, session_id, merged, legacy_fields, ttl)
+
+            self.redis_client.transaction(merge_and_write, session_id)
+        else:
+            mapping = self._encrypt_items(items)
+            with self.redis_client.pipeline(transaction=True) as pipe:
+                self._queue_write(pipe, session_id, mapping, ttl)
+                pipe.execute()
+
+        self.snapshot_service.forget(session_id)
+        logger.info(f"[SESSION] Saved {len(items)} fields in one pipeline")
+        return len(items)
+
+    async def write_documents_async(
+        self, session_id: str, documents: Sequence[Tuple[str, Dict[str, str]]], ttl: int = SESSION_TTL
+    ) -> int:
+        """
+        여러 문서의 항목을 한 번에 저장 (비동기, 이벤트 루프 비차단)
+
+        Args:
+            session_id: 세션 ID
+            documents: [(문서 타입, {항목명: 값})]
+            ttl: 세션 만료 시간 (초)
+
+        Returns:
+            저장된 항목 수
+        """
+        items = self._to_items(documents)
+        if items and use_document_format():
+            async def merge_and_write(pipe):
+                merged, legacy_fields = self._merge_document(await pipe.hgetall(session_id), items)
+                pipe.multi()
+                self._queue_document_write(pipe, session_id, merged, legacy_fields, ttl)
+
+            await self.async_redis_client.transaction(merge_and_write, session_id)
+        else:
+            mapping = self._encrypt_items(items)
+            async with self.async_redis_client.pipeline(transaction=True) as pipe:
+                self._queue_write(pipe, session_id, mapping, ttl)
+                await pipe.execute()
+
+        self.snapshot_service.forget(session_id)
+        logger.info(f"[SESSION] Saved {len(items)} fields in one pipeline")
+        return len(items)